@@ -1,18 +1,22 @@
 ### ams_core.py
 
 import json
-from typing import Dict, Any
-from samurai_bluebird_custos.symbolic.recursive_memory_lattice import ResonanceLattice
+from typing import Dict, Any, List
+from samurai_bluebird_custos.symbolic.lattice_registry import get_shared_lattice, RESONANCE_LATTICE_FILE
 from samurai_bluebird_custos.ethics.pillars import SocioEmotionalFilter
-from samurai_bluebird_custos.core.resonance_logger import log_all
+from samurai_bluebird_custos.core.resonance_logger import log_all, LOG_DIR
+from samurai_bluebird_custos.utils.metrics import METRICS, span
 
 class AMSCore:
-    def __init__(self):
-        self.lattice = ResonanceLattice("memory/resonance_lattice.json")
+    def __init__(self, lattice=None, log_dir: str = LOG_DIR):
+        # Replay workers and tenants pass their own lattice; everyone else shares the resonance lattice
+        self.lattice = lattice or get_shared_lattice(RESONANCE_LATTICE_FILE, persistence="wal")
+        self.log_dir = log_dir
         self.socio_emotional_filter = SocioEmotionalFilter()
 
     def process_batch(self, enriched_batch: Dict[str, Any]) -> Dict[str, Any]:
         print("⚡ AMSCore: Processing enriched symbolic batch...")
+        self.lattice.refresh_if_changed()
 
         # Step 1: Inductive reasoning
         meaning_map = enriched_batch.get("meaning_map", {})
@@ -24,20 +28,56 @@ class AMSCore:
         print("🧠 Deductive reasoning completed.")
 
         # Step 3: Apply socio-emotional filtering
-        filtered_output = self.socio_emotional_filter.apply(enriched_batch)
+        with span("ams.filter"):
+            filtered_output = self.socio_emotional_filter.apply(enriched_batch)
         print("🌱 Socio-emotional filter applied.")
 
-        # Step 4: Save updated lattice
+        # Step 4: Save updated lattice (deferred when a durability policy coalesces writes)
         self.lattice.save()
-        print("💾 Resonance lattice saved.")
+        print("💾 Resonance lattice save requested.")
 
         # Step 5: Log results
+        self._log_results([filtered_output], [meaning_map])
+
+        METRICS.inc("ams_batches_total")
+        return filtered_output
+
+    def process_many(self, enriched_batches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Micro-batch form of `process_batch`: lattice updates for every batch are folded in
+        memory, the socio-emotional filter runs over the list in one pass, and the window
+        costs one save request and one log write.
+        """
+        if not enriched_batches:
+            return []
+        print(f"⚡ AMSCore: Processing {len(enriched_batches)} enriched symbolic batches...")
+        self.lattice.refresh_if_changed()
+
+        meaning_maps = [batch.get("meaning_map", {}) for batch in enriched_batches]
+        self.lattice.fold_updates(meaning_maps)
+        print("🔄 Inductive and deductive reasoning completed.")
+
+        with span("ams.filter"):
+            filtered_outputs = self.socio_emotional_filter.apply_many(enriched_batches)
+        print("🌱 Socio-emotional filter applied.")
+
+        self.lattice.save()
+        print("💾 Resonance lattice save requested.")
+
+        self._log_results(filtered_outputs, meaning_maps)
+
+        METRICS.inc("ams_batches_total", len(enriched_batches))
+        return filtered_outputs
+
+    def _log_results(self, filtered_outputs: List[Dict[str, Any]], meaning_maps: List[Dict[str, Any]]):
+        """
+        Append one compact JSON line per batch to the input resonance log, in one write.
+        """
         try:
-            log_all(json.dumps({
+            log_all("\n".join(json.dumps({
                 "filtered_output": filtered_output,
                 "resonance_keys": list(meaning_map.keys())
-            }, indent=2), "input_resonance_log.txt")
+            }) for filtered_output, meaning_map in zip(filtered_outputs, meaning_maps)), "input_resonance_log.txt",
+                self.log_dir)
         except Exception as e:
             print(f"❌ Failed to write log: {e}")
-
-        return filtered_output
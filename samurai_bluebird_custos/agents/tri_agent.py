@@ -1,11 +1,13 @@
 ### tri_agent.py
 
-from samurai_bluebird_custos.symbolic.recursive_memory_lattice import RecursiveSymbolicMemoryLattice
+from samurai_bluebird_custos.symbolic.lattice_registry import get_shared_lattice, RECURSIVE_MEMORY_FILE
+from samurai_bluebird_custos.utils.metrics import span
 
 # Simulated Tri-Agent cognitive lenses
 class TriAgent:
-    def __init__(self):
-        self.memory = RecursiveSymbolicMemoryLattice("memory/recursive_symbolic_memory.json")
+    def __init__(self, memory=None):
+        # Tenants pass their own recursive memory; everyone else shares the default one
+        self.memory = memory or get_shared_lattice(RECURSIVE_MEMORY_FILE)
 
     def reason_over_batch(self, snapshot):
         """
@@ -13,15 +15,21 @@ class TriAgent:
         Keeps language grounded and companion-like while still surfacing growth signals.
         Returns a narrative + symbolic hooks suitable for AMS integration.
         """
-        memory_state = self.memory.fetch_recent_symbols()
+        with span("tri_agent.memory"):
+            self.memory.refresh_if_changed()
+            memory_state = self.memory.fetch_recent_symbols()
 
         # Phase 1: Lens-based analysis
-        logic_analysis = self.logic_lens(snapshot, memory_state)
-        emotion_analysis = self.emotion_lens(snapshot, memory_state)
-        narrative_analysis = self.narrative_lens(snapshot, memory_state)
+        with span("tri_agent.lens", lens="logic"):
+            logic_analysis = self.logic_lens(snapshot, memory_state)
+        with span("tri_agent.lens", lens="emotion"):
+            emotion_analysis = self.emotion_lens(snapshot, memory_state)
+        with span("tri_agent.lens", lens="narrative"):
+            narrative_analysis = self.narrative_lens(snapshot, memory_state)
 
         # Phase 2: Integrate lenses into unified interpretation
-        narrative = self.integrate_lenses(logic_analysis, emotion_analysis, narrative_analysis)
+        with span("tri_agent.lens", lens="integrate"):
+            narrative = self.integrate_lenses(logic_analysis, emotion_analysis, narrative_analysis)
 
         raw_enriched = {
             "tags": list(
@@ -0,0 +1,267 @@
+# samurai_bluebird_custos/benchmarks/bench_suite.py
+
+"""
+Benchmark suite – synthetic lattices and snapshot streams at increasing scale.
+
+    python -m samurai_bluebird_custos.benchmarks.bench_suite --scales 1000 10000 100000
+    python -m samurai_bluebird_custos.benchmarks.bench_suite --save-baseline
+    python -m samurai_bluebird_custos.benchmarks.bench_suite --baseline benchmarks/baseline.json
+
+Every benchmark passes explicit scratch-directory paths for its lattices and logs, so no
+repo lattice or log is touched and the working directory is never changed.
+Results are written as JSON; with a baseline, any benchmark whose median is more than
+`--tolerance` slower is reported as a regression and the run exits non-zero.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from samurai_bluebird_custos.agents.ams_core import AMSCore
+from samurai_bluebird_custos.agents.tri_agent import TriAgent
+from samurai_bluebird_custos.core.main_loop import MainLoop
+from samurai_bluebird_custos.ethics.pillars import SocioEmotionalFilter
+from samurai_bluebird_custos.frameworks.chakra_mapping import ChakraMap
+from samurai_bluebird_custos.frameworks.sovereignties import Sovereignties
+from samurai_bluebird_custos.symbolic.lattice_durability import DurabilityPolicy
+from samurai_bluebird_custos.symbolic.recursive_memory_lattice import RecursiveSymbolicMemoryLattice, ResonanceLattice
+
+DEFAULT_SCALES = [1_000, 10_000, 100_000]
+DEFAULT_RESULTS_FILE = "benchmarks/results.json"
+DEFAULT_BASELINE_FILE = "benchmarks/baseline.json"
+
+TAGS = ["Focus", "Trust", "Innovation", "Compassion", "Courage", "Clarity", "Growth", "Calm",
+        "Collaboration", "Resilience", "Curiosity", "Patience", "Vision", "Balance", "Joy", "Wisdom"]
+WINDOWS = ["VSCode - Samurai Bluebird", "Terminal", "Notion", "Chrome - Docs", "Slack", "PyCharm"]
+
+
+def synthetic_lattice(nodes: int, hooks_per_node: int = 4, categories: int = 16, seed: int = 7) -> Dict[str, Any]:
+    """
+    `{category: {neuron_id: node}}` with `nodes` nodes spread over `categories` categories,
+    hooks drawn from a vocabulary that grows with the lattice, and spread-out update times.
+    """
+    rng = random.Random(seed)
+    vocabulary = [f"{tag} {n}" for n in range(max(nodes // 50, 1)) for tag in TAGS]
+    now = time.time()
+    lattice: Dict[str, Dict[str, Any]] = {f"Category{c:02d}": {} for c in range(categories)}
+    for n in range(nodes):
+        updated_at = now - rng.uniform(0, 30 * 86400)
+        lattice[f"Category{n % categories:02d}"][f"Neuron{n:07d}"] = {
+            "valence": rng.choice(["positive", "neutral", "negative"]),
+            "familiarity": round(rng.random(), 3),
+            "novelty": round(rng.random(), 3),
+            "narrative_hooks": rng.sample(vocabulary, min(hooks_per_node, len(vocabulary))),
+            "planetary_metadata": {},
+            "last_updated": datetime.fromtimestamp(updated_at).strftime("%Y-%m-%d %H:%M:%S"),
+            "updated_at": round(updated_at, 3),
+        }
+    return lattice
+
+
+def synthetic_snapshots(count: int, seed: int = 11) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    snapshots = []
+    for n in range(count):
+        tags = rng.sample(TAGS, 3)
+        snapshots.append({
+            "active_window": rng.choice(WINDOWS),
+            "keystroke_burst": rng.randint(0, 50),
+            "cpu_usage": round(rng.uniform(1, 90), 1),
+            "memory_usage": round(rng.uniform(20, 80), 1),
+            "tags": tags,
+            "weights": {tag: round(rng.uniform(0.8, 1.4), 2) for tag in tags},
+            "timestamp": f"2025-07-14 {9 + n // 3600 % 12:02d}:{n // 60 % 60:02d}:{n % 60:02d}",
+        })
+    return snapshots
+
+
+def enriched(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The `raw_enriched` shape BlueBox frameworks receive from TriAgent.
+    """
+    return {
+        "tags": [tag.lower() for tag in snapshot["tags"]],
+        "emotional_tone": "uplifted",
+        "resonance_score": 0.7,
+        "weights": snapshot["weights"],
+    }
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, inner: int = 1) -> Dict[str, Any]:
+    """
+    Run `func` `inner` times per sample for `repeat` samples; report per-call milliseconds.
+    """
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(inner):
+            func()
+        samples.append((time.perf_counter() - started) / inner * 1000)
+    return {
+        "p50_ms": round(statistics.median(samples), 4),
+        "min_ms": round(min(samples), 4),
+        "max_ms": round(max(samples), 4),
+        "calls": repeat * inner,
+    }
+
+
+def bench_lattice(scale: int, hooks_per_node: int, workdir: str) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    path = os.path.join(workdir, f"lattice_{scale}.json")
+    with open(path, "w") as f:
+        json.dump(synthetic_lattice(scale, hooks_per_node), f)
+    repeat = 3 if scale >= 100_000 else 5
+
+    results["lattice.load"] = measure(lambda: ResonanceLattice(path, persistence="wal"), repeat)
+    lattice = ResonanceLattice(path, persistence="wal")
+    lattice.set_durability(DurabilityPolicy.manual())
+
+    results["lattice.index_build"] = measure(lambda: (setattr(lattice, "_index", None), lattice.index), repeat)
+    results["lattice.fetch_recent_symbols"] = measure(lattice.fetch_recent_symbols, repeat, inner=20)
+    results["lattice.get_daily_reflection"] = measure(lattice.get_daily_reflection, repeat)
+
+    def incremental_save():
+        lattice.update_lattice_from_batch({"Category00": {"Neuron0000000": {"narrative_hooks": ["Focus 0"]}}})
+        lattice.flush()
+
+    results["lattice.save_incremental"] = measure(incremental_save, repeat, inner=10)
+    results["lattice.save_full"] = measure(lattice.compact, repeat)
+    lattice.close()
+    return {f"{name}[n={scale},hooks={hooks_per_node}]": value for name, value in results.items()}
+
+
+def bench_frameworks(snapshots: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    chakra = ChakraMap()
+    sovereignty = Sovereignties()
+    socio_filter = SocioEmotionalFilter()
+    inputs = [enriched(snapshot) for snapshot in snapshots]
+    cycle = iter(range(10 ** 12))
+
+    def each(func):
+        return lambda: func(inputs[next(cycle) % len(inputs)])
+
+    return {
+        "frameworks.chakra_map_input": measure(each(chakra.map_input), inner=len(inputs)),
+        "frameworks.route_affect_to_constellation": measure(
+            each(lambda meta: sovereignty.route_affect_to_constellation(meta["tags"], meta["weights"])),
+            inner=len(inputs)),
+        "ethics.socio_emotional_filter_apply": measure(each(socio_filter.apply), inner=len(inputs)),
+    }
+
+
+def bench_pipeline(snapshots: List[Dict[str, Any]], workdir: str) -> Dict[str, Dict[str, Any]]:
+    lattice = ResonanceLattice(os.path.join(workdir, "pipeline_lattice.json"), persistence="wal")
+    lattice.set_durability(DurabilityPolicy(every_mutations=100))
+    memory = RecursiveSymbolicMemoryLattice(os.path.join(workdir, "pipeline_memory.json"))
+    log_dir = os.path.join(workdir, "logs")
+    loop = MainLoop(TriAgent(memory=memory), ams_core=AMSCore(lattice=lattice, log_dir=log_dir), log_dir=log_dir)
+    results = {}
+
+    started = time.perf_counter()
+    for snapshot in snapshots:
+        loop.process(snapshot)
+    sequential = time.perf_counter() - started
+    results["pipeline.sequential"] = {"snapshots_per_second": round(len(snapshots) / sequential, 2),
+                                      "p50_ms": round(sequential / len(snapshots) * 1000, 4)}
+
+    started = time.perf_counter()
+    loop.run_pipeline(snapshots)
+    pipelined = time.perf_counter() - started
+    results["pipeline.staged"] = {"snapshots_per_second": round(len(snapshots) / pipelined, 2),
+                                  "p50_ms": round(pipelined / len(snapshots) * 1000, 4)}
+    lattice.close()
+    return results
+
+
+def run_suite(scales: List[int], hook_counts: List[int], stream_size: int = 500) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Any]] = {}
+    snapshots = synthetic_snapshots(stream_size)
+    with tempfile.TemporaryDirectory(prefix="bluebird-bench-") as workdir:
+        for scale in scales:
+            for hooks in hook_counts:
+                print(f"⏱️ Lattice benchmarks: {scale} nodes, {hooks} hooks/node...", file=sys.stderr)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results.update(bench_lattice(scale, hooks, workdir))
+        print(f"⏱️ Framework and pipeline benchmarks: {stream_size} snapshots...", file=sys.stderr)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results.update(bench_frameworks(snapshots))
+            results.update(bench_pipeline(snapshots, workdir))
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scales": scales,
+            "hook_counts": hook_counts,
+            "stream_size": stream_size,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25) -> List[str]:
+    """
+    Names of benchmarks whose median slowed by more than `tolerance` against the baseline.
+    """
+    regressions = []
+    for name, result in sorted(current["results"].items()):
+        reference = baseline.get("results", {}).get(name)
+        if not reference or not reference.get("p50_ms"):
+            continue
+        ratio = result["p50_ms"] / reference["p50_ms"]
+        flag = "❌" if ratio > 1 + tolerance else "✅"
+        print(f"{flag} {name}: {result['p50_ms']:.3f} ms vs {reference['p50_ms']:.3f} ms ({ratio:.2f}x)")
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def _write_json(path: str, data: Dict[str, Any]):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Samurai Bluebird benchmark suite")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="lattice sizes in nodes (up to 1000000)")
+    parser.add_argument("--hooks", type=int, nargs="+", default=[4, 16], help="narrative hooks per node")
+    parser.add_argument("--stream", type=int, default=500, help="snapshots in the synthetic stream")
+    parser.add_argument("--output", default=DEFAULT_RESULTS_FILE)
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--save-baseline", action="store_true", help=f"also write {DEFAULT_BASELINE_FILE}")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before flagging (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.scales, args.hooks, args.stream)
+    _write_json(args.output, report)
+    print(f"💾 Benchmark results written to {args.output}")
+    if args.save_baseline:
+        _write_json(DEFAULT_BASELINE_FILE, report)
+        print(f"💾 Baseline saved to {DEFAULT_BASELINE_FILE}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} benchmark(s) regressed beyond {args.tolerance:.0%}.")
+            return 1
+        print("✅ No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# samurai_bluebird_custos/core/async_kernel.py
+
+import asyncio
+import signal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Set
+
+from samurai_bluebird_custos.core.kernel import Kernel, install_shutdown_handler
+from samurai_bluebird_custos.utils.metrics import METRICS
+
+
+class TickStats:
+    """
+    Scheduling health of a kernel run.
+    - ticks: ticks that started a capture.
+    - missed_deadlines: ticks skipped because the loop woke too late or the pipeline was full.
+    - skew: how late each started tick woke relative to its deadline.
+    - overlapped: captures that ran while an earlier snapshot was still being processed.
+    """
+
+    def __init__(self):
+        self.ticks = 0
+        self.missed_deadlines = 0
+        self.overlapped = 0
+        self.errors = 0
+        self.total_skew = 0.0
+        self.max_skew = 0.0
+
+    def record_tick(self, skew: float):
+        self.ticks += 1
+        self.total_skew += skew
+        self.max_skew = max(self.max_skew, skew)
+
+    @property
+    def mean_skew(self) -> float:
+        return self.total_skew / self.ticks if self.ticks else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "ticks": self.ticks,
+            "missed_deadlines": self.missed_deadlines,
+            "overlapped": self.overlapped,
+            "errors": self.errors,
+            "mean_skew_ms": round(self.mean_skew * 1000, 3),
+            "max_skew_ms": round(self.max_skew * 1000, 3),
+        }
+
+    def __str__(self) -> str:
+        return (f"{self.ticks} tick(s), {self.missed_deadlines} missed deadline(s), "
+                f"skew avg {self.mean_skew * 1000:.1f} ms / max {self.max_skew * 1000:.1f} ms, "
+                f"{self.overlapped} overlapped capture(s), {self.errors} error(s)")
+
+
+class TickScheduler:
+    """
+    Drift-free tick loop. Tick N is due at `start + N * interval` on the event loop's
+    monotonic clock, so capture and processing time never push later ticks back.
+    Capture and processing each run on their own single-thread executor: capture for
+    tick N+1 overlaps processing of tick N, while snapshots are still processed in
+    order. At most `max_in_flight` ticks are outstanding; a deadline that arrives while
+    the pipeline is full, or that the loop slept through, is counted as missed.
+    """
+
+    def __init__(self, capture: Callable[[], Any], process: Callable[[Any], Any],
+                 interval_seconds: float, max_in_flight: int = 2):
+        self.capture = capture
+        self.process = process
+        self.interval_seconds = interval_seconds
+        self.max_in_flight = max(max_in_flight, 1)
+        self.stats = TickStats()
+        self._processing = 0
+
+    async def run(self, duration_seconds: float, stop: Optional[asyncio.Event] = None) -> TickStats:
+        loop = asyncio.get_running_loop()
+        stop = stop or asyncio.Event()
+        interval = self.interval_seconds
+        start = loop.time()
+        end = start + duration_seconds
+        in_flight: Set[asyncio.Task] = set()
+        tick = 0
+
+        with ThreadPoolExecutor(1, thread_name_prefix="KernelCapture") as capture_pool, \
+                ThreadPoolExecutor(1, thread_name_prefix="KernelProcess") as process_pool:
+            while not stop.is_set():
+                deadline = start + tick * interval
+                if deadline >= end:
+                    break
+                delay = deadline - loop.time()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(stop.wait(), delay)
+                        break
+                    except asyncio.TimeoutError:
+                        pass
+
+                skew = loop.time() - deadline
+                if skew >= interval:
+                    # Slept through whole periods: skip them rather than firing a burst
+                    skipped = int(skew // interval)
+                    self.stats.missed_deadlines += skipped
+                    METRICS.inc("kernel_missed_deadlines_total", skipped)
+                    tick += skipped
+                    skew -= skipped * interval
+                    if start + tick * interval >= end:
+                        break
+
+                if len(in_flight) >= self.max_in_flight:
+                    self.stats.missed_deadlines += 1
+                    METRICS.inc("kernel_missed_deadlines_total")
+                else:
+                    self.stats.record_tick(skew)
+                    METRICS.observe("kernel_tick_skew_seconds", skew)
+                    task = asyncio.ensure_future(self._run_tick(loop, capture_pool, process_pool))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+                tick += 1
+
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        return self.stats
+
+    async def _run_tick(self, loop, capture_pool, process_pool):
+        try:
+            if self._processing:
+                self.stats.overlapped += 1
+            snapshot = await loop.run_in_executor(capture_pool, self.capture)
+            self._processing += 1
+            try:
+                await loop.run_in_executor(process_pool, self.process, snapshot)
+            finally:
+                self._processing -= 1
+        except Exception as e:
+            self.stats.errors += 1
+            METRICS.inc("kernel_errors_total")
+            print(f"❌ Kernel error: {e}")
+
+
+class AsyncKernel(Kernel):
+    """
+    Kernel driven by an asyncio TickScheduler instead of capture/process/sleep.
+    """
+
+    async def run_async(self, runtime_minutes=30, interval_seconds=300, max_in_flight: int = 2) -> TickStats:
+        print("⚡ Kernel: Starting asynchronous Resonance Flow runtime...")
+        stop = asyncio.Event()
+        remove_handler = self._install_async_shutdown_handler(stop)
+        scheduler = TickScheduler(self.feathers.capture, self.process_snapshot, interval_seconds, max_in_flight)
+        try:
+            stats = await scheduler.run(runtime_minutes * 60, stop)
+        finally:
+            remove_handler()
+            self.ams_core.lattice.close()
+            if self.feathers.ocr_service:
+                self.feathers.ocr_service.close()
+            print("💾 Kernel: Resonance lattice flushed.")
+        print(f"⏱️ Kernel: {stats}.")
+        print("🛑 Kernel: Resonance Flow completed.")
+        return stats
+
+    def run(self, runtime_minutes=30, interval_seconds=300, max_in_flight: int = 2) -> TickStats:
+        return asyncio.run(self.run_async(runtime_minutes, interval_seconds, max_in_flight))
+
+    def _install_async_shutdown_handler(self, stop: asyncio.Event):
+        """
+        SIGTERM stops scheduling new ticks and lets in-flight ones finish. Event loops
+        without signal support (Windows) fall back to the synchronous handler.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGTERM, stop.set)
+            return lambda: loop.remove_signal_handler(signal.SIGTERM)
+        except (NotImplementedError, RuntimeError, ValueError):
+            previous = install_shutdown_handler("Kernel")
+            if previous is None:
+                return lambda: None
+            return lambda: signal.signal(signal.SIGTERM, previous)
+
+
+if __name__ == "__main__":
+    AsyncKernel().run(runtime_minutes=1, interval_seconds=10)
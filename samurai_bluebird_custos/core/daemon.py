@@ -0,0 +1,127 @@
+# samurai_bluebird_custos/core/daemon.py
+
+"""
+Resident snapshot service.
+Builds TriAgent, BlueBox and AMSCore once and keeps them warm, then processes
+snapshots sent as JSON lines on stdin or over a local Unix socket. Each snapshot gets
+one JSON line back: {"ok": true, "latency_ms": ..., "narrative": ..., "state": ...}
+or {"ok": false, "error": ...}.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from contextlib import redirect_stdout
+from typing import Any, Dict, Optional, TextIO
+
+from samurai_bluebird_custos.core.kernel import KERNEL_DURABILITY, install_shutdown_handler
+from samurai_bluebird_custos.core.main_loop import MainLoop
+from samurai_bluebird_custos.symbolic.lattice_durability import DurabilityPolicy
+
+
+class SnapshotDaemon:
+    def __init__(self, main_loop: Optional[MainLoop] = None, durability: Optional[DurabilityPolicy] = KERNEL_DURABILITY):
+        started = time.perf_counter()
+        self.main_loop = main_loop or MainLoop()
+        if durability is not None:
+            self.main_loop.ams_core.lattice.set_durability(durability)
+        # The lattice and agent state are shared, so snapshots are handled one at a time
+        self._lock = threading.Lock()
+        self.processed = 0
+        print(f"🔥 Daemon: pipeline warm in {(time.perf_counter() - started) * 1000:.1f} ms.")
+
+    def handle_line(self, line: str) -> Optional[str]:
+        """
+        Process one JSONL request and return the JSON response line (None for blank lines).
+        """
+        line = line.strip()
+        if not line:
+            return None
+        started = time.perf_counter()
+        try:
+            snapshot = json.loads(line)
+            if not isinstance(snapshot, dict):
+                raise ValueError("snapshot must be a JSON object")
+            with self._lock:
+                context = self.main_loop.process(snapshot)
+                self.processed += 1
+            response: Dict[str, Any] = {
+                "ok": True,
+                "narrative": context["tri_output"]["narrative"],
+                "state": context["updated_state"],
+            }
+        except Exception as e:
+            print(f"❌ Daemon error: {e}")
+            response = {"ok": False, "error": str(e)}
+        response["latency_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        return json.dumps(response, default=str)
+
+    def serve_stream(self, source: Optional[TextIO] = None, sink: Optional[TextIO] = None):
+        """
+        Serve JSONL snapshots from `source` (stdin) until EOF, answering on `sink` (stdout).
+        Progress prints are sent to stderr so the response stream stays pure JSONL.
+        SIGTERM unwinds through `close`, so deferred lattice writes are flushed.
+        """
+        source = source or sys.stdin
+        sink = sink or sys.stdout
+        print("📡 Daemon: reading snapshots from stdin.", file=sys.stderr)
+        previous_sigterm = install_shutdown_handler("Daemon")
+        try:
+            for line in source:
+                with redirect_stdout(sys.stderr):
+                    response = self.handle_line(line)
+                if response is not None:
+                    sink.write(response + "\n")
+                    sink.flush()
+        finally:
+            with redirect_stdout(sys.stderr):
+                self.close()
+            if previous_sigterm is not None:
+                signal.signal(signal.SIGTERM, previous_sigterm)
+
+    def serve_unix_socket(self, path: str):
+        """
+        Serve JSONL snapshots from any number of clients on a Unix socket until interrupted
+        or terminated; either way the lattice is flushed on the way out.
+        """
+        server = self.make_unix_server(path)
+        print(f"📡 Daemon: listening on {path}.")
+        previous_sigterm = install_shutdown_handler("Daemon")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if os.path.exists(path):
+                os.remove(path)
+            self.close()
+            if previous_sigterm is not None:
+                signal.signal(signal.SIGTERM, previous_sigterm)
+
+    def make_unix_server(self, path: str) -> socketserver.BaseServer:
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("Unix sockets are not available on this platform; use stdin mode")
+        if os.path.exists(path):
+            os.remove(path)
+        daemon = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw in self.rfile:
+                    response = daemon.handle_line(raw.decode("utf-8"))
+                    if response is not None:
+                        self.wfile.write(response.encode("utf-8") + b"\n")
+
+        server = socketserver.ThreadingUnixStreamServer(path, _Handler)
+        server.daemon_threads = True
+        return server
+
+    def close(self):
+        self.main_loop.ams_core.lattice.close()
+        print(f"🛑 Daemon: stopped after {self.processed} snapshot(s); resonance lattice flushed.", file=sys.stderr)
@@ -1,6 +1,43 @@
+import argparse
+import contextlib
+import json
+import signal
+import sys
+import threading
 import time
+from typing import Optional
 from samurai_bluebird_custos.agents.ams_core import AMSCore
+from samurai_bluebird_custos.core.resonance_logger import LOG_DIR
+from samurai_bluebird_custos.core.tenancy import TenantPaths, TenantPool, TENANT_DURABILITY, tenant_main_loop
 from samurai_bluebird_custos.io.passive_input_manager import PassiveInputManager
+from samurai_bluebird_custos.symbolic.lattice_compaction import CompactionPolicy, LatticeCompactor
+from samurai_bluebird_custos.symbolic.lattice_decay import DecayModel
+from samurai_bluebird_custos.symbolic.lattice_durability import DurabilityPolicy
+from samurai_bluebird_custos.symbolic.lattice_registry import get_shared_lattice
+from samurai_bluebird_custos.utils.config import METRICS_FILE
+from samurai_bluebird_custos.utils.metrics import METRICS, span
+
+# Kernel default: coalesce lattice writes instead of a full save on every snapshot
+KERNEL_DURABILITY = DurabilityPolicy(every_mutations=50, every_seconds=60)
+# Kernel default: cap and merge hooks as the lattice grows, at most ~50 ms per snapshot;
+# node eviction is opt-in from the CLI
+KERNEL_COMPACTION = CompactionPolicy(max_hooks_per_node=50, hook_similarity=0.9, slice_seconds=0.05)
+
+
+def install_shutdown_handler(owner: str = "Kernel"):
+    """
+    Turn SIGTERM into SystemExit so a serving loop unwinds through its lattice flush.
+    Ctrl+C already arrives as KeyboardInterrupt. Signal handlers can only be set
+    from the main thread, so other threads skip this and get None back; otherwise
+    the previous handler is returned for the caller to restore.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return None
+
+    def _terminate(signum, frame):
+        raise SystemExit(f"{owner} received signal {signum}")
+
+    return signal.signal(signal.SIGTERM, _terminate)
 
 
 def assemble_feather_input():
@@ -12,9 +49,26 @@ def assemble_feather_input():
     return manager.capture()
 
 class Kernel:
-    def __init__(self):
-        self.ams_core = AMSCore()
-        self.feathers = PassiveInputManager()
+    def __init__(self, durability: DurabilityPolicy = KERNEL_DURABILITY,
+                 compaction: Optional[CompactionPolicy] = KERNEL_COMPACTION,
+                 metrics_file: str = METRICS_FILE, tenant: Optional[str] = None,
+                 decay: Optional[DecayModel] = None):
+        self.metrics_file = metrics_file
+        self.tenant = TenantPaths(tenant).ensure() if tenant else None
+        if self.tenant:
+            # Everything this kernel writes lives under tenants/<tenant>/
+            lattice = get_shared_lattice(self.tenant.resonance_lattice_file, persistence="wal")
+            self.ams_core = AMSCore(lattice=lattice, log_dir=self.tenant.logs_dir)
+            if metrics_file == METRICS_FILE:
+                self.metrics_file = self.tenant.metrics_file
+        else:
+            self.ams_core = AMSCore()
+        self.feathers = PassiveInputManager(log_dir=self.tenant.logs_dir if self.tenant else LOG_DIR)
+        self.ams_core.lattice.set_durability(durability)
+        if decay is not None:
+            self.ams_core.lattice.decay = decay
+        # One compaction slice runs after each snapshot, so GC never stalls the loop
+        self.compactor = LatticeCompactor(self.ams_core.lattice, compaction) if compaction else None
 
     def run(self, runtime_minutes=30, interval_seconds=300):
         """
@@ -25,14 +79,161 @@ class Kernel:
         print("⚡ Kernel: Starting Resonance Flow runtime...")
         start_time = time.time()
         end_time = start_time + (runtime_minutes * 60)
+        previous_sigterm = install_shutdown_handler("Kernel")
 
-        while time.time() < end_time:
-            try:
-                snapshot = self.feathers.capture()
-                self.ams_core.process_batch(snapshot)
-                print(f"✅ Processed snapshot at {time.strftime('%Y-%m-%d %H:%M:%S')}")
-            except Exception as e:
-                print(f"❌ Kernel error: {e}")
-            time.sleep(interval_seconds)
+        try:
+            while time.time() < end_time:
+                try:
+                    self.process_snapshot(self.feathers.capture())
+                except Exception as e:
+                    METRICS.inc("kernel_errors_total")
+                    print(f"❌ Kernel error: {e}")
+                time.sleep(interval_seconds)
+        finally:
+            # Deferred lattice writes must land whether we finish, are interrupted or are terminated
+            self.ams_core.lattice.close()
+            if self.feathers.ocr_service:
+                self.feathers.ocr_service.close()
+            if previous_sigterm is not None:
+                signal.signal(signal.SIGTERM, previous_sigterm)
+            print("💾 Kernel: Resonance lattice flushed.")
 
         print("🛑 Kernel: Resonance Flow completed.")
+
+    def process_snapshot(self, snapshot: dict):
+        """
+        Run one captured snapshot through AMSCore, followed by a compaction slice.
+        """
+        with span("kernel.snapshot"):
+            self.ams_core.process_batch(snapshot)
+        METRICS.inc("kernel_snapshots_total")
+        print(f"✅ Processed snapshot at {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        if self.compactor:
+            with span("lattice.compaction"):
+                self.compactor.run_slice()
+        if self.metrics_file:
+            METRICS.write_file(self.metrics_file)
+
+
+
+def run_tenant_streams(source: str = "-", workers: Optional[int] = None, chunk_size: int = 16) -> dict:
+    """
+    Group `{"tenant": ..., "snapshot": ...}` JSON lines by tenant and process them on a TenantPool.
+    """
+    streams = {}
+    with (contextlib.nullcontext(sys.stdin) if source == "-" else open(source, "r")) as lines:
+        for line in lines:
+            if line.strip():
+                record = json.loads(line)
+                streams.setdefault(record["tenant"], []).append(record["snapshot"])
+    started = time.perf_counter()
+    with TenantPool(workers, durability=TENANT_DURABILITY) as pool:
+        totals = pool.process_streams(streams, chunk_size)
+    elapsed = time.perf_counter() - started
+    processed = sum(entry["processed"] for entry in totals.values())
+    print(f"🏘️ Tenants: {processed} snapshot(s) for {len(totals)} tenant(s) in {elapsed:.1f}s.")
+    return totals
+
+
+def main(argv=None):
+    """
+    `samurai-bluebird` console entry point.
+    """
+    parser = argparse.ArgumentParser(prog="samurai-bluebird", description="Samurai Bluebird Custos kernel")
+    parser.add_argument("--metrics-port", type=int, help="serve Prometheus text metrics on this local port")
+    parser.add_argument("--tenant", help="namespace memory, batches and logs under tenants/TENANT/")
+    parser.add_argument("--decay", action="store_true",
+                        help="run and daemon: fade familiarity and restore novelty with time since each node's update")
+    parser.add_argument("--familiarity-half-life", type=float, default=72.0, metavar="HOURS",
+                        help="familiarity half-life with --decay (default: 72)")
+    parser.add_argument("--novelty-half-life", type=float, default=24.0, metavar="HOURS",
+                        help="novelty half-life with --decay (default: 24)")
+    commands = parser.add_subparsers(dest="command")
+    run = commands.add_parser("run", help="capture and process snapshots on a timer (default)")
+    run.add_argument("--minutes", type=float, default=30, help="total runtime in minutes")
+    run.add_argument("--interval", type=float, default=300, help="seconds between snapshots")
+    run.add_argument("--sync", action="store_true", help="use the sequential kernel instead of the asyncio one")
+    run.add_argument("--no-compaction", action="store_true", help="never compact the lattice while running")
+    run.add_argument("--node-ttl-days", type=float, help="compaction: evict nodes not updated for this many days")
+    run.add_argument("--max-nodes", type=int, help="compaction: evict least recently updated nodes beyond this count")
+    daemon = commands.add_parser("daemon", help="keep the pipeline warm and process snapshots sent as JSON lines")
+    daemon.add_argument("--socket", help="Unix socket path to listen on (default: read stdin)")
+    replay = commands.add_parser("replay", help="replay saved batches for a date range through the pipeline")
+    replay.add_argument("start", help="first day, YYYY-MM-DD")
+    replay.add_argument("end", nargs="?", help="last day, YYYY-MM-DD (default: start)")
+    replay.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    tenants = commands.add_parser("tenants", help="process multi-tenant JSON lines across a process pool")
+    tenants.add_argument("input", nargs="?", default="-",
+                         help='JSONL file of {"tenant": ID, "snapshot": {...}} lines (default: stdin)')
+    tenants.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    tenants.add_argument("--chunk", type=int, default=16, help="snapshots per tenant micro-batch")
+    imports = commands.add_parser("imports", help="report the capability profile and cold import times")
+    imports.add_argument("modules", nargs="*", help="modules to time (default: kernel, daemon, krishna, io)")
+    imports.add_argument("--top", type=int, default=10, help="slowest imports to list per module")
+    parser.set_defaults(command="run", minutes=30, interval=300, sync=False,
+                        no_compaction=False, node_ttl_days=None, max_nodes=None)
+    args = parser.parse_args(argv)
+    if args.metrics_port:
+        METRICS.serve(args.metrics_port)
+    decay = DecayModel(args.familiarity_half_life, args.novelty_half_life) if args.decay else None
+
+    if args.command == "daemon":
+        # Imported here: the daemon module builds on this one
+        from samurai_bluebird_custos.core.daemon import SnapshotDaemon
+        from samurai_bluebird_custos.core.main_loop import MainLoop
+
+        def make_daemon():
+            main_loop = tenant_main_loop(TenantPaths(args.tenant)) if args.tenant else MainLoop()
+            if decay is not None:
+                main_loop.ams_core.lattice.decay = decay
+            return SnapshotDaemon(main_loop)
+
+        if args.socket:
+            make_daemon().serve_unix_socket(args.socket)
+            return
+        # stdout carries the JSONL responses, so startup chatter goes to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            service = make_daemon()
+        service.serve_stream()
+        return
+
+    if args.command == "replay":
+        from samurai_bluebird_custos.core.replay import replay as replay_batches
+        if args.tenant:
+            paths = TenantPaths(args.tenant).ensure()
+            lattice = get_shared_lattice(paths.resonance_lattice_file, persistence="wal")
+            replay_batches(args.start, args.end or args.start, paths.batches_dir, args.workers, lattice,
+                           log_dir=paths.logs_dir)
+        else:
+            replay_batches(args.start, args.end or args.start, workers=args.workers)
+        return
+
+    if args.command == "tenants":
+        run_tenant_streams(args.input, workers=args.workers, chunk_size=args.chunk)
+        return
+
+    if args.command == "imports":
+        from samurai_bluebird_custos.io.capabilities import capability_profile
+        from samurai_bluebird_custos.utils.import_report import import_report, print_report
+        profile = capability_profile()
+        print(f"🧭 Capability profile ({'headless' if profile.headless else 'desktop'}): {profile.as_dict()}")
+        print_report(import_report(args.modules, args.top))
+        return
+
+    compaction = None if args.no_compaction else CompactionPolicy(
+        node_ttl_seconds=args.node_ttl_days * 86400 if args.node_ttl_days else None,
+        max_hooks_per_node=KERNEL_COMPACTION.max_hooks_per_node,
+        hook_similarity=KERNEL_COMPACTION.hook_similarity,
+        max_nodes=args.max_nodes,
+        slice_seconds=KERNEL_COMPACTION.slice_seconds,
+    )
+    if args.sync:
+        kernel = Kernel(compaction=compaction, tenant=args.tenant, decay=decay)
+    else:
+        from samurai_bluebird_custos.core.async_kernel import AsyncKernel
+        kernel = AsyncKernel(compaction=compaction, tenant=args.tenant, decay=decay)
+    kernel.run(runtime_minutes=args.minutes, interval_seconds=args.interval)
+
+
+if __name__ == "__main__":
+    main()
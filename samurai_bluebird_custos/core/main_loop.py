@@ -1,39 +1,116 @@
 ### main_loop.py
 
-from ..feathers import capture_snapshot
-from ..agents.tri_agent import TriAgent
-from ..frameworks.blue_box import BlueBox
-from ..core.ams_core import AMSCore
-from ..core.resonance_logger import write_output_logs, verify_and_log
+from typing import Any, Dict, Iterable, List, Optional
 
+from samurai_bluebird_custos.io.passive_input_manager import PassiveInputManager
+from samurai_bluebird_custos.agents.tri_agent import TriAgent
+from samurai_bluebird_custos.frameworks.blue_box import BlueBox
+from samurai_bluebird_custos.agents.ams_core import AMSCore
+from samurai_bluebird_custos.core.pipeline import Pipeline, Stage
+from samurai_bluebird_custos.core.resonance_logger import write_output_logs, verify_and_log, LOG_DIR
 
-def main():
-    # Step 1: Capture passive input snapshot
-    snapshot = capture_snapshot()
+
+def merge_snapshots(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fold a newer capture into one still waiting for reasoning: the newest readings win,
+    keystroke bursts add up, and `merged_snapshots` counts how many captures it covers.
+    """
+    merged = {**older, **newer}
+    merged["keystroke_burst"] = older.get("keystroke_burst", 0) + newer.get("keystroke_burst", 0)
+    merged["merged_snapshots"] = older.get("merged_snapshots", 1) + newer.get("merged_snapshots", 1)
+    return merged
+
+
+class MainLoop:
+    """
+    The capture → Tri-Agent → BlueBox → AMSCore → logs flow, one method per stage.
+    Each method takes and returns a per-snapshot context dict.
+    """
+
+    def __init__(self, tri_agent: Optional[TriAgent] = None, bluebox: Optional[BlueBox] = None,
+                 ams_core: Optional[AMSCore] = None, log_dir: str = LOG_DIR):
+        self.tri_agent = tri_agent or TriAgent()
+        self.bluebox = bluebox or BlueBox()
+        self.ams_core = ams_core or AMSCore(log_dir=log_dir)
+        self.log_dir = log_dir
 
     # Step 2: Run Tri-Agent to extract narrative and symbolic hooks
-    tri_agent = TriAgent()
-    tri_output = tri_agent.reason_over_batch(snapshot)
-    narrative = tri_output["narrative"]
-    enriched_data = tri_output["raw_enriched"]
+    def reason(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        tri_output = self.tri_agent.reason_over_batch(snapshot)
+        return {"snapshot": snapshot, "tri_output": tri_output}
 
     # Step 3: Run BlueBox frameworks to generate symbolic meaning map
-    bluebox = BlueBox()
-    meaning_map = bluebox.process(narrative)
+    def frameworks(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        context["meaning_map"] = self.bluebox.process(context["tri_output"])["meaning_map"]
+        return context
 
     # Step 4: Run AMSCore with full enriched batch
-    full_batch = {
-        "snapshot": snapshot,
-        "narrative": narrative,
-        "symbolic": enriched_data,
-        "meaning_map": meaning_map
-    }
-    ams_core = AMSCore()
-    updated_state = ams_core.process_batch(full_batch)
+    def ams(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        context["updated_state"] = self.ams_core.process_batch(self._full_batch(context))
+        return context
+
+    def ams_many(self, contexts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Step 4 for a window of snapshots: one AMSCore micro-batch, one lattice save.
+        """
+        states = self.ams_core.process_many([self._full_batch(context) for context in contexts])
+        for context, state in zip(contexts, states):
+            context["updated_state"] = state
+        return contexts
+
+    @staticmethod
+    def _full_batch(context: Dict[str, Any]) -> Dict[str, Any]:
+        tri_output = context["tri_output"]
+        return {
+            "snapshot": context["snapshot"],
+            "narrative": tri_output["narrative"],
+            "symbolic": tri_output["raw_enriched"],
+            "meaning_map": context["meaning_map"]
+        }
 
     # Step 5: Log outputs
-    write_output_logs(narrative, enriched_data, meaning_map)
-    verify_and_log(updated_state)
+    def log(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        tri_output = context["tri_output"]
+        write_output_logs(tri_output["narrative"], tri_output["raw_enriched"], context["meaning_map"], self.log_dir)
+        verify_and_log(context["updated_state"], self.log_dir)
+        return context
+
+    def process(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one snapshot through every stage in turn.
+        """
+        return self.log(self.ams(self.frameworks(self.reason(snapshot))))
+
+    def build_pipeline(self, queue_size: int = 8, backpressure: str = "block",
+                       reason_workers: int = 2, framework_workers: int = 2, on_result=None) -> Pipeline:
+        """
+        Pipelined version of `process`. Reasoning and framework mapping run in parallel
+        workers and their results are resequenced, so the single-worker lattice update and
+        logging stages see snapshots in submission order.
+        `backpressure` applies to the reasoning stage that captures are submitted to
+        ("merge" folds waiting captures together with `merge_snapshots`).
+        """
+        return Pipeline([
+            Stage("reason", self.reason, reason_workers, queue_size, backpressure, merge=merge_snapshots),
+            Stage("frameworks", self.frameworks, framework_workers, queue_size),
+            Stage("ams", self.ams, 1, queue_size),
+            Stage("log", self.log, 1, queue_size),
+        ], on_result=on_result)
+
+    def run_pipeline(self, snapshots: Iterable[Dict[str, Any]], **options: Any) -> Dict[str, Dict[str, Any]]:
+        stats = self.build_pipeline(**options).run(snapshots)
+        print(f"📊 Pipeline stage stats: {stats}")
+        return stats
+
+
+def main(snapshot_count: int = 1):
+    # Step 1: Capture passive input snapshot(s)
+    feathers = PassiveInputManager()
+    loop = MainLoop()
+    if snapshot_count <= 1:
+        loop.process(feathers.capture())
+        return
+    loop.run_pipeline(feathers.capture() for _ in range(snapshot_count))
 
 
 if __name__ == "__main__":
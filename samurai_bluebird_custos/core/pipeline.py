@@ -0,0 +1,260 @@
+# samurai_bluebird_custos/core/pipeline.py
+
+"""
+Pipeline – staged execution for the capture → reason → frameworks → AMS → log flow.
+Each stage has its own bounded input queue and worker pool, so stages work on different
+snapshots at the same time and throughput is set by the slowest stage rather than the
+sum of all of them. Every stage releases its results in the order it took their inputs,
+even with several workers, so downstream stages see snapshots in submission order.
+A full queue applies the stage's backpressure policy:
+- "block": the producer waits for room.
+- "drop_oldest": the oldest queued item is discarded to make room.
+- "merge": the new item is folded into the newest queued item with `merge(old, new)`.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from samurai_bluebird_custos.utils.metrics import METRICS
+
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "merge")
+
+_CLOSED = object()
+
+
+class StageStats:
+    def __init__(self):
+        self.processed = 0
+        self.dropped = 0
+        self.merged = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, **amounts: float):
+        with self._lock:
+            for name, amount in amounts.items():
+                setattr(self, name, getattr(self, name) + amount)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "merged": self.merged,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 4),
+            "blocked_seconds": round(self.blocked_seconds, 4),
+        }
+
+
+class StageQueue:
+    """
+    Bounded FIFO with a backpressure policy. `get` returns `_CLOSED` once the queue
+    is closed and drained; `take` also returns the item's ticket, its position in the
+    order items left the queue.
+    """
+
+    def __init__(self, maxsize: int, policy: str, stats: StageStats,
+                 merge: Optional[Callable[[Any, Any], Any]] = None):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        if policy == "merge" and merge is None:
+            raise ValueError("The merge backpressure policy needs a merge function")
+        self.maxsize = max(maxsize, 1)
+        self.policy = policy
+        self.merge = merge
+        self.stats = stats
+        self._items = deque()
+        self._taken = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def put(self, item: Any):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Stage queue is closed")
+            if len(self._items) >= self.maxsize:
+                if self.policy == "drop_oldest":
+                    self._items.popleft()
+                    self.stats.add(dropped=1)
+                elif self.policy == "merge":
+                    self._items[-1] = self.merge(self._items[-1], item)
+                    self.stats.add(merged=1)
+                    return
+                else:
+                    started = time.perf_counter()
+                    while len(self._items) >= self.maxsize:
+                        self._condition.wait()
+                    self.stats.add(blocked_seconds=time.perf_counter() - started)
+            self._items.append(item)
+            self._condition.notify_all()
+
+    def get(self) -> Any:
+        return self.take()[1]
+
+    def take(self) -> Tuple[Optional[int], Any]:
+        with self._condition:
+            while not self._items and not self._closed:
+                self._condition.wait()
+            if not self._items:
+                return None, _CLOSED
+            item = self._items.popleft()
+            ticket, self._taken = self._taken, self._taken + 1
+            self._condition.notify_all()
+            return ticket, item
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._items)
+
+
+class Resequencer:
+    """
+    Hands a stage's results on in ticket order. Workers finish out of order; a result
+    waits here until every earlier ticket has been released. Dropped items and errors
+    release their ticket with no result.
+    """
+
+    def __init__(self, emit: Callable[[Any], None]):
+        self.emit = emit
+        self._pending: Dict[int, Any] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def release(self, ticket: int, result: Any = None):
+        with self._lock:
+            self._pending[ticket] = result
+            while self._next in self._pending:
+                result = self._pending.pop(self._next)
+                self._next += 1
+                if result is not None:
+                    # Emitted under the lock so a blocking downstream put cannot be overtaken
+                    self.emit(result)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+
+class Stage:
+    """
+    One pipeline step: `func(item) -> item` run by `workers` threads, or by a process
+    pool of that size when `executor="process"` (func and items must then be picklable).
+    Returning None drops the item from the rest of the pipeline.
+    Results are passed on in input order whatever the worker count, but `func` calls
+    overlap with more than one worker, so stateful stages such as the lattice update
+    should keep `workers=1`.
+    """
+
+    def __init__(self, name: str, func: Callable[[Any], Any], workers: int = 1, queue_size: int = 8,
+                 backpressure: str = "block", merge: Optional[Callable[[Any, Any], Any]] = None,
+                 executor: str = "thread"):
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown stage executor: {executor}")
+        self.name = name
+        self.func = func
+        self.workers = max(workers, 1)
+        self.executor = executor
+        self.stats = StageStats()
+        self.queue = StageQueue(queue_size, backpressure, self.stats, merge)
+
+
+class Pipeline:
+    """
+    Runs items through a chain of Stages. `submit` feeds the first stage (applying its
+    backpressure), `close` drains every stage in order and returns per-stage stats.
+    Results leaving the last stage go to `on_result`.
+    """
+
+    def __init__(self, stages: List[Stage], on_result: Optional[Callable[[Any], None]] = None):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.on_result = on_result
+        self._threads: Dict[str, List[threading.Thread]] = {}
+        self._pools: Dict[str, ProcessPoolExecutor] = {}
+        self._resequencers: Dict[str, Resequencer] = {}
+        self._started = False
+
+    def start(self) -> "Pipeline":
+        if self._started:
+            return self
+        for position, stage in enumerate(self.stages):
+            downstream = self.stages[position + 1] if position + 1 < len(self.stages) else None
+            if stage.executor == "process":
+                self._pools[stage.name] = ProcessPoolExecutor(stage.workers)
+            self._resequencers[stage.name] = Resequencer(self._emitter(downstream))
+            self._threads[stage.name] = [
+                threading.Thread(target=self._work, args=(stage,),
+                                 name=f"Pipeline-{stage.name}-{n}", daemon=True)
+                for n in range(stage.workers)
+            ]
+            for thread in self._threads[stage.name]:
+                thread.start()
+        self._started = True
+        print(f"🧵 Pipeline started: {' → '.join(f'{s.name}×{s.workers}' for s in self.stages)}")
+        return self
+
+    def submit(self, item: Any):
+        self.start()
+        self.stages[0].queue.put(item)
+
+    def run(self, items: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Feed every item and drain the pipeline.
+        """
+        for item in items:
+            self.submit(item)
+        return self.close()
+
+    def close(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Stop accepting items, let each stage finish its queue, and return stage stats.
+        """
+        self.start()
+        for stage in self.stages:
+            stage.queue.close()
+            for thread in self._threads[stage.name]:
+                thread.join()
+            pool = self._pools.pop(stage.name, None)
+            if pool is not None:
+                pool.shutdown()
+        return self.stats()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {stage.name: stage.stats.as_dict() for stage in self.stages}
+
+    def _emitter(self, downstream: Optional[Stage]) -> Callable[[Any], None]:
+        if downstream is not None:
+            return downstream.queue.put
+        return self.on_result or (lambda result: None)
+
+    def _work(self, stage: Stage):
+        pool = self._pools.get(stage.name)
+        resequencer = self._resequencers[stage.name]
+        while True:
+            ticket, item = stage.queue.take()
+            if item is _CLOSED:
+                return
+            started = time.perf_counter()
+            try:
+                result = pool.submit(stage.func, item).result() if pool else stage.func(item)
+            except Exception as e:
+                stage.stats.add(errors=1, busy_seconds=time.perf_counter() - started)
+                METRICS.inc("pipeline_stage_errors_total", stage=stage.name)
+                print(f"❌ Pipeline stage {stage.name} error: {e}")
+                resequencer.release(ticket)
+                continue
+            elapsed = time.perf_counter() - started
+            stage.stats.add(processed=1, busy_seconds=elapsed)
+            METRICS.observe("pipeline_stage_seconds", elapsed, stage=stage.name)
+            resequencer.release(ticket, result)
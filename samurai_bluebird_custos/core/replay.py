@@ -0,0 +1,179 @@
+# samurai_bluebird_custos/core/replay.py
+
+"""
+Bulk replay of saved `batches/YYYY-MM-DD/session_*.json` files through
+TriAgent → BlueBox → AMSCore, e.g. to rebuild the Resonance Lattice after a framework change.
+
+Days are independent, so each one is replayed in a worker process against a scratch copy
+of the lattice taken before the replay started. A worker returns the day's lattice delta
+(numeric changes, newly seen hooks, changed fields, created nodes) and the parent folds the
+deltas into the real lattice in date order, so the result does not depend on which worker
+finishes first.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from samurai_bluebird_custos.agents.ams_core import AMSCore
+from samurai_bluebird_custos.agents.tri_agent import TriAgent
+from samurai_bluebird_custos.core.main_loop import MainLoop
+from samurai_bluebird_custos.core.resonance_logger import LOG_DIR
+from samurai_bluebird_custos.core.staging_area import BATCH_DIR
+from samurai_bluebird_custos.frameworks.blue_box import BlueBox
+from samurai_bluebird_custos.symbolic.lattice_durability import DurabilityPolicy
+from samurai_bluebird_custos.symbolic.lattice_registry import get_shared_lattice, RESONANCE_LATTICE_FILE
+from samurai_bluebird_custos.symbolic.recursive_memory_lattice import RecursiveSymbolicMemoryLattice
+
+Delta = Dict[str, Dict[str, Dict[str, Any]]]
+
+# TriAgent and BlueBox are reused across the days a worker process replays
+_worker_components: Dict[str, Any] = {}
+
+
+def day_folders(start: str, end: str, batch_dir: str = BATCH_DIR) -> List[Tuple[str, str]]:
+    """
+    (day, folder) pairs for every YYYY-MM-DD folder between start and end inclusive.
+    """
+    for bound in (start, end):
+        datetime.strptime(bound, "%Y-%m-%d")
+    if not os.path.isdir(batch_dir):
+        return []
+    days = []
+    for name in sorted(os.listdir(batch_dir)):
+        try:
+            datetime.strptime(name, "%Y-%m-%d")
+        except ValueError:
+            continue
+        if start <= name <= end:
+            days.append((name, os.path.join(batch_dir, name)))
+    return days
+
+
+def load_day_batches(folder: str) -> List[Dict[str, Any]]:
+    batches = []
+    for name in sorted(os.listdir(folder)):
+        if name.startswith("session_") and name.endswith(".json"):
+            with open(os.path.join(folder, name), "r") as f:
+                batches.append(json.load(f))
+    return batches
+
+
+def batch_to_snapshot(batch: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn a saved feather batch into the snapshot shape TriAgent reasons over.
+    Batches written by `staging_area.save_batch` are the capture itself, with no
+    `feathers_capture` wrapper, so their own top-level fields are the snapshot.
+    """
+    symbolic = batch.get("symbolic_tags", {})
+    tags = [tag for values in symbolic.values() for tag in values]
+    tags += batch.get("meta", {}).get("emotional_resonance", [])
+    capture = batch.get("feathers_capture")
+    if capture is None:
+        capture = {key: value for key, value in batch.items() if key not in ("symbolic_tags", "meta")}
+    return {
+        **capture,
+        "timestamp": batch.get("timestamp"),
+        "tags": tags or batch.get("tags", []),
+        "weights": batch.get("weights", {}),
+    }
+
+
+def diff_lattice(before: Dict[str, Any], after: Dict[str, Any]) -> Delta:
+    """
+    What replaying a day changed, in the form `RecursiveSymbolicMemoryLattice.apply_delta` takes.
+    """
+    delta: Delta = {}
+    for category, nodes in after.items():
+        for neuron_id, node in nodes.items():
+            old = before.get(category, {}).get(neuron_id)
+            if old is None:
+                change = {"node": node}
+            elif old == node:
+                continue
+            else:
+                old_hooks = set(old.get("narrative_hooks", []))
+                change = {
+                    "familiarity": round(node.get("familiarity", 0.0) - old.get("familiarity", 0.0), 6),
+                    "novelty": round(node.get("novelty", 0.0) - old.get("novelty", 0.0), 6),
+                    "narrative_hooks": [hook for hook in node.get("narrative_hooks", []) if hook not in old_hooks],
+                    "fields": {key: value for key, value in node.items()
+                               if key not in ("familiarity", "novelty", "narrative_hooks") and old.get(key) != value},
+                }
+            delta.setdefault(category, {})[neuron_id] = change
+    return delta
+
+
+def replay_day(day: str, folder: str, base: Dict[str, Any], log_dir: str = LOG_DIR) -> Tuple[str, Delta, int]:
+    """
+    Replay one day's batches against a scratch copy of `base` and return (day, delta, batch count).
+    Runs in a worker process; AMSCore logs go to `log_dir`.
+    """
+    if not _worker_components:
+        _worker_components.update(tri_agent=TriAgent(), bluebox=BlueBox())
+    batches = load_day_batches(folder)
+
+    with tempfile.TemporaryDirectory(prefix=f"replay-{day}-") as scratch:
+        scratch_file = os.path.join(scratch, "resonance_lattice.json")
+        with open(scratch_file, "w") as f:
+            json.dump(base, f)
+        lattice = RecursiveSymbolicMemoryLattice(scratch_file)
+        lattice.set_durability(DurabilityPolicy.manual())
+        loop = MainLoop(_worker_components["tri_agent"], _worker_components["bluebox"],
+                        AMSCore(lattice=lattice, log_dir=log_dir), log_dir=log_dir)
+        loop.ams_many([loop.frameworks(loop.reason(batch_to_snapshot(batch))) for batch in batches])
+        delta = diff_lattice(base, lattice.to_dict())
+        lattice.close()
+    return day, delta, len(batches)
+
+
+def replay(start: str, end: str, batch_dir: str = BATCH_DIR, workers: Optional[int] = None,
+           lattice: Optional[RecursiveSymbolicMemoryLattice] = None, log_dir: str = LOG_DIR) -> Dict[str, Any]:
+    """
+    Replay every day between start and end (inclusive) and fold the results into `lattice`
+    (the shared resonance lattice by default). `workers=1` replays in this process.
+    Worker logs are written to `log_dir`.
+    """
+    started = time.perf_counter()
+    days = day_folders(start, end, batch_dir)
+    lattice = lattice or get_shared_lattice(RESONANCE_LATTICE_FILE, persistence="wal")
+    # Plain JSON copy: shipped to workers and must not alias nodes apply_delta will change
+    base = json.loads(json.dumps(lattice.get_snapshot_json(), default=str))
+    print(f"⏪ Replay: {len(days)} day(s) from {start} to {end}.")
+
+    if workers == 1 or len(days) <= 1:
+        results = [replay_day(day, folder, base, log_dir) for day, folder in days]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(replay_day, *zip(*[(day, folder, base, log_dir) for day, folder in days])))
+
+    nodes_changed = 0
+    for day, delta, _ in sorted(results, key=lambda result: result[0]):
+        lattice.apply_delta(delta)
+        nodes_changed += sum(len(changes) for changes in delta.values())
+    lattice.save()
+
+    summary = {
+        "days": len(days),
+        "batches": sum(count for _, _, count in results),
+        "nodes_changed": nodes_changed,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    print(f"✅ Replay complete: {summary}")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay saved batches through the full pipeline.")
+    parser.add_argument("start", help="first day, YYYY-MM-DD")
+    parser.add_argument("end", nargs="?", help="last day, YYYY-MM-DD (default: start)")
+    parser.add_argument("--batch-dir", default=BATCH_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--log-dir", default=LOG_DIR)
+    args = parser.parse_args()
+    replay(args.start, args.end or args.start, args.batch_dir, args.workers, log_dir=args.log_dir)
@@ -4,19 +4,25 @@ import json
 import os
 from datetime import datetime
 
+from samurai_bluebird_custos.utils.metrics import span
 
-def log_all(message: str, filename: str):
+# Tenants pass their own logs directory; single-user runs keep the shared one
+LOG_DIR = "logs"
+
+
+def log_all(message: str, filename: str, log_dir: str = LOG_DIR):
     """
     Append a message to a log file inside the logs directory.
     Keeps logging consistent for Krishna, AMS, and other observers.
     """
-    os.makedirs("logs", exist_ok=True)
-    log_path = os.path.join("logs", filename)
-    with open(log_path, "a") as f:
-        f.write(message + "\n")
+    with span("log.write", log=filename):
+        os.makedirs(log_dir, exist_ok=True)
+        log_path = os.path.join(log_dir, filename)
+        with open(log_path, "a") as f:
+            f.write(message + "\n")
 
 
-def write_output_logs(narrative, symbolic_data, meaning_map):
+def write_output_logs(narrative, symbolic_data, meaning_map, log_dir: str = LOG_DIR):
     timestamp = datetime.utcnow().isoformat()
     log_entry = {
         "timestamp": timestamp,
@@ -24,16 +30,18 @@ def write_output_logs(narrative, symbolic_data, meaning_map):
         "symbolic": symbolic_data,
         "meaning_map": meaning_map
     }
-    os.makedirs("logs", exist_ok=True)
-    with open("logs/output_resonance_log.txt", "a") as f:
-        f.write(json.dumps(log_entry) + "\n")
+    with span("log.write", log="output_resonance_log.txt"):
+        os.makedirs(log_dir, exist_ok=True)
+        with open(os.path.join(log_dir, "output_resonance_log.txt"), "a") as f:
+            f.write(json.dumps(log_entry) + "\n")
 
-def verify_and_log(system_state):
+def verify_and_log(system_state, log_dir: str = LOG_DIR):
     timestamp = datetime.utcnow().isoformat()
     entry = {
         "timestamp": timestamp,
         "system_state": system_state
     }
-    os.makedirs("logs", exist_ok=True)
-    with open("logs/dashboard_log.txt", "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    with span("log.write", log="dashboard_log.txt"):
+        os.makedirs(log_dir, exist_ok=True)
+        with open(os.path.join(log_dir, "dashboard_log.txt"), "a") as f:
+            f.write(json.dumps(entry) + "\n")
@@ -0,0 +1,216 @@
+# samurai_bluebird_custos/core/tenancy.py
+
+"""
+Multi-tenant processing: one lattice, batch folder and log folder per tenant.
+
+    tenants/<tenant_id>/memory/resonance_lattice.json
+    tenants/<tenant_id>/memory/recursive_symbolic_memory.json
+    tenants/<tenant_id>/batches/YYYY-MM-DD/
+    tenants/<tenant_id>/logs/
+
+TenantPool spreads tenants over worker processes with affinity: a tenant always hashes
+to the same worker, so its lattice stays resident in one process, its snapshots are
+processed in arrival order, and no two processes ever write the same tenant's files.
+Each worker keeps up to `max_resident` tenants warm and flushes and closes the least
+recently used one when another tenant arrives.
+"""
+
+import os
+import re
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from samurai_bluebird_custos.agents.ams_core import AMSCore
+from samurai_bluebird_custos.agents.tri_agent import TriAgent
+from samurai_bluebird_custos.core.main_loop import MainLoop
+from samurai_bluebird_custos.frameworks.blue_box import BlueBox
+from samurai_bluebird_custos.symbolic.lattice_durability import DurabilityPolicy
+from samurai_bluebird_custos.symbolic.lattice_registry import (
+    get_shared_lattice, release_shared_lattice, RESONANCE_LATTICE_FILE, RECURSIVE_MEMORY_FILE,
+)
+from samurai_bluebird_custos.utils.config import TENANTS_DIR
+
+TENANT_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+# Hundreds of resident tenants: coalesce by mutation count only, so no flusher thread per
+# tenant; the pool flushes on eviction and close
+TENANT_DURABILITY = DurabilityPolicy(every_mutations=50)
+
+
+class TenantPaths:
+    """
+    Every per-tenant path, under `<root>/<tenant_id>/`.
+    """
+
+    def __init__(self, tenant_id: str, root: str = TENANTS_DIR):
+        if not TENANT_ID_PATTERN.match(tenant_id or ""):
+            raise ValueError(f"Invalid tenant id {tenant_id!r}: use 1-64 letters, digits, '.', '_' or '-'")
+        self.tenant_id = tenant_id
+        self.root = os.path.join(os.path.abspath(root), tenant_id)
+        self.memory_dir = os.path.join(self.root, "memory")
+        self.batches_dir = os.path.join(self.root, "batches")
+        self.logs_dir = os.path.join(self.root, "logs")
+        self.resonance_lattice_file = os.path.join(self.memory_dir, os.path.basename(RESONANCE_LATTICE_FILE))
+        self.recursive_memory_file = os.path.join(self.memory_dir, os.path.basename(RECURSIVE_MEMORY_FILE))
+        self.metrics_file = os.path.join(self.logs_dir, "metrics.prom")
+
+    def ensure(self) -> "TenantPaths":
+        for directory in (self.memory_dir, self.batches_dir, self.logs_dir):
+            os.makedirs(directory, exist_ok=True)
+        return self
+
+    def __repr__(self) -> str:
+        return f"TenantPaths({self.tenant_id!r}, root={os.path.dirname(self.root)!r})"
+
+
+def tenant_main_loop(paths: TenantPaths, durability: DurabilityPolicy = TENANT_DURABILITY,
+                     bluebox: Optional[BlueBox] = None) -> MainLoop:
+    """
+    A MainLoop wired to the tenant's lattices and logs. BlueBox holds no per-user
+    state, so one instance can be shared across tenants.
+    """
+    paths.ensure()
+    lattice = get_shared_lattice(paths.resonance_lattice_file, persistence="wal")
+    lattice.set_durability(durability)
+    tri_agent = TriAgent(memory=get_shared_lattice(paths.recursive_memory_file))
+    return MainLoop(tri_agent, bluebox or BlueBox(), AMSCore(lattice=lattice, log_dir=paths.logs_dir),
+                    log_dir=paths.logs_dir)
+
+
+def release_tenant(paths: TenantPaths):
+    """
+    Flush and unload a tenant's lattices from this process.
+    """
+    release_shared_lattice(paths.resonance_lattice_file)
+    release_shared_lattice(paths.recursive_memory_file)
+
+
+# --- Worker process side ---
+
+_resident: "OrderedDict[str, Tuple[TenantPaths, MainLoop]]" = OrderedDict()
+_shared_bluebox: Dict[str, BlueBox] = {}
+
+
+def _resident_loop(tenant_id: str, root: str, durability: DurabilityPolicy, max_resident: int) -> MainLoop:
+    if tenant_id in _resident:
+        _resident.move_to_end(tenant_id)
+        return _resident[tenant_id][1]
+    while len(_resident) >= max(max_resident, 1):
+        _, (evicted_paths, _) = _resident.popitem(last=False)
+        release_tenant(evicted_paths)
+    if "bluebox" not in _shared_bluebox:
+        _shared_bluebox["bluebox"] = BlueBox()
+    paths = TenantPaths(tenant_id, root)
+    loop = tenant_main_loop(paths, durability, _shared_bluebox["bluebox"])
+    _resident[tenant_id] = (paths, loop)
+    return loop
+
+
+def process_tenant_snapshots(tenant_id: str, snapshots: List[Dict[str, Any]], root: str = TENANTS_DIR,
+                             durability: DurabilityPolicy = TENANT_DURABILITY,
+                             max_resident: int = 64) -> Dict[str, Any]:
+    """
+    Process a tenant's snapshots in order as one AMSCore micro-batch. Runs in a worker process.
+    """
+    loop = _resident_loop(tenant_id, root, durability, max_resident)
+    contexts = loop.ams_many([loop.frameworks(loop.reason(snapshot)) for snapshot in snapshots])
+    for context in contexts:
+        loop.log(context)
+    return {
+        "tenant": tenant_id,
+        "pid": os.getpid(),
+        "processed": len(contexts),
+        "narratives": [context["tri_output"]["narrative"] for context in contexts],
+    }
+
+
+def release_resident_tenants() -> List[str]:
+    """
+    Flush and unload every tenant resident in this worker process.
+    """
+    released = list(_resident)
+    while _resident:
+        _, (paths, _) = _resident.popitem(last=False)
+        release_tenant(paths)
+    return released
+
+
+# --- Parent side ---
+
+def tenant_worker(tenant_id: str, workers: int) -> int:
+    """
+    Stable tenant → worker assignment (CRC32, so it holds across restarts).
+    """
+    return zlib.crc32(tenant_id.encode("utf-8")) % workers
+
+
+class TenantPool:
+    """
+    Worker processes with tenant affinity. Each worker is its own single-process
+    executor, so everything submitted for one tenant runs in order in one process.
+    """
+
+    def __init__(self, workers: Optional[int] = None, root: str = TENANTS_DIR,
+                 durability: DurabilityPolicy = TENANT_DURABILITY, max_resident: int = 64):
+        self.workers = max(workers or os.cpu_count() or 1, 1)
+        self.root = os.path.abspath(root)
+        self.durability = durability
+        self.max_resident = max_resident
+        self._executors = [ProcessPoolExecutor(max_workers=1) for _ in range(self.workers)]
+        print(f"🏘️ TenantPool: {self.workers} worker process(es), tenants under {self.root}.")
+
+    def submit(self, tenant_id: str, snapshots: List[Dict[str, Any]]) -> Future:
+        TenantPaths(tenant_id, self.root)  # validate in the parent, before it reaches a worker
+        executor = self._executors[tenant_worker(tenant_id, self.workers)]
+        return executor.submit(process_tenant_snapshots, tenant_id, snapshots, self.root,
+                               self.durability, self.max_resident)
+
+    def process_streams(self, streams: Dict[str, Iterable[Dict[str, Any]]],
+                        chunk_size: int = 16) -> Dict[str, Dict[str, Any]]:
+        """
+        Process each tenant's snapshot stream, `chunk_size` snapshots per micro-batch.
+        Tenants on different workers run in parallel. Returns per-tenant totals.
+        """
+        futures: List[Tuple[str, Future]] = []
+        for tenant_id, stream in streams.items():
+            chunk: List[Dict[str, Any]] = []
+            for snapshot in stream:
+                chunk.append(snapshot)
+                if len(chunk) >= chunk_size:
+                    futures.append((tenant_id, self.submit(tenant_id, chunk)))
+                    chunk = []
+            if chunk:
+                futures.append((tenant_id, self.submit(tenant_id, chunk)))
+
+        totals: Dict[str, Dict[str, Any]] = {}
+        for tenant_id, future in futures:
+            entry = totals.setdefault(tenant_id, {"processed": 0, "errors": [], "workers": set()})
+            try:
+                result = future.result()
+                entry["processed"] += result["processed"]
+                entry["workers"].add(result["pid"])
+            except Exception as e:
+                print(f"❌ Tenant {tenant_id} error: {e}")
+                entry["errors"].append(str(e))
+        return totals
+
+    def close(self):
+        """
+        Flush every resident tenant's lattices, then stop the workers.
+        """
+        for future in [executor.submit(release_resident_tenants) for executor in self._executors]:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ TenantPool flush error: {e}")
+        for executor in self._executors:
+            executor.shutdown()
+        print("💾 TenantPool: tenant lattices flushed.")
+
+    def __enter__(self) -> "TenantPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
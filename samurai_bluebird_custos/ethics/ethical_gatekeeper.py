@@ -1,7 +1,8 @@
 # samurai_bluebird_custos/ethics/ethical_gatekeeper.py
 
+import json
 from typing import Dict, Any
-from samurai_bluebird_custos.symbolic.recursive_memory_lattice import ResonanceLattice
+from samurai_bluebird_custos.symbolic.lattice_registry import get_shared_lattice, RESONANCE_LATTICE_FILE
 from samurai_bluebird_custos.core.resonance_logger import log_all
 
 class EthicalGatekeeper:
@@ -11,7 +12,7 @@ class EthicalGatekeeper:
     """
 
     def __init__(self):
-        self.lattice = ResonanceLattice("memory/resonance_lattice.json")
+        self.lattice = get_shared_lattice(RESONANCE_LATTICE_FILE, persistence="wal")
 
     def filter_output(self, processed_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -20,13 +21,14 @@ class EthicalGatekeeper:
         print("⚖️ EthicalGatekeeper: Filtering output with socio-emotional alignment...")
 
         filtered_data = {}
-        lattice_snapshot = self.lattice.get_snapshot_json()
+        self.lattice.refresh_if_changed()
 
         for category, entries in processed_data.items():
             filtered_data[category] = {}
-            for entry_id, content in entries.items():
+            # One batched lookup per category instead of a walk per entry
+            familiarities = self.lattice.familiarity_for(category, list(entries), default=0.5)
+            for (entry_id, content), familiarity in zip(entries.items(), familiarities):
                 # Example filter logic: lower novelty if familiarity is high (stability bias)
-                familiarity = lattice_snapshot.get(category, {}).get(entry_id, {}).get("familiarity", 0.5)
                 novelty = content.get("novelty", 0.5)
 
                 if familiarity >= 0.8 and novelty > 0.2:
@@ -39,7 +41,10 @@ class EthicalGatekeeper:
                 }
 
         # Log filtered data
-        log_all(filtered_data, meta_notes="EthicalGatekeeper filtered batch.")
+        log_all(json.dumps({
+            "meta_notes": "EthicalGatekeeper filtered batch.",
+            "filtered_data": filtered_data
+        }), "output_resonance_log.txt")
         print("📝 Ethical filtering completed.")
 
         return filtered_data
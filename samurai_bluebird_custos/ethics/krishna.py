@@ -1,29 +1,34 @@
 # samurai_bluebird_custos/ethics/krishna.py
 
 import json
-from datetime import datetime, timedelta
-from samurai_bluebird_custos.symbolic.recursive_memory_lattice import ResonanceLattice
+from datetime import datetime
+from samurai_bluebird_custos.symbolic.lattice_registry import get_shared_lattice, RESONANCE_LATTICE_FILE
+from samurai_bluebird_custos.symbolic.recursive_memory_lattice import FAMILIARITY_KNOWN_THRESHOLD
 from samurai_bluebird_custos.core.resonance_logger import log_all
 
 WITNESS_LOG = "witness_log.txt"
 META_ALERT_LOG = "meta_alert.txt"
 
-lattice = ResonanceLattice("memory/resonance_lattice.json")
+
+def get_lattice():
+    """
+    The shared lattice, opened on first use rather than when this module is imported.
+    """
+    return get_shared_lattice(RESONANCE_LATTICE_FILE, persistence="wal")
 
 
-def extract_dominant_themes(snapshot):
-    themes = []
-    for category, neurons in snapshot.items():
-        for neuron_id, node in neurons.items():
-            hooks = node.get("narrative_hooks", [])
-            themes.extend(hooks)
-    return list(set(themes))
+def __getattr__(name):
+    # Keeps `krishna.lattice` working without reading the lattice at import time
+    if name == "lattice":
+        return get_lattice()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def generate_witness_log():
-    snapshot = lattice.get_snapshot_json()
+    lattice = get_lattice()
+    lattice.refresh_if_changed()
     reflection = lattice.get_daily_reflection()
-    dominant_themes = extract_dominant_themes(snapshot)
+    dominant_themes = lattice.dominant_themes()
 
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
     log_entry = (
@@ -36,21 +41,11 @@ def generate_witness_log():
 
 
 def observe_symbolic_drift():
-    snapshot = lattice.get_snapshot_json()
+    lattice = get_lattice()
+    lattice.refresh_if_changed()
     now = datetime.now()
-    cutoff = (now - timedelta(hours=6)).strftime("%Y-%m-%d %H:%M")
-
-    drift_score = 0
-    theme_count = {}
-
-    for category, neurons in snapshot.items():
-        for neuron_id, node in neurons.items():
-            updated = node.get("last_updated", "")
-            if updated < cutoff:
-                continue
-            hooks = node.get("narrative_hooks", [])
-            for h in hooks:
-                theme_count[h] = theme_count.get(h, 0) + 1
+    # Only nodes touched in the last 6 hours, read from the lattice time index
+    theme_count = lattice.recent_theme_counts(hours=6)
 
     if not theme_count:
         return  # No significant drift
@@ -74,17 +69,16 @@ class KrishnaMetaObserver:
     """
 
     def __init__(self):
-        self.lattice = lattice
+        self.lattice = get_lattice()
 
     def process_lattice_reflection(self):
-        snapshot = self.lattice.get_snapshot_json()
+        self.lattice.refresh_if_changed()
         reflection = self.lattice.get_daily_reflection()
-        dominant_themes = extract_dominant_themes(snapshot)
+        dominant_themes = self.lattice.dominant_themes()
 
-        total_nodes = sum(len(neurons) for neurons in snapshot.values()) or 1
-        unknown_nodes = sum(
-            1 for neurons in snapshot.values() for node in neurons.values() if node.get("familiarity", 0) < 0.7
-        )
+        node_count = self.lattice.node_count()
+        total_nodes = node_count or 1
+        unknown_nodes = node_count - self.lattice.count_familiar(FAMILIARITY_KNOWN_THRESHOLD)
         unknown_ratio = round(unknown_nodes / total_nodes, 3)
 
         log_payload = {
@@ -94,5 +88,5 @@ class KrishnaMetaObserver:
             "unknown_ratio": unknown_ratio,
         }
 
-        log_all(json.dumps(log_payload, indent=2), WITNESS_LOG)
+        log_all(json.dumps(log_payload), WITNESS_LOG)
         return log_payload
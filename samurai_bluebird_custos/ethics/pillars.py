@@ -138,21 +138,33 @@ class SocioEmotionalFilter:
         Apply socio-emotional filtering to the framework output.
         """
         print("💠 SocioEmotionalFilter: Applying emotional-ethical filters...")
-        results = self.run_all(framework_output)
-        # Inject emotional & ethical assessments into output
-        filtered_output = framework_output.copy()
-        filtered_output["emotional_filters"] = results
-        return filtered_output
+        return self._filtered(framework_output, self._checks())
+
+    def apply_many(self, framework_outputs: list) -> list:
+        """
+        Apply socio-emotional filtering to a list of framework outputs in one pass.
+        """
+        print(f"💠 SocioEmotionalFilter: Applying emotional-ethical filters to {len(framework_outputs)} batch(es)...")
+        checks = self._checks()
+        return [self._filtered(framework_output, checks) for framework_output in framework_outputs]
 
     def run_all(self, resonance_lattice):
         """
         Run all lenses and pillars on the given lattice data.
         """
-        results = {}
-        for lens in self.lenses:
-            name = lens.__class__.__name__.replace("Lens", "")
-            results[name] = lens.assess(resonance_lattice)
-        for pillar in self.pillars:
-            name = pillar.__class__.__name__.replace("Pillar", "")
-            results[name] = pillar.check(resonance_lattice)
-        return results
+        return {name: check(resonance_lattice) for name, check in self._checks()}
+
+    def _checks(self):
+        """
+        (name, callable) for every lens, then every pillar.
+        """
+        checks = [(lens.__class__.__name__.replace("Lens", ""), lens.assess) for lens in self.lenses]
+        checks += [(pillar.__class__.__name__.replace("Pillar", ""), pillar.check) for pillar in self.pillars]
+        return checks
+
+    @staticmethod
+    def _filtered(framework_output: dict, checks) -> dict:
+        # Inject emotional & ethical assessments into a copy of the output
+        filtered_output = framework_output.copy()
+        filtered_output["emotional_filters"] = {name: check(framework_output) for name, check in checks}
+        return filtered_output
@@ -9,6 +9,7 @@ from typing import Dict, Any
 from samurai_bluebird_custos.frameworks.chakra_mapping import ChakraMap
 from samurai_bluebird_custos.frameworks.context_domains import ContextDomains
 from samurai_bluebird_custos.frameworks.sovereignties import Sovereignties
+from samurai_bluebird_custos.utils.metrics import span
 
 class BlueBox:
     def __init__(self):
@@ -25,12 +26,15 @@ class BlueBox:
         meta = enriched_narrative.get("raw_enriched", {})
 
         # Framework-level tagging
-        chakra_signals = self.chakra.map_input(meta)
-        context_domains = self.context.map_input(meta)
-        sovereign_keys = self.sovereignty.list_all()
-        sovereignty_constellation = self.sovereignty.route_affect_to_constellation(
-            meta.get("tags", []), meta.get("weights", {})
-        )
+        with span("bluebox.framework", framework="chakra"):
+            chakra_signals = self.chakra.map_input(meta)
+        with span("bluebox.framework", framework="context_domains"):
+            context_domains = self.context.map_input(meta)
+        with span("bluebox.framework", framework="sovereignties"):
+            sovereign_keys = self.sovereignty.list_all()
+            sovereignty_constellation = self.sovereignty.route_affect_to_constellation(
+                meta.get("tags", []), meta.get("weights", {})
+            )
 
         meaning_map = {
             "chakra_signals": chakra_signals,
@@ -0,0 +1,114 @@
+# samurai_bluebird_custos/io/capabilities.py
+
+"""
+Capability profile and lazy loading for the heavy, display-bound capture dependencies
+(OpenCV, pytesseract, pynput, PIL.ImageGrab, win32gui).
+
+Nothing here imports those packages up front: availability is checked with
+`importlib.util.find_spec`, and `optional_import` imports a module the first time a
+capture path actually needs it. On headless machines (no display, or
+`SAMURAI_HEADLESS=1`) screen, keyboard and window capture report as unavailable and
+callers fall back to placeholders, so processing-only nodes never touch them.
+"""
+
+import importlib
+import importlib.util
+import os
+import shutil
+import sys
+from typing import Any, Dict, Optional
+
+from samurai_bluebird_custos.utils.config import TESSERACT_PATH
+
+_modules: Dict[str, Optional[Any]] = {}
+_profile: Optional["CapabilityProfile"] = None
+
+
+def is_installed(module_name: str) -> bool:
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def optional_import(module_name: str) -> Optional[Any]:
+    """
+    Import `module_name` on first use and cache it; None if it is missing or fails to load
+    (e.g. PIL.ImageGrab or pynput without a display).
+    """
+    if module_name not in _modules:
+        try:
+            _modules[module_name] = importlib.import_module(module_name)
+        except Exception as e:
+            print(f"⚠️ Optional dependency {module_name} unavailable: {e}")
+            _modules[module_name] = None
+    return _modules[module_name]
+
+
+def has_display() -> bool:
+    if os.environ.get("SAMURAI_HEADLESS", "").lower() in ("1", "true", "yes"):
+        return False
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def tesseract_command() -> Optional[str]:
+    """
+    Tesseract binary: $TESSERACT_CMD, then PATH, then the configured Windows install path.
+    """
+    for candidate in (os.environ.get("TESSERACT_CMD"), shutil.which("tesseract"), TESSERACT_PATH):
+        if candidate and (os.path.isfile(candidate) or shutil.which(candidate)):
+            return candidate
+    return None
+
+
+def load_pytesseract() -> Optional[Any]:
+    """
+    pytesseract, pointed at the detected Tesseract binary (set once, on first use).
+    """
+    first_load = "pytesseract" not in _modules
+    pytesseract = optional_import("pytesseract")
+    if pytesseract is not None and first_load:
+        command = tesseract_command()
+        if command:
+            pytesseract.pytesseract.tesseract_cmd = command
+    return pytesseract
+
+
+class CapabilityProfile:
+    """
+    What this machine can capture. Computed without importing any capture dependency.
+    """
+
+    def __init__(self):
+        self.display = has_display()
+        self.modules = {name: is_installed(name) for name in ("cv2", "pytesseract", "pynput", "PIL", "win32gui")}
+        self.tesseract = tesseract_command() is not None
+        self.screen_capture = self.display and self.modules["PIL"]
+        self.ocr = self.screen_capture and self.modules["pytesseract"] and self.tesseract
+        self.keyboard = self.display and self.modules["pynput"]
+        self.active_window = self.modules["win32gui"]
+
+    @property
+    def headless(self) -> bool:
+        return not (self.screen_capture or self.keyboard or self.active_window)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "headless": self.headless,
+            "display": self.display,
+            "screen_capture": self.screen_capture,
+            "ocr": self.ocr,
+            "keyboard": self.keyboard,
+            "active_window": self.active_window,
+            "tesseract": self.tesseract,
+            "modules": dict(self.modules),
+        }
+
+
+def capability_profile(refresh: bool = False) -> CapabilityProfile:
+    global _profile
+    if _profile is None or refresh:
+        _profile = CapabilityProfile()
+    return _profile
@@ -0,0 +1,133 @@
+# samurai_bluebird_custos/io/feather_collector.py
+
+"""
+Concurrent feather collection.
+
+Each feather (active window, keystrokes, OCR text, system metrics) is a registered source
+with its own timeout. `collect(*args)` starts every source at once on a thread pool, passing
+each probe the same arguments (e.g. the capture window), or, when the collector has a
+`prepare` step, the one result of `prepare(*args)` computed for that collect. It waits
+for each one only until its own deadline, so snapshot latency is the slowest source
+capped at its timeout, not the sum of all of them. A source that times out or fails gets
+its fallback value, and the snapshot is marked partial. Per-source status and timing are
+reported in `feather_timings` and in the `feather_seconds` histogram.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from samurai_bluebird_custos.utils.metrics import METRICS
+
+
+class FeatherSource:
+    """
+    One probe. Its result lands under `name`, or, with `merge=True`, a dict result is
+    merged into the snapshot (one probe filling several fields, e.g. CPU and memory).
+    """
+
+    def __init__(self, name: str, probe: Callable[..., Any], timeout: float = 1.0,
+                 fallback: Any = None, merge: bool = False):
+        self.name = name
+        self.probe = probe
+        self.timeout = timeout
+        self.fallback = fallback
+        self.merge = merge
+        # A probe that overran its timeout may still be running; it is not started twice
+        self.in_flight: Optional[Future] = None
+
+
+class FeatherCollector:
+    def __init__(self, sources: Optional[List[FeatherSource]] = None, max_workers: Optional[int] = None,
+                 prepare: Optional[Callable[..., Any]] = None):
+        self.sources: Dict[str, FeatherSource] = {}
+        for source in sources or []:
+            self.sources[source.name] = source
+        self.prepare = prepare
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def register(self, name: str, probe: Callable[..., Any], timeout: float = 1.0,
+                 fallback: Any = None, merge: bool = False) -> FeatherSource:
+        source = FeatherSource(name, probe, timeout, fallback, merge)
+        with self._lock:
+            self.sources[name] = source
+            executor, self._executor = self._executor, None  # resized on next collect
+        if executor is not None:
+            executor.shutdown(wait=False)
+        return source
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Room for every source plus one overrunning probe each
+                workers = self._max_workers or max(len(self.sources) * 2, 2)
+                self._executor = ThreadPoolExecutor(workers, thread_name_prefix="Feather")
+            return self._executor
+
+    def collect(self, *args: Any) -> Dict[str, Any]:
+        snapshot: Dict[str, Any] = {"timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        timings: Dict[str, Dict[str, Any]] = {}
+        pool = self._pool()
+        started = time.perf_counter()
+        if self.prepare is not None:
+            # Shared input (e.g. one sampler aggregate) is computed once, not once per probe
+            args = (self.prepare(*args),)
+
+        running = {}
+        with self._lock:
+            for source in list(self.sources.values()):
+                if source.in_flight is not None and not source.in_flight.done():
+                    timings[source.name] = {"status": "busy", "ms": 0.0}
+                    self._fill(snapshot, source, source.fallback)
+                    continue
+                # This capture waits on its own future; an overlapping capture may replace in_flight
+                source.in_flight = pool.submit(self._timed_probe, source, args)
+                running[source.name] = (source, source.in_flight)
+
+        for name, (source, future) in running.items():
+            remaining = started + source.timeout - time.perf_counter()
+            try:
+                value, elapsed = future.result(timeout=max(remaining, 0.0))
+                timings[name] = {"status": "ok", "ms": round(elapsed * 1000, 3)}
+            except FutureTimeout:
+                value = source.fallback
+                timings[name] = {"status": "timeout", "ms": round(source.timeout * 1000, 3)}
+                METRICS.inc("feather_timeouts_total", source=name)
+                print(f"⏳ Feather {name} timed out after {source.timeout}s; using fallback.")
+            except Exception as e:
+                value = source.fallback
+                timings[name] = {"status": "error", "ms": round((time.perf_counter() - started) * 1000, 3),
+                                 "error": str(e)}
+                METRICS.inc("feather_errors_total", source=name)
+                print(f"⚠️ Feather {name} failed: {e}")
+            self._fill(snapshot, source, value)
+
+        snapshot["partial"] = any(timing["status"] != "ok" for timing in timings.values())
+        snapshot["feather_timings"] = timings
+        METRICS.observe("feather_collect_seconds", time.perf_counter() - started)
+        return snapshot
+
+    @staticmethod
+    def _timed_probe(source: FeatherSource, args: tuple):
+        started = time.perf_counter()
+        try:
+            return source.probe(*args), time.perf_counter() - started
+        finally:
+            METRICS.observe("feather_seconds", time.perf_counter() - started, source=source.name)
+
+    @staticmethod
+    def _fill(snapshot: Dict[str, Any], source: FeatherSource, value: Any):
+        if source.merge:
+            snapshot.update(value or {})
+        else:
+            snapshot[source.name] = value
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,26 +1,39 @@
-import pytesseract
-import cv2
-import psutil
 import time
-from pynput import keyboard
-from PIL import ImageGrab
-import numpy as np
 
-# Hardcode Tesseract path to avoid PATH issues
-pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+from samurai_bluebird_custos.io.capabilities import capability_profile, optional_import
+from samurai_bluebird_custos.io.feather_collector import FeatherCollector
+from samurai_bluebird_custos.io.ocr_service import MARKERS
+from samurai_bluebird_custos.io.samplers import get_background_samplers
+
+# OpenCV, pytesseract, pynput and PIL are imported on first capture, not at import time,
+# and only when the capability profile says this machine can use them.
+
+# Per-feather timeouts (seconds) and fallbacks; a feather that overruns or fails gets its fallback
+FEATHER_TIMEOUTS = {"active_window": 0.5, "keystroke_burst": 0.2, "screenshot_text": 3.0, "system": 0.2}
+FEATHER_FALLBACKS = {
+    "active_window": "UnknownWindow",
+    "keystroke_burst": 0,
+    "screenshot_text": MARKERS["error"],
+    "system": {"cpu_usage": None, "memory_usage": None},
+}
+
 
 def capture_active_window():
     """Return the title of the currently focused application window."""
-    try:
-        import win32gui
-        window = win32gui.GetForegroundWindow()
-        title = win32gui.GetWindowText(window)
-        return title
-    except ImportError:
-        return "UnknownWindow"
+    if not capability_profile().active_window:
+        return FEATHER_FALLBACKS["active_window"]
+    win32gui = optional_import("win32gui")
+    if win32gui is None:
+        return FEATHER_FALLBACKS["active_window"]
+    window = win32gui.GetForegroundWindow()
+    return win32gui.GetWindowText(window)
+
 
 def capture_keystroke_bursts(duration=5):
     """Measure typing activity over a period of time (bursts)."""
+    keyboard = optional_import("pynput.keyboard") if capability_profile().keyboard else None
+    if keyboard is None:
+        return 0
     count = [0]
 
     def on_press(key):
@@ -32,33 +45,76 @@ def capture_keystroke_bursts(duration=5):
     listener.stop()
     return count[0]
 
+
 def capture_screenshot_text():
     """Take a screenshot and run OCR to extract visible text."""
+    if not capability_profile().ocr:
+        return FEATHER_FALLBACKS["screenshot_text"]
     try:
-        screenshot = ImageGrab.grab()
-        screenshot_cv = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-        text = pytesseract.image_to_string(screenshot_cv)
-        return text.strip()
+        from samurai_bluebird_custos.io.image_analysis import capture_screenshot
+        from samurai_bluebird_custos.io.ocr import read_screen_text
+        return read_screen_text(capture_screenshot())
     except Exception as e:
         print(f"⚠️ Screenshot OCR failed: {e}")
-        return "[Screenshot OCR unavailable]"
+        return FEATHER_FALLBACKS["screenshot_text"]
 
-def get_passive_input_snapshot():
-    """Unified passive input snapshot for Kernel."""
-    return {
-        "active_window": capture_active_window(),
-        "keystroke_burst": capture_keystroke_bursts(),
-        "screenshot_text": capture_screenshot_text(),
-        "cpu_usage": psutil.cpu_percent(interval=1),
-        "memory_usage": psutil.virtual_memory().percent,
-        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-    }
 
+def build_feather_collector(samplers=None, ocr_service=None, timeouts=None, read_window=capture_active_window,
+                            read_keystrokes=lambda: 0, read_screen=capture_screenshot_text):
+    """
+    Window, keystroke, OCR and system feathers as concurrent sources, with timeouts from
+    FEATHER_TIMEOUTS (overridable) and fallbacks from FEATHER_FALLBACKS. Call it as
+    `collector.collect(window_seconds)`: the samplers are aggregated over that window once
+    per collect and every probe reads the same readings, so on-demand reads (e.g. the CPU
+    percentage, whose baseline each read resets) happen at most once per snapshot.
+    Signals the background samplers do not cover are read with `read_window` and
+    `read_keystrokes`; screen text is queued on `ocr_service` if given, else `read_screen()`.
+    """
+    samplers = samplers or get_background_samplers()
+    timeouts = {**FEATHER_TIMEOUTS, **(timeouts or {})}
 
-class PassiveInputManager:
-    class PassiveInputManager:
-        def capture_batch(self):
-            return get_passive_input_snapshot()
+    def active_window(readings):
+        return readings.get("active_window") or read_window()
+
+    def keystroke_burst(readings):
+        burst = readings.get("keystroke_burst")
+        return burst if burst is not None else read_keystrokes()
 
+    def system(readings):
+        return {"cpu_usage": readings.get("cpu_usage"), "memory_usage": readings.get("memory_usage")}
+
+    collector = FeatherCollector(prepare=samplers.aggregate)
+    collector.register("active_window", active_window, timeouts["active_window"], FEATHER_FALLBACKS["active_window"])
+    collector.register("keystroke_burst", keystroke_burst, timeouts["keystroke_burst"],
+                       FEATHER_FALLBACKS["keystroke_burst"])
+    if ocr_service is not None:
+        # OCR runs out of process; the snapshot gets a pending marker and the text later
+        from samurai_bluebird_custos.io.ocr_service import submit_screenshot
+        collector.register("screenshot_text", lambda readings: submit_screenshot(ocr_service),
+                           timeouts["screenshot_text"],
+                           {"screenshot_text": FEATHER_FALLBACKS["screenshot_text"], "ocr_status": "error"},
+                           merge=True)
+    else:
+        collector.register("screenshot_text", lambda readings: read_screen(), timeouts["screenshot_text"],
+                           FEATHER_FALLBACKS["screenshot_text"])
+    collector.register("system", system, timeouts["system"], FEATHER_FALLBACKS["system"], merge=True)
+    return collector
+
+
+_collector = {}
+
+
+def get_passive_input_snapshot(window_seconds=5, ocr_service=None):
+    """Unified passive input snapshot for Kernel; feathers are collected concurrently."""
+    key = id(ocr_service)
+    if key not in _collector:
+        _collector[key] = build_feather_collector(ocr_service=ocr_service)
+    snapshot = _collector[key].collect(window_seconds)
+    if ocr_service is not None and "ocr_job" in snapshot:
+        ocr_service.attach(snapshot)
+    return snapshot
+
+
+class PassiveInputManager:
     def capture_batch(self):
         return get_passive_input_snapshot()
@@ -1,15 +1,264 @@
 # samurai_bluebird_custos/io/image_analysis.py
 
-from PIL import ImageGrab
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
 import numpy as np
-import cv2
+
+from samurai_bluebird_custos.io.capabilities import optional_import
+from samurai_bluebird_custos.utils.metrics import METRICS
 
 def capture_screenshot():
-    """Capture a screenshot and return as a NumPy array."""
-    screenshot = ImageGrab.grab()
-    return cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+    """Capture a screenshot and return as a NumPy array (BGR)."""
+    # PIL.ImageGrab needs a display, so it is only imported when a capture is taken
+    image_grab = optional_import("PIL.ImageGrab")
+    if image_grab is None:
+        raise RuntimeError("Screen capture unavailable (PIL.ImageGrab could not be loaded)")
+    screenshot = np.array(image_grab.grab())
+    cv2 = optional_import("cv2")
+    if cv2 is None:
+        return np.ascontiguousarray(screenshot[:, :, 2::-1])
+    return cv2.cvtColor(screenshot, cv2.COLOR_RGB2BGR)
 
 def analyze_screenshot_text(image):
     """Placeholder for visual analysis or scene understanding."""
     # Future: integrate ML models for object detection or sentiment analysis
     return "[Visual analysis placeholder]"
+
+
+# --- Screen-change detection ---
+
+def to_grayscale(image: np.ndarray) -> np.ndarray:
+    """BGR (or already single-channel) frame → float32 luminance."""
+    if image.ndim == 2:
+        return image.astype(np.float32)
+    blue, green, red = image[..., 0], image[..., 1], image[..., 2]
+    return (0.114 * blue + 0.587 * green + 0.299 * red).astype(np.float32)
+
+def thumbnail(image: np.ndarray, factor: int = 4) -> np.ndarray:
+    """Grayscale block-mean downsample by `factor` (edges that don't fill a block are cropped)."""
+    gray = to_grayscale(image)
+    height, width = (gray.shape[0] // factor) * factor, (gray.shape[1] // factor) * factor
+    if not height or not width:
+        return gray
+    return gray[:height, :width].reshape(height // factor, factor, width // factor, factor).mean(axis=(1, 3))
+
+def frame_signature(thumb: np.ndarray) -> str:
+    """Cache key: hash of the thumbnail quantized to 64 grey levels, so sensor-level noise maps to one key."""
+    quantized = (np.clip(thumb, 0, 255).astype(np.uint8) >> 2).tobytes()
+    return hashlib.blake2b(quantized + str(thumb.shape).encode(), digest_size=16).hexdigest()
+
+def frames_match(thumb: np.ndarray, previous: Optional[np.ndarray], tolerance: float = 8.0) -> bool:
+    """True when no downsampled block moved by more than `tolerance` grey levels."""
+    if previous is None or previous.shape != thumb.shape:
+        return False
+    return float(np.abs(thumb - previous).max()) <= tolerance
+
+
+class OCRCache:
+    """
+    OCR text in front of Tesseract: a frame that matches the previous one reuses its text
+    without even a lookup, and other frames are looked up by signature in an LRU cache.
+    Tracks hits, misses, skipped frames and an estimate of the OCR time saved (hits ×
+    the running mean of real OCR calls).
+    """
+
+    def __init__(self, capacity: int = 128, factor: int = 4, tolerance: float = 8.0):
+        self.capacity = capacity
+        self.factor = factor
+        self.tolerance = tolerance
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._previous: Optional[np.ndarray] = None
+        self._previous_text: Optional[str] = None
+        self._lock = threading.Lock()
+        self.unchanged = 0
+        self.hits = 0
+        self.misses = 0
+        self.ocr_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    @property
+    def mean_ocr_seconds(self) -> float:
+        return self.ocr_seconds / self.misses if self.misses else 0.0
+
+    def read(self, image: np.ndarray, ocr: Callable[[np.ndarray], str]) -> str:
+        thumb = thumbnail(image, self.factor)
+        with self._lock:
+            if self._previous_text is not None and frames_match(thumb, self._previous, self.tolerance):
+                self.unchanged += 1
+                self._credit("unchanged")
+                return self._previous_text
+            signature = frame_signature(thumb)
+            text = self._entries.get(signature)
+            if text is not None:
+                self._entries.move_to_end(signature)
+                self.hits += 1
+                self._credit("hit")
+                self._previous, self._previous_text = thumb, text
+                return text
+
+        started = time.perf_counter()
+        text = ocr(image)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.misses += 1
+            self.ocr_seconds += elapsed
+            METRICS.inc("ocr_cache_total", result="miss")
+            METRICS.observe("ocr_seconds", elapsed)
+            self._entries[signature] = text
+            self._entries.move_to_end(signature)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+            self._previous, self._previous_text = thumb, text
+        return text
+
+    def _credit(self, result: str):
+        saved = self.mean_ocr_seconds
+        self.saved_seconds += saved
+        METRICS.inc("ocr_cache_total", result=result)
+        METRICS.inc("ocr_seconds_saved_total", saved)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.unchanged + self.hits + self.misses
+        return {
+            "frames": lookups,
+            "unchanged": self.unchanged,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round((self.unchanged + self.hits) / lookups, 3) if lookups else 0.0,
+            "mean_ocr_ms": round(self.mean_ocr_seconds * 1000, 3),
+            "saved_seconds": round(self.saved_seconds, 3),
+            "entries": len(self._entries),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._previous = self._previous_text = None
+
+
+# Whole-frame reader: io.ocr.read_screen_text(..., tiled=False)
+OCR_CACHE = OCRCache()
+
+
+# --- Tile-based incremental OCR ---
+
+def prepare_tile(tile: np.ndarray, scale: float = 0.75) -> np.ndarray:
+    """Grayscale uint8 tile, downscaled by `scale` (area averaging) before it goes to OCR."""
+    gray = np.clip(to_grayscale(tile), 0, 255).astype(np.uint8)
+    if scale >= 1.0:
+        return gray
+    cv2 = optional_import("cv2")
+    if cv2 is not None:
+        return cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    # Without OpenCV only whole-number reductions are done, by block mean
+    factor = int(round(1 / scale))
+    return thumbnail(gray, factor).astype(np.uint8) if factor > 1 else gray
+
+
+class TiledOCR:
+    """
+    Incremental OCR over a grid of tiles. Every frame is compared tile by tile with the
+    previous one on a shared block-mean thumbnail. Clean tiles keep their previous text,
+    blank tiles (no contrast) are skipped, and dirty tiles are looked up in an LRU cache
+    keyed by tile signature, so content that scrolls into another tile is still reused.
+    Only the remaining misses are grayscaled, downscaled and sent to OCR. Tile texts are
+    stitched back row by row, so OCR time follows how much of the screen changed, not its
+    resolution. Text lines cut by a tile edge are read as two fragments.
+    """
+
+    def __init__(self, tile_height: int = 128, tile_width: int = 512, factor: int = 4, tolerance: float = 8.0,
+                 cache_capacity: int = 1024, ocr_scale: float = 0.75, blank_contrast: float = 3.0):
+        self.tile_height = max(tile_height // factor, 1) * factor
+        self.tile_width = max(tile_width // factor, 1) * factor
+        self.factor = factor
+        self.tolerance = tolerance
+        self.cache_capacity = cache_capacity
+        self.ocr_scale = ocr_scale
+        self.blank_contrast = blank_contrast
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._previous: Dict[tuple, tuple] = {}  # (row, col) → (thumbnail, text)
+        self._shape = None
+        self._lock = threading.Lock()
+        self.counts = {"clean": 0, "blank": 0, "hit": 0, "miss": 0}
+        self.frames = 0
+        self.ocr_seconds = 0.0
+
+    def read(self, image: np.ndarray, ocr: Callable[[np.ndarray], str]) -> str:
+        with self._lock:
+            return self._read(image, ocr)
+
+    def _read(self, image: np.ndarray, ocr: Callable[[np.ndarray], str]) -> str:
+        self.frames += 1
+        if image.shape != self._shape:
+            self._previous.clear()  # resolution changed: no tile lines up with the last frame
+            self._shape = image.shape
+        thumb = thumbnail(image, self.factor)
+        th, tw = self.tile_height // self.factor, self.tile_width // self.factor
+        rows = []
+        for row, top in enumerate(range(0, image.shape[0], self.tile_height)):
+            texts = []
+            for col, left in enumerate(range(0, image.shape[1], self.tile_width)):
+                tile_thumb = thumb[row * th:(row + 1) * th, col * tw:(col + 1) * tw]
+                text = self._tile_text((row, col), tile_thumb, ocr,
+                                       lambda: image[top:top + self.tile_height, left:left + self.tile_width])
+                if text:
+                    texts.append(text)
+            if texts:
+                rows.append(" ".join(texts))
+        return "\n".join(rows)
+
+    def _tile_text(self, position, tile_thumb: np.ndarray, ocr, crop) -> str:
+        previous = self._previous.get(position)
+        if previous is not None and frames_match(tile_thumb, previous[0], self.tolerance):
+            return self._count("clean", previous[1])
+        if tile_thumb.size == 0 or float(tile_thumb.std()) < self.blank_contrast:
+            self._previous[position] = (tile_thumb, "")
+            return self._count("blank", "")
+
+        signature = frame_signature(tile_thumb)
+        text = self._cache.get(signature)
+        if text is not None:
+            self._cache.move_to_end(signature)
+            self._previous[position] = (tile_thumb, text)
+            return self._count("hit", text)
+
+        started = time.perf_counter()
+        text = ocr(prepare_tile(crop(), self.ocr_scale)).strip()
+        elapsed = time.perf_counter() - started
+        self.ocr_seconds += elapsed
+        METRICS.observe("ocr_seconds", elapsed, unit="tile")
+        self._cache[signature] = text
+        while len(self._cache) > self.cache_capacity:
+            self._cache.popitem(last=False)
+        self._previous[position] = (tile_thumb, text)
+        return self._count("miss", text)
+
+    def _count(self, result: str, text: str) -> str:
+        self.counts[result] += 1
+        METRICS.inc("ocr_tiles_total", result=result)
+        return text
+
+    def stats(self) -> Dict[str, Any]:
+        tiles = sum(self.counts.values())
+        return {
+            "frames": self.frames,
+            "tiles": tiles,
+            **self.counts,
+            "ocr_fraction": round(self.counts["miss"] / tiles, 3) if tiles else 0.0,
+            "ocr_seconds": round(self.ocr_seconds, 3),
+            "entries": len(self._cache),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._previous.clear()
+            self._shape = None
+
+
+# Default reader for the feather and io.ocr capture paths
+TILED_OCR = TiledOCR()
@@ -1,17 +1,25 @@
 # samurai_bluebird_custos/io/ocr.py
 
-import pytesseract
-from samurai_bluebird_custos.io.image_analysis import capture_screenshot
+from samurai_bluebird_custos.io.capabilities import capability_profile, load_pytesseract
+from samurai_bluebird_custos.io.image_analysis import capture_screenshot, OCR_CACHE, TILED_OCR
 
-# Set Tesseract path (Windows example)
-pytesseract.pytesseract.tesseract_cmd = r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
+def tesseract_ocr(image):
+    """Run Tesseract on a frame (pytesseract is imported and pointed at the binary on first use)."""
+    return load_pytesseract().image_to_string(image).strip()
+
+def read_screen_text(image, ocr=tesseract_ocr, tiled=True):
+    """
+    OCR a frame. Tiled (default): only changed, uncached tiles are re-read. Whole-frame:
+    the previous text is reused when the screen has not changed or the frame is cached.
+    """
+    return (TILED_OCR if tiled else OCR_CACHE).read(image, ocr)
 
 def extract_text_from_screenshot():
     """Run OCR on a screenshot and return extracted text."""
-    image = capture_screenshot()
+    if not capability_profile().ocr:
+        return "[OCR unavailable]"
     try:
-        text = pytesseract.image_to_string(image)
-        return text.strip()
+        return read_screen_text(capture_screenshot())
     except Exception as e:
         print(f"⚠️ OCR failed: {e}")
         return "[OCR unavailable]"
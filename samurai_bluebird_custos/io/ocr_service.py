@@ -0,0 +1,315 @@
+# samurai_bluebird_custos/io/ocr_service.py
+
+"""
+Out-of-process OCR so a slow or hung Tesseract never stalls capture.
+
+Frames are OCRed in a process pool behind a bounded job queue. A capture submits the
+frame and moves on; its snapshot carries a marker instead of the text:
+
+    {"screenshot_text": "[OCR pending]", "ocr_job": 17, "ocr_status": "pending"}
+
+When the job finishes, the snapshot it was attached to is updated in place and the result
+is appended to `ocr_results_log.txt`, keyed by job id and snapshot timestamp, so late text
+still reaches the batch record. A job still running at its deadline is marked timed out
+(`"[OCR timed out]"`), and the worker pool is terminated and rebuilt so a hung Tesseract
+cannot hold a worker; other unfinished jobs are resubmitted to the new pool with what is left of their own
+deadline, and those with nothing left are timed out too. With the queue full, the oldest job
+that has not started yet is cancelled to make room: the newest screen is the one worth
+reading. If every queued job is already running, the new frame is skipped.
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+from samurai_bluebird_custos.core.resonance_logger import LOG_DIR, log_all
+from samurai_bluebird_custos.utils.metrics import METRICS
+
+OCR_RESULTS_LOG = "ocr_results_log.txt"
+
+MARKERS = {
+    "pending": "[OCR pending]",
+    "timed_out": "[OCR timed out]",
+    "cancelled": "[OCR superseded]",
+    "skipped": "[OCR skipped: queue full]",
+    "error": "[Screenshot OCR unavailable]",
+}
+
+
+def ocr_frame(image, timeout: float) -> str:
+    """
+    Worker-side OCR: incremental tiled read within a `timeout` budget for the whole frame.
+    Each tile's Tesseract call is killed after whatever budget is left, so a job cannot
+    run for tiles × timeout. The tile cache lives in the worker process, so it persists
+    across jobs.
+    """
+    from samurai_bluebird_custos.io.ocr import read_screen_text, tesseract_ocr
+    from samurai_bluebird_custos.io.capabilities import load_pytesseract
+
+    deadline = time.monotonic() + timeout
+
+    def ocr(tile):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"OCR budget of {timeout}s spent")
+        return load_pytesseract().image_to_string(tile, timeout=remaining).strip()
+
+    return read_screen_text(image, ocr if timeout else tesseract_ocr)
+
+
+class OCRJob:
+    def __init__(self, job_id: int, deadline_seconds: float):
+        self.job_id = job_id
+        self.submitted = time.monotonic()
+        self.deadline_seconds = deadline_seconds
+        self.status = "pending"
+        self.text: Optional[str] = None
+        self.image: Any = None  # kept while unfinished, to resubmit after a pool rebuild
+        self.future: Optional[Future] = None
+        self.timer: Optional[threading.Timer] = None
+        self.snapshots: List[Dict[str, Any]] = []
+        self.callbacks: List[Callable[["OCRJob"], None]] = []
+
+    @property
+    def finished(self) -> bool:
+        return self.status != "pending"
+
+    def marker(self) -> Dict[str, Any]:
+        return {"screenshot_text": self.text if self.status == "done" else MARKERS[self.status],
+                "ocr_job": self.job_id, "ocr_status": self.status}
+
+
+class OCRService:
+    """
+    - workers: OCR processes; the pool is created on first submit and rebuilt if it breaks.
+    - max_queue: outstanding jobs (queued or running) before older queued ones are cancelled.
+    - deadline_seconds: per-job budget from submission; also the worker's Tesseract budget.
+    - ocr: picklable `ocr(image, timeout) -> str` run in the workers.
+    - log_dir: where `ocr_results_log.txt` is written (tenants pass their own).
+    Result logging and `on_result` callbacks run after the service lock is released.
+    """
+
+    def __init__(self, workers: int = 1, max_queue: int = 4, deadline_seconds: float = 10.0,
+                 ocr: Callable[[Any, float], str] = ocr_frame, log_results: bool = True,
+                 log_dir: str = LOG_DIR):
+        self.workers = max(workers, 1)
+        self.max_queue = max(max_queue, 1)
+        self.deadline_seconds = deadline_seconds
+        self.ocr = ocr
+        self.log_results = log_results
+        self.log_dir = log_dir
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs: "OrderedDict[int, OCRJob]" = OrderedDict()
+        self._settled: List[OCRJob] = []  # settled under the lock, published after it
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _start(self, job: OCRJob, budget: Optional[float] = None):
+        budget = self.deadline_seconds if budget is None else budget
+        try:
+            job.future = self._pool().submit(self.ocr, job.image, budget)
+        except BrokenProcessPool:
+            self._executor = None
+            job.future = self._pool().submit(self.ocr, job.image, budget)
+        job.future.add_done_callback(lambda future, job=job: self._complete(job, future))
+
+    def submit(self, image, snapshot: Optional[Dict[str, Any]] = None,
+               on_result: Optional[Callable[[OCRJob], None]] = None) -> OCRJob:
+        """
+        Queue a frame for OCR and return at once. `snapshot`, if given, receives the marker now
+        and the text (or a timed-out marker) when the job settles.
+        """
+        try:
+            with self._lock:
+                job = OCRJob(next(self._ids), self.deadline_seconds)
+                if on_result:
+                    job.callbacks.append(on_result)
+                if len(self._jobs) >= self.max_queue and not self._make_room():
+                    job.status = "skipped"
+                    METRICS.inc("ocr_jobs_total", status="skipped")
+                    if snapshot is not None:
+                        self._attach_locked(job, snapshot)
+                    return job
+                job.image = image
+                self._jobs[job.job_id] = job
+                # Attach before starting: a job that finishes at once settles straight into it
+                if snapshot is not None:
+                    self._attach_locked(job, snapshot)
+                job.timer = threading.Timer(self.deadline_seconds, self._expire, (job,))
+                job.timer.daemon = True
+                job.timer.start()
+                self._start(job)
+                return job
+        finally:
+            self._publish()
+
+    def attach(self, snapshot: Dict[str, Any]) -> Optional[OCRJob]:
+        """
+        Bind a snapshot carrying an `ocr_job` marker to its job, so the result lands in it.
+        """
+        with self._lock:
+            job = self._jobs.get(snapshot.get("ocr_job"))
+            if job is not None:
+                self._attach_locked(job, snapshot)
+            return job
+
+    def _attach_locked(self, job: OCRJob, snapshot: Dict[str, Any]):
+        snapshot.update(job.marker())
+        if not job.finished:
+            job.snapshots.append(snapshot)
+
+    def _make_room(self) -> bool:
+        for queued in list(self._jobs.values()):
+            if queued.future is not None and queued.future.cancel():
+                # cancel() succeeds only for jobs no worker has picked up yet
+                self._settle(queued, "cancelled")
+                return True
+        return False
+
+    def _complete(self, job: OCRJob, future: Future):
+        with self._lock:
+            if future.cancelled() or future is not job.future:
+                # Cancelled: whoever cancelled it settles the job. Replaced: the job was
+                # resubmitted after a pool rebuild and its new future will settle it.
+                return
+            if job.finished:
+                if job.status == "timed_out":
+                    METRICS.inc("ocr_jobs_total", status="late_discarded")
+                return
+            try:
+                text = future.result()
+            except Exception as e:
+                print(f"⚠️ OCR job {job.job_id} failed: {e}")
+                if isinstance(e, BrokenProcessPool):
+                    self._executor = None
+                self._settle(job, "error")
+            else:
+                job.text = text
+                self._settle(job, "done")
+        self._publish()
+
+    def _expire(self, job: OCRJob):
+        with self._lock:
+            if job.finished:
+                return
+            print(f"⏳ OCR job {job.job_id} missed its {job.deadline_seconds}s deadline.")
+            running = job.future is not None and not job.future.cancel()
+            self._settle(job, "timed_out")
+            if running:
+                # cancel() cannot stop a job a worker has picked up; without this a hung
+                # Tesseract would hold the worker until the queue filled and new frames were skipped
+                self._rebuild_pool()
+        self._publish()
+
+    def _rebuild_pool(self):
+        """
+        Terminate the worker processes and resubmit every unfinished job to a fresh pool,
+        with the time left before its deadline as the worker's budget.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            for process in list((getattr(executor, "_processes", None) or {}).values()):
+                process.terminate()
+            executor.shutdown(wait=False, cancel_futures=True)
+        METRICS.inc("ocr_pool_rebuilds_total")
+        print("♻️ OCR worker pool rebuilt after a stuck job.")
+        now = time.monotonic()
+        for job in list(self._jobs.values()):
+            remaining = job.submitted + job.deadline_seconds - now
+            if remaining <= 0:
+                # Its own timer is due; there is no budget left to spend on the new pool
+                print(f"⏳ OCR job {job.job_id} missed its {job.deadline_seconds}s deadline.")
+                self._settle(job, "timed_out")
+                continue
+            self._start(job, remaining)
+
+    def _settle(self, job: OCRJob, status: str):
+        job.status = status
+        job.image = None
+        if job.timer is not None:
+            job.timer.cancel()
+        self._jobs.pop(job.job_id, None)
+        METRICS.inc("ocr_jobs_total", status=status)
+        METRICS.observe("ocr_job_seconds", time.monotonic() - job.submitted, status=status)
+        for snapshot in job.snapshots:
+            snapshot.update(job.marker())
+        self._settled.append(job)
+
+    def _publish(self):
+        """
+        Log and call back settled jobs. Runs without the service lock, so file I/O and
+        callbacks never hold up `submit` or `attach`.
+        """
+        while True:
+            with self._lock:
+                if not self._settled:
+                    return
+                jobs, self._settled = self._settled, []
+            for job in jobs:
+                if self.log_results and job.snapshots:
+                    log_all(json.dumps({
+                        "ocr_job": job.job_id,
+                        "ocr_status": job.status,
+                        "snapshot_timestamp": job.snapshots[0].get("timestamp"),
+                        "screenshot_text": job.marker()["screenshot_text"],
+                    }), OCR_RESULTS_LOG, self.log_dir)
+                for callback in job.callbacks:
+                    try:
+                        callback(job)
+                    except Exception as e:
+                        print(f"⚠️ OCR result callback failed: {e}")
+
+    @property
+    def outstanding(self) -> int:
+        return len(self._jobs)
+
+    def close(self):
+        with self._lock:
+            for job in list(self._jobs.values()):
+                if job.future is not None:
+                    job.future.cancel()
+                self._settle(job, "cancelled")
+            executor, self._executor = self._executor, None
+        self._publish()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def submit_screenshot(service: OCRService) -> Dict[str, Any]:
+    """
+    Grab the screen and queue it for OCR; returns the snapshot fields to merge (text marker and job id).
+    """
+    from samurai_bluebird_custos.io.image_analysis import capture_screenshot
+    return service.submit(capture_screenshot()).marker()
+
+
+_shared: Dict[str, OCRService] = {}
+_shared_lock = threading.Lock()
+
+
+def get_ocr_service(log_dir: str = LOG_DIR) -> OCRService:
+    """
+    The process-wide OCR service for `log_dir`; tenants get their own, logging under their logs dir.
+    """
+    with _shared_lock:
+        if log_dir not in _shared:
+            _shared[log_dir] = OCRService(log_dir=log_dir)
+        return _shared[log_dir]
+
+
+def close_ocr_service():
+    with _shared_lock:
+        services = list(_shared.values())
+        _shared.clear()
+    for service in services:
+        service.close()
@@ -1,28 +1,40 @@
-import psutil
 import random
-from datetime import datetime
+from typing import Dict, Optional
+
+from samurai_bluebird_custos.core.resonance_logger import LOG_DIR
+from samurai_bluebird_custos.io.capabilities import capability_profile
+from samurai_bluebird_custos.io.feathers import build_feather_collector
+from samurai_bluebird_custos.io.ocr_service import OCRService, get_ocr_service
+from samurai_bluebird_custos.io.samplers import BackgroundSamplers, get_background_samplers
+from samurai_bluebird_custos.utils.metrics import span
 
 class PassiveInputManager:
-    def __init__(self):
+    def __init__(self, window_seconds: float = 5.0, samplers: Optional[BackgroundSamplers] = None,
+                 timeouts: Optional[Dict[str, float]] = None, ocr_service: Optional[OCRService] = None,
+                 log_dir: str = LOG_DIR):
+        # CPU, memory, keystrokes and window title are sampled continuously in the background;
+        # a capture aggregates the last `window_seconds` of readings instead of blocking
+        self.window_seconds = window_seconds
+        self.samplers = samplers or get_background_samplers()
+        # With OCR available, frames go to the out-of-process OCR service and the snapshot
+        # carries a pending marker; the text is attached when the job finishes
+        self.ocr_service = ocr_service or (get_ocr_service(log_dir) if capability_profile().ocr else None)
+        # Feathers run concurrently, so a capture costs the slowest feather, not the sum
+        self.collector = build_feather_collector(self.samplers, self.ocr_service, timeouts,
+                                                 read_window=self.get_active_window,
+                                                 read_keystrokes=self.get_keystroke_burst,
+                                                 read_screen=self.get_screenshot_text)
         print("🪶 PassiveInputManager initialized.")
 
-    def capture(self) -> dict:
+    def capture(self, window_seconds: Optional[float] = None) -> dict:
         """
         Capture a passive snapshot of the current system state.
         """
-        try:
-            active_window = self.get_active_window()
-        except Exception:
-            active_window = "IdleState"
-
-        snapshot = {
-            "active_window": active_window,
-            "keystroke_burst": self.get_keystroke_burst(),
-            "screenshot_text": self.get_screenshot_text(),
-            "cpu_usage": psutil.cpu_percent(interval=1),
-            "memory_usage": psutil.virtual_memory().percent,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
+        with span("capture"):
+            # The window travels with this capture's probes, so overlapping captures don't race
+            snapshot = self.collector.collect(window_seconds or self.window_seconds)
+        if self.ocr_service and "ocr_job" in snapshot:
+            self.ocr_service.attach(snapshot)
         print(f"📥 Captured snapshot: {snapshot}")
         return snapshot
 
@@ -0,0 +1,222 @@
+# samurai_bluebird_custos/io/samplers.py
+
+"""
+Background samplers for passive input signals.
+
+Each signal (CPU, memory, keystrokes, active window) is read on its own lightweight daemon
+thread into a fixed-size ring buffer of (timestamp, value) readings. A capture then
+aggregates whatever window it asks for from the buffers and returns immediately, instead
+of blocking on `psutil.cpu_percent(interval=1)` or a 5-second keyboard listen.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import psutil
+
+from samurai_bluebird_custos.io.capabilities import capability_profile, optional_import
+from samurai_bluebird_custos.utils.metrics import METRICS
+
+Reading = Tuple[float, Any]
+
+
+class RingBuffer:
+    """
+    The newest `capacity` readings; older ones fall off the front.
+    """
+
+    def __init__(self, capacity: int):
+        self._readings: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def append(self, value: Any, timestamp: Optional[float] = None):
+        with self._lock:
+            self._readings.append((time.monotonic() if timestamp is None else timestamp, value))
+
+    def window(self, seconds: float, now: Optional[float] = None) -> List[Reading]:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return [(stamp, value) for stamp, value in self._readings if now - stamp <= seconds]
+
+    def latest(self) -> Optional[Reading]:
+        with self._lock:
+            return self._readings[-1] if self._readings else None
+
+    def __len__(self) -> int:
+        return len(self._readings)
+
+
+def _mean(values: List[Any]) -> float:
+    return round(sum(values) / len(values), 1)
+
+
+AGGREGATES: Dict[str, Callable[[List[Any]], Any]] = {
+    "mean": _mean,
+    "max": max,
+    "sum": sum,
+    "last": lambda values: values[-1],
+}
+
+
+class Sampler:
+    """
+    Calls `read()` every `interval_seconds` on a daemon thread and keeps the results.
+    `aggregate` combines the readings inside a window; with none yet in range it falls
+    back to the latest reading, or to one immediate `read()` when `read` is cheap.
+    """
+
+    def __init__(self, name: str, read: Callable[[], Any], interval_seconds: float = 0.5,
+                 capacity: int = 1200, aggregate: str = "mean", read_on_demand: bool = True,
+                 first_delay: float = 0.0):
+        self.name = name
+        self.read = read
+        self.interval_seconds = interval_seconds
+        self.buffer = RingBuffer(capacity)
+        self.how = aggregate
+        self.read_on_demand = read_on_demand
+        self.first_delay = first_delay
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "Sampler":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=f"Sampler-{self.name}", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(self.interval_seconds * 2, 1.0))
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def sample(self):
+        try:
+            self.buffer.append(self.read())
+        except Exception as e:
+            METRICS.inc("sampler_errors_total", sampler=self.name)
+            print(f"⚠️ Sampler {self.name} failed: {e}")
+
+    def _run(self):
+        if self.first_delay:
+            self._stop.wait(self.first_delay)
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval_seconds)
+
+    def aggregate(self, window_seconds: float, default: Any = None) -> Any:
+        values = [value for _, value in self.buffer.window(window_seconds)]
+        if not values:
+            latest = self.buffer.latest()
+            if latest is not None:
+                return latest[1]
+            if not self.read_on_demand:
+                return default
+            try:
+                return self.read()
+            except Exception:
+                return default
+        return AGGREGATES[self.how](values)
+
+
+class KeystrokeCounter:
+    """
+    Counts key presses from a pynput listener; `take()` returns the count since the last call.
+    """
+
+    def __init__(self):
+        self._count = 0
+        self._lock = threading.Lock()
+        self._listener = None
+
+    def start(self) -> bool:
+        keyboard = optional_import("pynput.keyboard") if capability_profile().keyboard else None
+        if keyboard is None:
+            return False
+        self._listener = keyboard.Listener(on_press=self._on_press)
+        self._listener.start()
+        return True
+
+    def _on_press(self, key):
+        with self._lock:
+            self._count += 1
+
+    def take(self) -> int:
+        with self._lock:
+            count, self._count = self._count, 0
+        return count
+
+    def stop(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+
+def _read_active_window() -> str:
+    win32gui = optional_import("win32gui")
+    return win32gui.GetWindowText(win32gui.GetForegroundWindow()) if win32gui else "UnknownWindow"
+
+
+class BackgroundSamplers:
+    """
+    One sampler per passive signal. Keyboard and window samplers are only started when the
+    capability profile says this machine has them; `aggregate` leaves those signals out otherwise.
+    """
+
+    def __init__(self, interval_seconds: float = 0.5, history_seconds: float = 600.0):
+        capacity = max(int(history_seconds / interval_seconds), 1)
+        # Prime psutil: each non-blocking CPU reading covers the time since the previous call,
+        # so the sampler's first reading waits one interval rather than measuring ~0 seconds
+        psutil.cpu_percent(interval=None)
+        self.samplers: Dict[str, Sampler] = {
+            "cpu_usage": Sampler("cpu", lambda: psutil.cpu_percent(interval=None), interval_seconds, capacity,
+                                 first_delay=interval_seconds),
+            "memory_usage": Sampler("memory", lambda: psutil.virtual_memory().percent, interval_seconds, capacity),
+        }
+        self.keystrokes = KeystrokeCounter()
+        if self.keystrokes.start():
+            # Counts per interval, summed over the requested window; never read on demand
+            self.samplers["keystroke_burst"] = Sampler("keystrokes", self.keystrokes.take, interval_seconds,
+                                                       capacity, aggregate="sum", read_on_demand=False)
+        if capability_profile().active_window:
+            self.samplers["active_window"] = Sampler("window", _read_active_window, 1.0,
+                                                     max(int(history_seconds), 1), aggregate="last")
+        for sampler in self.samplers.values():
+            sampler.start()
+
+    def aggregate(self, window_seconds: float = 5.0) -> Dict[str, Any]:
+        return {name: sampler.aggregate(window_seconds, default=0 if name == "keystroke_burst" else None)
+                for name, sampler in self.samplers.items()}
+
+    def stop(self):
+        for sampler in self.samplers.values():
+            sampler.stop()
+        self.keystrokes.stop()
+
+
+_shared: Dict[str, BackgroundSamplers] = {}
+_shared_lock = threading.Lock()
+
+
+def get_background_samplers() -> BackgroundSamplers:
+    """
+    The process-wide samplers, started on first use, so every capture path shares one set of threads.
+    """
+    with _shared_lock:
+        if "samplers" not in _shared:
+            _shared["samplers"] = BackgroundSamplers()
+        return _shared["samplers"]
+
+
+def stop_background_samplers():
+    with _shared_lock:
+        samplers = _shared.pop("samplers", None)
+    if samplers is not None:
+        samplers.stop()
@@ -4,7 +4,9 @@ import json
 import time
 import os
 
-def load_simulated_workday(file_path="samurai_bluebird_custos/mock_mode/simulated_workday.json"):
+SIMULATED_WORKDAY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "simulated_workday.json")
+
+def load_simulated_workday(file_path=SIMULATED_WORKDAY_FILE):
     """Load simulated workday JSON data."""
     if not os.path.exists(file_path):
         print("⚠️ Simulated workday file not found.")
@@ -12,12 +14,13 @@ def load_simulated_workday(file_path="samurai_bluebird_custos/mock_mode/simulate
     with open(file_path, "r") as f:
         return json.load(f)
 
-def run_simulated_workday():
-    """Run through simulated workday inputs with delays."""
+def run_simulated_workday(delay_seconds=0.0):
+    """Run through simulated workday inputs, optionally pausing between them."""
     workday = load_simulated_workday()
     if not workday:
         print("⚠️ No simulated data to run.")
         return
     for entry in workday:
         print(f"Simulated Input: {entry}")
-        time.sleep(1)  # Delay to simulate time between inputs
+        if delay_seconds:
+            time.sleep(delay_seconds)  # Delay to simulate time between inputs
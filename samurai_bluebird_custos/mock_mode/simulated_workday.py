@@ -2,27 +2,25 @@
 
 from samurai_bluebird_custos.agents.tri_agent import TriAgent
 from samurai_bluebird_custos.ethics.krishna import KrishnaMetaObserver
+from samurai_bluebird_custos.mock_mode.workload_generator import SyntheticWorkload
 import time
 
-def run_simulated_workday():
+def run_simulated_workday(batches=3, seed=0, delay_seconds=0.0):
     tri_agent = TriAgent()
     krishna = KrishnaMetaObserver()
+    workload = SyntheticWorkload(seed)
 
-    for i in range(3):  # Simulate 3 passive input batches
+    for i in range(batches):  # Simulated passive input batches
         print(f"\n🌱 Simulated Batch #{i + 1}")
 
-        dummy_input = {
-            "tags": ["Focus", "Trust", "Innovation"],
-            "weights": {"Focus": 1.0 + i * 0.1, "Trust": 1.1, "Innovation": 1.2}
-        }
-
-        tri_result = tri_agent.reason_over_batch(dummy_input)
+        tri_result = tri_agent.reason_over_batch(workload.next_snapshot())
         print("🧠 Tri-Agent Output:", tri_result["narrative"])
 
         krishna_result = krishna.process_lattice_reflection()
         print("👁 Krishna Reflection:", krishna_result["daily_reflection"])
 
-        time.sleep(1)  # Short pause between batches
+        if delay_seconds:
+            time.sleep(delay_seconds)  # Optional pause between batches for demos
 
 if __name__ == "__main__":
     run_simulated_workday()
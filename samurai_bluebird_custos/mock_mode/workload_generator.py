@@ -0,0 +1,274 @@
+# samurai_bluebird_custos/mock_mode/workload_generator.py
+
+"""
+Seeded synthetic workload for load and soak testing.
+
+    python -m samurai_bluebird_custos.mock_mode.workload_generator --count 20000 --rate 2000
+    python -m samurai_bluebird_custos.mock_mode.workload_generator --duration 600 --mode micro_batch
+    python -m samurai_bluebird_custos.mock_mode.workload_generator --count 5000 --tenants 50 --dump load.jsonl
+
+Snapshots follow a simulated clock, not the wall clock, so generation never sleeps. A day
+moves through work sessions (editor, browser, terminal, chat...), each with its own CPU,
+typing and tag profile. Tags are drawn from the sovereignty, chakra and context-domain
+datasets with a skewed (Zipf-like) popularity, so a few themes dominate, as in real logs.
+The same seed always produces the same stream.
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+FRAMEWORKS_DIR = Path(__file__).resolve().parent.parent / "frameworks"
+
+# (active window, CPU baseline %, typing intensity in keys/second, OCR phrases)
+ACTIVITIES = [
+    ("VSCode - samurai_bluebird_custos", 18, 3.5,
+     ["def process_batch(self, enriched_batch):", "Refactoring {tag} handling", "TODO: review {tag} flow"]),
+    ("Terminal", 12, 2.0, ["$ python -m pytest -q", "{n} passed in 4.{n}s", "git commit -m \"{tag}\""]),
+    ("Chrome - Docs", 25, 0.8, ["Reading about {tag} and {tag2}", "Notes on {tag}", "Search: {tag} practices"]),
+    ("Slack", 15, 2.5, ["@team quick sync on {tag}?", "Thanks for the {tag} update", "Standup: {tag}, {tag2}"]),
+    ("Notion", 10, 1.5, ["Weekly review: {tag}", "Goals - {tag} / {tag2}", "Journal: feeling {tag}"]),
+    ("Zoom Meeting", 35, 0.3, ["Screen share - {tag} roadmap", "Participants ({n})", "Agenda: {tag}"]),
+]
+# Typical OCR misreads, applied sparingly
+OCR_CONFUSIONS = {"l": "1", "O": "0", "rn": "m", "e": "c", "S": "5"}
+
+
+def load_tag_vocabulary(frameworks_dir: Path = FRAMEWORKS_DIR) -> List[str]:
+    """
+    Sovereignty names and light/dark aspects, chakra qualities and context-domain themes.
+    """
+    tags: List[str] = []
+
+    def read(name):
+        try:
+            with open(frameworks_dir / name, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    for name, archetype in read("sovereignties_dataset.json").items():
+        tags += [name, archetype.get("light"), archetype.get("dark")]
+    for chakra in read("chakra_definitions.json").values():
+        tags += chakra.get("qualities", [])
+    for domain in read("context_domains.json").values():
+        tags += domain.get("themes", [])
+    return list(dict.fromkeys(tag for tag in tags if tag)) or ["Focus", "Trust", "Innovation"]
+
+
+class SyntheticWorkload:
+    """
+    Deterministic stream of kernel snapshots.
+    - step_seconds: simulated time between snapshots (the capture interval).
+    - session_minutes: mean length of one activity session before switching apps.
+    """
+
+    def __init__(self, seed: int = 0, start: str = "2025-07-15 09:00:00", step_seconds: float = 5.0,
+                 session_minutes: float = 25.0, vocabulary: Optional[List[str]] = None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.clock = datetime.strptime(start, "%Y-%m-%d %H:%M:%S")
+        self.step = timedelta(seconds=step_seconds)
+        self.session_minutes = session_minutes
+        self.vocabulary = vocabulary or load_tag_vocabulary()
+        # Zipf-like popularity over a seeded ranking of the vocabulary
+        ranking = self.vocabulary[:]
+        self.rng.shuffle(ranking)
+        self.tag_weights = {tag: 1.0 / (rank + 1) ** 1.1 for rank, tag in enumerate(ranking)}
+        self.memory_usage = self.rng.uniform(35, 55)
+        self.generated = 0
+        self._start_session()
+
+    def _start_session(self):
+        self.activity = self.rng.choice(ACTIVITIES)
+        self.session_left = max(int(self.rng.expovariate(1 / self.session_minutes) * 60 / self.step.total_seconds()), 1)
+        # Each session leans on a handful of themes
+        population = list(self.tag_weights)
+        self.session_tags = list(dict.fromkeys(
+            self.rng.choices(population, weights=list(self.tag_weights.values()), k=6)))
+
+    def _energy(self) -> float:
+        """
+        Daily activity curve in [0.2, 1]: ramps up in the morning, dips after lunch.
+        """
+        hour = self.clock.hour + self.clock.minute / 60
+        curve = math.sin(math.pi * min(max((hour - 7) / 12, 0), 1))
+        if 12.5 <= hour < 13.5:
+            curve *= 0.4
+        return 0.2 + 0.8 * curve
+
+    def _ocr_text(self, tags: List[str]) -> str:
+        _, _, _, phrases = self.activity
+        text = self.rng.choice(phrases).format(
+            tag=tags[0], tag2=tags[-1], n=self.rng.randint(2, 99))
+        if self.rng.random() < 0.15:
+            wrong, right = self.rng.choice(list(OCR_CONFUSIONS.items()))
+            text = text.replace(wrong, right, 1)
+        return text
+
+    def next_snapshot(self) -> Dict[str, Any]:
+        if self.session_left <= 0:
+            self._start_session()
+        self.session_left -= 1
+        window, cpu_base, typing_rate, _ = self.activity
+        energy = self._energy()
+
+        tags = self.rng.sample(self.session_tags, min(len(self.session_tags), self.rng.randint(2, 4)))
+        if self.rng.random() < 0.2:
+            tags.append(self.rng.choice(self.vocabulary))  # stray theme outside the session focus
+        tags = list(dict.fromkeys(tags))
+
+        spike = self.rng.uniform(20, 50) if self.rng.random() < 0.03 else 0.0
+        cpu = cpu_base * (0.6 + 0.6 * energy) + self.rng.gauss(0, 4) + spike
+        self.memory_usage = min(max(self.memory_usage + self.rng.gauss(0.05, 0.6), 20), 92)
+        keystrokes = int(self.rng.gammavariate(2, typing_rate * energy * self.step.total_seconds() / 2))
+
+        snapshot = {
+            "active_window": window,
+            "keystroke_burst": keystrokes,
+            "screenshot_text": self._ocr_text(tags),
+            "cpu_usage": round(min(max(cpu, 0.5), 100.0), 1),
+            "memory_usage": round(self.memory_usage, 1),
+            "tags": tags,
+            "weights": {tag: round(0.7 + 0.6 * self.rng.random() * (0.5 + energy), 2) for tag in tags},
+            "timestamp": self.clock.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self.clock += self.step
+        self.generated += 1
+        return snapshot
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        while True:
+            yield self.next_snapshot()
+
+    def snapshots(self, count: int) -> List[Dict[str, Any]]:
+        return [self.next_snapshot() for _ in range(count)]
+
+
+def paced(stream: Iterator[Dict[str, Any]], rate: Optional[float] = None,
+          count: Optional[int] = None, duration_seconds: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Release snapshots at up to `rate` per second (unthrottled when None), stopping after
+    `count` snapshots or `duration_seconds`, whichever comes first. Pacing is against an
+    absolute schedule, so a slow consumer is never made to wait to "catch up".
+    """
+    started = time.perf_counter()
+    for n, snapshot in enumerate(itertools.islice(stream, count)):
+        now = time.perf_counter()
+        if duration_seconds is not None and now - started >= duration_seconds:
+            return
+        if rate:
+            ahead = started + n / rate - now
+            if ahead > 0:
+                time.sleep(ahead)
+        yield snapshot
+
+
+def run_load(count: Optional[int] = 1000, rate: Optional[float] = None, seed: int = 0, mode: str = "pipeline",
+             duration_seconds: Optional[float] = None, window: int = 32, quiet: bool = True) -> Dict[str, Any]:
+    """
+    Drive the real TriAgent → BlueBox → AMSCore flow with a synthetic stream.
+    Lattices and logs live in a scratch directory, so the repo's own are untouched.
+    - mode: "sequential" (MainLoop.process), "pipeline" (staged workers) or
+      "micro_batch" (AMSCore.process_many over `window` snapshots).
+    """
+    from samurai_bluebird_custos.agents.ams_core import AMSCore
+    from samurai_bluebird_custos.agents.tri_agent import TriAgent
+    from samurai_bluebird_custos.core.main_loop import MainLoop
+    from samurai_bluebird_custos.symbolic.lattice_durability import DurabilityPolicy
+    from samurai_bluebird_custos.symbolic.recursive_memory_lattice import RecursiveSymbolicMemoryLattice, ResonanceLattice
+
+    if count is None and duration_seconds is None:
+        raise ValueError("run_load needs a count or a duration")
+    stream = paced(iter(SyntheticWorkload(seed)), rate, count, duration_seconds)
+    with tempfile.TemporaryDirectory(prefix="bluebird-load-") as workdir:
+        quiet_output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+        with quiet_output:
+            lattice = ResonanceLattice(os.path.join(workdir, "resonance_lattice.json"), persistence="wal")
+            lattice.set_durability(DurabilityPolicy(every_mutations=200))
+            memory = RecursiveSymbolicMemoryLattice(os.path.join(workdir, "recursive_symbolic_memory.json"))
+            log_dir = os.path.join(workdir, "logs")
+            loop = MainLoop(TriAgent(memory=memory), ams_core=AMSCore(lattice=lattice, log_dir=log_dir),
+                            log_dir=log_dir)
+            processed = 0
+            started = time.perf_counter()
+            if mode == "sequential":
+                for snapshot in stream:
+                    loop.process(snapshot)
+                    processed += 1
+            elif mode == "pipeline":
+                stats = loop.build_pipeline(backpressure="block").run(stream)
+                processed = stats["log"]["processed"]
+            elif mode == "micro_batch":
+                while True:
+                    chunk = list(itertools.islice(stream, window))
+                    if not chunk:
+                        break
+                    for context in loop.ams_many([loop.frameworks(loop.reason(s)) for s in chunk]):
+                        loop.log(context)
+                    processed += len(chunk)
+            else:
+                raise ValueError(f"Unknown load mode {mode!r}")
+            elapsed = time.perf_counter() - started
+            lattice.close()
+            node_count = lattice.node_count()
+    return {
+        "mode": mode,
+        "seed": seed,
+        "processed": processed,
+        "elapsed_seconds": round(elapsed, 3),
+        "snapshots_per_second": round(processed / elapsed, 2) if elapsed else 0.0,
+        "target_rate": rate,
+        "lattice_nodes": node_count,
+    }
+
+
+def dump_jsonl(path: str, count: int, seed: int = 0, tenants: int = 0):
+    """
+    Write `count` snapshots as JSON lines: plain snapshots for `samurai-bluebird daemon`, or
+    `{"tenant", "snapshot"}` records spread over `tenants` streams for `samurai-bluebird tenants`.
+    """
+    workloads = [SyntheticWorkload(seed + n) for n in range(max(tenants, 1))]
+    with (contextlib.nullcontext(sys.stdout) if path == "-" else open(path, "w")) as f:
+        for n in range(count):
+            if tenants:
+                record = {"tenant": f"tenant-{n % tenants:04d}", "snapshot": workloads[n % tenants].next_snapshot()}
+            else:
+                record = workloads[0].next_snapshot()
+            f.write(json.dumps(record) + "\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Samurai Bluebird synthetic workload generator")
+    parser.add_argument("--count", type=int, default=None, help="snapshots to generate (default: 1000 unless --duration)")
+    parser.add_argument("--duration", type=float, default=None, help="soak for this many seconds")
+    parser.add_argument("--rate", type=float, default=None, help="target snapshots per second (default: unthrottled)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=["sequential", "pipeline", "micro_batch"], default="pipeline")
+    parser.add_argument("--window", type=int, default=32, help="micro-batch size for --mode micro_batch")
+    parser.add_argument("--dump", help="write the stream as JSON lines to this file ('-' for stdout) instead of running it")
+    parser.add_argument("--tenants", type=int, default=0, help="with --dump: spread snapshots over N tenant streams")
+    args = parser.parse_args(argv)
+
+    count = args.count if args.count is not None or args.duration is not None else 1000
+    if args.dump:
+        dump_jsonl(args.dump, count or 1000, args.seed, args.tenants)
+        return 0
+    print(f"🧪 Load: mode={args.mode}, seed={args.seed}, rate={args.rate or 'max'}/s ...", file=sys.stderr)
+    print(json.dumps(run_load(count, args.rate, args.seed, args.mode, args.duration, args.window), indent=4))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
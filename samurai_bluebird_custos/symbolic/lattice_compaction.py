@@ -0,0 +1,263 @@
+# samurai_bluebird_custos/symbolic/lattice_compaction.py
+
+import json
+import re
+import time
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+NodeKey = Tuple[str, str]
+
+
+class CompactionPolicy:
+    """
+    What a compaction pass is allowed to reclaim. Every limit is optional.
+    - node_ttl_seconds: evict nodes not updated for this long.
+    - max_hooks_per_node: keep only the most recently seen hooks of each node.
+    - hook_similarity: merge hooks whose normalized text is at least this similar (0-1).
+      Runs after the hook cap, so its pairwise cost is bounded by max_hooks_per_node.
+    - max_nodes / max_bytes: global budget; the least recently updated nodes go first.
+    - slice_size: nodes examined per `run_slice` call.
+    - slice_seconds: time budget per `run_slice`; the sweep stops early (after at least
+      one node) and resumes from its cursor on the next call.
+    - protected_categories: never evicted (hooks are still trimmed and merged).
+    """
+
+    def __init__(self, node_ttl_seconds: Optional[float] = None, max_hooks_per_node: Optional[int] = None,
+                 hook_similarity: Optional[float] = None, max_nodes: Optional[int] = None,
+                 max_bytes: Optional[int] = None, slice_size: int = 200,
+                 slice_seconds: Optional[float] = None,
+                 protected_categories: Iterable[str] = ("ResonanceProcessed",)):
+        self.node_ttl_seconds = node_ttl_seconds
+        self.max_hooks_per_node = max_hooks_per_node
+        self.hook_similarity = hook_similarity
+        self.max_nodes = max_nodes
+        self.max_bytes = max_bytes
+        self.slice_size = max(int(slice_size), 1)
+        self.slice_seconds = slice_seconds
+        self.protected_categories = set(protected_categories)
+
+    def __repr__(self) -> str:
+        return (f"CompactionPolicy(node_ttl_seconds={self.node_ttl_seconds}, "
+                f"max_hooks_per_node={self.max_hooks_per_node}, hook_similarity={self.hook_similarity}, "
+                f"max_nodes={self.max_nodes}, max_bytes={self.max_bytes}, slice_size={self.slice_size}, "
+                f"slice_seconds={self.slice_seconds})")
+
+
+class CompactionReport:
+    """
+    What one full compaction pass reclaimed. Bytes are measured as compact JSON.
+    """
+
+    def __init__(self):
+        self.nodes_examined = 0
+        self.nodes_expired = 0
+        self.nodes_over_budget = 0
+        self.hooks_trimmed = 0
+        self.hooks_merged = 0
+        self.bytes_reclaimed = 0
+        self.slices = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def nodes_evicted(self) -> int:
+        return self.nodes_expired + self.nodes_over_budget
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "nodes_examined": self.nodes_examined,
+            "nodes_expired": self.nodes_expired,
+            "nodes_over_budget": self.nodes_over_budget,
+            "hooks_trimmed": self.hooks_trimmed,
+            "hooks_merged": self.hooks_merged,
+            "bytes_reclaimed": self.bytes_reclaimed,
+            "slices": self.slices,
+            "busy_seconds": round(self.busy_seconds, 4),
+        }
+
+    def __str__(self) -> str:
+        return (f"evicted {self.nodes_evicted} node(s) ({self.nodes_expired} expired, "
+                f"{self.nodes_over_budget} over budget), trimmed {self.hooks_trimmed} and merged "
+                f"{self.hooks_merged} hook(s), reclaimed ~{self.bytes_reclaimed} bytes "
+                f"in {self.slices} slice(s)")
+
+
+def node_size(node: Dict[str, Any]) -> int:
+    return len(json.dumps(node, separators=(",", ":"), default=str))
+
+
+def normalize_hook(hook: str) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", str(hook).casefold()).split())
+
+
+def merge_similar_hooks(hooks: List[str], similarity: float) -> List[str]:
+    """
+    Collapse near-duplicate hooks, keeping the most recently seen spelling
+    (hooks are stored least- to most-recent) in that spelling's position.
+    Pairs are screened with the cheap upper bounds before the full ratio is computed.
+    """
+    kept: List[Tuple[str, str]] = []
+    matcher = SequenceMatcher(None)
+    for hook in reversed(hooks):
+        key = normalize_hook(hook)
+        # seq2 is the one SequenceMatcher indexes, so set it once per candidate
+        matcher.set_seq2(key)
+        duplicate = False
+        for _, other in kept:
+            if key == other:
+                duplicate = True
+                break
+            matcher.set_seq1(other)
+            if (matcher.real_quick_ratio() >= similarity and matcher.quick_ratio() >= similarity
+                    and matcher.ratio() >= similarity):
+                duplicate = True
+                break
+        if not duplicate:
+            kept.append((hook, key))
+    return [hook for hook, _ in reversed(kept)]
+
+
+class LatticeCompactor:
+    """
+    Incremental garbage collector for the Resonance Lattice.
+    A pass first sweeps every node (TTL eviction, hook merge and LRU hook cap) and then,
+    if the lattice is still over its node or byte budget, evicts the least recently
+    updated nodes. Work is done `policy.slice_size` nodes (or `policy.slice_seconds`) per
+    `run_slice` call, so a caller such as the kernel loop can interleave it with capture
+    processing.
+    Changes go through the lattice's normal dirty tracking and durability policy.
+    """
+
+    def __init__(self, lattice, policy: CompactionPolicy):
+        self.lattice = lattice
+        self.policy = policy
+        self.last_report: Optional[CompactionReport] = None
+        self._reset()
+
+    def _reset(self):
+        self.report = CompactionReport()
+        self._phase = "sweep"
+        self._pending: Optional[List[NodeKey]] = None
+        self._cursor = 0
+        self._sizes: Dict[NodeKey, int] = {}
+        self._budget_keys = None
+        self._budget_bytes = 0
+
+    @property
+    def in_progress(self) -> bool:
+        return self._pending is not None or self._phase != "sweep"
+
+    def run_slice(self, now: Optional[float] = None) -> Optional[CompactionReport]:
+        """
+        Do one slice of work. Returns the pass report when this slice finished the pass.
+        """
+        started = time.perf_counter()
+        now = time.time() if now is None else now
+        if self._phase == "sweep":
+            deadline = None if self.policy.slice_seconds is None else started + self.policy.slice_seconds
+            self._sweep_slice(now, deadline)
+        else:
+            self._budget_slice()
+        self.report.slices += 1
+        self.report.busy_seconds += time.perf_counter() - started
+
+        if self._phase != "done":
+            return None
+        report = self.last_report = self.report
+        self._reset()
+        if report.nodes_evicted or report.hooks_trimmed or report.hooks_merged:
+            self.lattice.save()
+        print(f"🧹 Lattice compaction: {report}.")
+        return report
+
+    def run_pass(self, now: Optional[float] = None) -> CompactionReport:
+        """
+        Run slices back to back until the current pass completes.
+        """
+        while True:
+            report = self.run_slice(now)
+            if report is not None:
+                return report
+
+    # --- Sweep phase ---
+
+    def _sweep_slice(self, now: float, deadline: Optional[float] = None):
+        if self._pending is None:
+            self._pending = [(category, neuron_id) for category in list(self.lattice.lattice)
+                             for neuron_id in list(self.lattice.lattice.get(category, {}))]
+            self._cursor = 0
+
+        end = min(self._cursor + self.policy.slice_size, len(self._pending))
+        while self._cursor < end:
+            category, neuron_id = self._pending[self._cursor]
+            self._cursor += 1
+            self._sweep_node(category, neuron_id, now)
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        if self._cursor >= len(self._pending):
+            self._pending = None
+            self._budget_bytes = sum(self._sizes.values())
+            self._phase = "budget" if self._over_budget() else "done"
+
+    def _sweep_node(self, category: str, neuron_id: str, now: float):
+        policy = self.policy
+        key = (category, neuron_id)
+        with self.lattice.category_lock(category):
+            node = self.lattice.lattice.get(category, {}).get(neuron_id)
+            if node is None:
+                return
+            self.report.nodes_examined += 1
+            size = node_size(dict(node))
+
+            if (policy.node_ttl_seconds is not None and category not in policy.protected_categories
+                    and now - self.lattice.node_time(node) > policy.node_ttl_seconds):
+                self.lattice.remove_node(category, neuron_id)
+                self.report.nodes_expired += 1
+                self.report.bytes_reclaimed += size
+                return
+
+            hooks = list(node.get("narrative_hooks", []))
+            compacted = hooks
+            if policy.max_hooks_per_node is not None and len(compacted) > policy.max_hooks_per_node:
+                self.report.hooks_trimmed += len(compacted) - policy.max_hooks_per_node
+                compacted = compacted[len(compacted) - policy.max_hooks_per_node:]
+            if policy.hook_similarity is not None:
+                merged = merge_similar_hooks(compacted, policy.hook_similarity)
+                self.report.hooks_merged += len(compacted) - len(merged)
+                compacted = merged
+            if compacted != hooks:
+                self.lattice.replace_hooks(category, neuron_id, compacted)
+                new_size = node_size(dict(self.lattice.lattice[category][neuron_id]))
+                self.report.bytes_reclaimed += size - new_size
+                size = new_size
+            self._sizes[key] = size
+
+    # --- Budget phase ---
+
+    def _over_budget(self) -> bool:
+        policy = self.policy
+        if policy.max_nodes is not None and len(self._sizes) > policy.max_nodes:
+            return True
+        return policy.max_bytes is not None and self._budget_bytes > policy.max_bytes
+
+    def _budget_slice(self):
+        if self._budget_keys is None:
+            self._budget_keys = self.lattice.index.keys_oldest_first()
+
+        evicted = 0
+        for category, neuron_id in self._budget_keys:
+            if not self._over_budget():
+                break
+            key = (category, neuron_id)
+            if category in self.policy.protected_categories or key not in self._sizes:
+                continue
+            if self.lattice.remove_node(category, neuron_id):
+                size = self._sizes.pop(key)
+                self._budget_bytes -= size
+                self.report.nodes_over_budget += 1
+                self.report.bytes_reclaimed += size
+                evicted += 1
+                if evicted >= self.policy.slice_size and self._over_budget():
+                    return
+        self._phase = "done"
@@ -0,0 +1,48 @@
+# samurai_bluebird_custos/symbolic/lattice_decay.py
+
+from typing import Tuple
+
+import numpy as np
+
+
+class DecayModel:
+    """
+    Lazy time-based decay for lattice nodes.
+    Nodes keep the familiarity/novelty they had at their last update plus that update's
+    timestamp; the effective value is derived on read from elapsed time, relaxing
+    exponentially toward a resting value. Untouched nodes therefore cost nothing:
+    familiarity fades toward `familiarity_rest` and novelty recovers toward `novelty_rest`.
+    """
+
+    def __init__(self, familiarity_half_life_hours: float = 72.0, novelty_half_life_hours: float = 24.0,
+                 familiarity_rest: float = 0.0, novelty_rest: float = 1.0):
+        self.familiarity_half_life = familiarity_half_life_hours * 3600.0
+        self.novelty_half_life = novelty_half_life_hours * 3600.0
+        self.familiarity_rest = familiarity_rest
+        self.novelty_rest = novelty_rest
+
+    @staticmethod
+    def _relax(value, rest: float, half_life: float, elapsed):
+        if half_life <= 0:
+            return value
+        return rest + (value - rest) * np.power(0.5, np.maximum(elapsed, 0.0) / half_life)
+
+    def effective(self, familiarity: float, novelty: float, elapsed_seconds: float) -> Tuple[float, float]:
+        """
+        Effective (familiarity, novelty) of one node `elapsed_seconds` after its last update.
+        """
+        return (
+            round(float(self._relax(familiarity, self.familiarity_rest, self.familiarity_half_life, elapsed_seconds)), 3),
+            round(float(self._relax(novelty, self.novelty_rest, self.novelty_half_life, elapsed_seconds)), 3),
+        )
+
+    def effective_arrays(self, familiarity: np.ndarray, novelty: np.ndarray,
+                         elapsed_seconds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized `effective` over whole arrays of nodes, rounded the same way so both
+        backends agree at thresholds.
+        """
+        return (
+            np.round(self._relax(familiarity, self.familiarity_rest, self.familiarity_half_life, elapsed_seconds), 3),
+            np.round(self._relax(novelty, self.novelty_rest, self.novelty_half_life, elapsed_seconds), 3),
+        )
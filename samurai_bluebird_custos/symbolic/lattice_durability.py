@@ -0,0 +1,72 @@
+# samurai_bluebird_custos/symbolic/lattice_durability.py
+
+import threading
+import time
+from typing import Optional
+
+
+class DurabilityPolicy:
+    """
+    When a lattice turns save requests into actual disk writes.
+    - every_mutations: write once this many node changes are pending.
+    - every_seconds: write pending changes at least this often (via a background flusher).
+    With both unset, changes are only written on an explicit `flush()`.
+    """
+
+    def __init__(self, every_mutations: Optional[int] = 1, every_seconds: Optional[float] = None):
+        self.every_mutations = every_mutations
+        self.every_seconds = every_seconds
+
+    @classmethod
+    def immediate(cls) -> "DurabilityPolicy":
+        """Write on every save request (the original behaviour)."""
+        return cls(every_mutations=1)
+
+    @classmethod
+    def manual(cls) -> "DurabilityPolicy":
+        """Write only on explicit flush."""
+        return cls(every_mutations=None, every_seconds=None)
+
+    @property
+    def is_immediate(self) -> bool:
+        return self.every_mutations == 1 and self.every_seconds is None
+
+    def is_due(self, pending_mutations: int, seconds_since_flush: float) -> bool:
+        if pending_mutations <= 0:
+            return False
+        if self.every_mutations is not None and pending_mutations >= self.every_mutations:
+            return True
+        return self.every_seconds is not None and seconds_since_flush >= self.every_seconds
+
+    def __repr__(self) -> str:
+        return f"DurabilityPolicy(every_mutations={self.every_mutations}, every_seconds={self.every_seconds})"
+
+
+class LatticeFlusher:
+    """
+    Background thread that coalesces pending lattice changes into periodic writes,
+    keeping disk I/O off the batch-processing path.
+    """
+
+    def __init__(self, lattice, interval_seconds: float):
+        self.lattice = lattice
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="LatticeFlusher", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self):
+        # Wake a few times per interval so writes land close to their deadline
+        tick = max(min(self.interval_seconds / 4, 1.0), 0.01)
+        while not self._stop.wait(tick):
+            try:
+                self.lattice.flush_if_due(time.monotonic())
+            except Exception as e:
+                print(f"❌ Lattice flusher error: {e}")
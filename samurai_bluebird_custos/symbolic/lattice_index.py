@@ -0,0 +1,92 @@
+# samurai_bluebird_custos/symbolic/lattice_index.py
+
+import heapq
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Set, Tuple
+
+NodeKey = Tuple[str, str]
+
+
+class LatticeIndex:
+    """
+    Secondary indexes over the Resonance Lattice.
+    - hook -> nodes inverted index, so theme and top-k hook queries never walk every node.
+    - timeline of (parsed last_updated, node) kept sorted, so "since cutoff" and
+      "most recent" queries start from a bisect instead of a full scan.
+    The lattice keeps the index current by calling `update` / `remove` as nodes change.
+    """
+
+    def __init__(self, node_time: Callable[[Mapping[str, Any]], float]):
+        self.node_time = node_time
+        self.hook_nodes: Dict[str, Set[NodeKey]] = {}
+        self._node_hooks: Dict[NodeKey, Tuple[str, ...]] = {}
+        self._node_times: Dict[NodeKey, float] = {}
+        self._timeline: List[Tuple[float, str, str]] = []
+
+    @classmethod
+    def build(cls, lattice: Mapping[str, Mapping[str, Any]],
+              node_time: Callable[[Mapping[str, Any]], float]) -> "LatticeIndex":
+        index = cls(node_time)
+        entries = []
+        for category, neurons in lattice.items():
+            for neuron_id, node in neurons.items():
+                key = (category, neuron_id)
+                index._index_hooks(key, node.get("narrative_hooks", []))
+                updated = node_time(node)
+                index._node_times[key] = updated
+                entries.append((updated, category, neuron_id))
+        entries.sort()
+        index._timeline = entries
+        return index
+
+    def update(self, key: NodeKey, node: Mapping[str, Any]):
+        self.remove(key)
+        self._index_hooks(key, node.get("narrative_hooks", []))
+        updated = self.node_time(node)
+        self._node_times[key] = updated
+        insort(self._timeline, (updated, key[0], key[1]))
+
+    def remove(self, key: NodeKey):
+        for hook in self._node_hooks.pop(key, ()):
+            nodes = self.hook_nodes.get(hook)
+            if nodes is not None:
+                nodes.discard(key)
+                if not nodes:
+                    del self.hook_nodes[hook]
+        updated = self._node_times.pop(key, None)
+        if updated is not None:
+            position = bisect_left(self._timeline, (updated, key[0], key[1]))
+            if position < len(self._timeline) and self._timeline[position] == (updated, key[0], key[1]):
+                self._timeline.pop(position)
+
+    def _index_hooks(self, key: NodeKey, hooks: List[str]):
+        unique_hooks = tuple(dict.fromkeys(hooks))
+        self._node_hooks[key] = unique_hooks
+        for hook in unique_hooks:
+            self.hook_nodes.setdefault(hook, set()).add(key)
+
+    def hooks_of(self, key: NodeKey) -> Tuple[str, ...]:
+        return self._node_hooks.get(key, ())
+
+    def all_hooks(self) -> List[str]:
+        return list(self.hook_nodes)
+
+    def top_hooks(self, k: int) -> List[Tuple[str, int]]:
+        """
+        The `k` hooks attached to the most nodes, with their node counts.
+        """
+        ranked = heapq.nlargest(k, self.hook_nodes.items(), key=lambda item: len(item[1]))
+        return [(hook, len(nodes)) for hook, nodes in ranked]
+
+    def keys_since(self, cutoff: float) -> Iterator[NodeKey]:
+        start = bisect_left(self._timeline, (cutoff, "", ""))
+        for _, category, neuron_id in self._timeline[start:]:
+            yield category, neuron_id
+
+    def keys_oldest_first(self) -> Iterator[NodeKey]:
+        for _, category, neuron_id in list(self._timeline):
+            yield category, neuron_id
+
+    def keys_newest_first(self) -> Iterator[NodeKey]:
+        for _, category, neuron_id in reversed(self._timeline):
+            yield category, neuron_id
@@ -0,0 +1,61 @@
+# samurai_bluebird_custos/symbolic/lattice_registry.py
+
+import os
+import threading
+from typing import Any, Dict
+
+from samurai_bluebird_custos.symbolic.recursive_memory_lattice import RecursiveSymbolicMemoryLattice
+from samurai_bluebird_custos.symbolic.sharded_lattice import ShardedResonanceLattice
+
+RESONANCE_LATTICE_FILE = "memory/resonance_lattice.json"
+RECURSIVE_MEMORY_FILE = "memory/recursive_symbolic_memory.json"
+
+_shared_lattices: Dict[str, RecursiveSymbolicMemoryLattice] = {}
+_registry_lock = threading.Lock()
+
+
+def get_shared_lattice(lattice_file: str, sharded: bool = False, **options: Any) -> RecursiveSymbolicMemoryLattice:
+    """
+    Hand out the one in-memory lattice for `lattice_file`, loading it on first request.
+    Later requests revalidate against the file's mtime and size and reload only when
+    another process has written it. `options` (persistence, backend, ...) apply when the
+    lattice is first created; later callers share whatever the first caller configured.
+    `sharded=True` creates a ShardedResonanceLattice for multi-threaded writers.
+    """
+    path = _resolve(lattice_file)
+    with _registry_lock:
+        lattice = _shared_lattices.get(path)
+        if lattice is None:
+            lattice_class = ShardedResonanceLattice if sharded else RecursiveSymbolicMemoryLattice
+            lattice = lattice_class(path, **options)
+            _shared_lattices[path] = lattice
+            return lattice
+    lattice.refresh_if_changed()
+    return lattice
+
+
+def release_shared_lattice(lattice_file: str) -> bool:
+    """
+    Flush, close and forget the shared lattice for `lattice_file` (e.g. an idle tenant).
+    Returns False if it was not loaded.
+    """
+    with _registry_lock:
+        lattice = _shared_lattices.pop(_resolve(lattice_file), None)
+    if lattice is None:
+        return False
+    lattice.close()
+    return True
+
+
+def clear_shared_lattices():
+    """
+    Forget every shared lattice (tests and tenant switches).
+    """
+    with _registry_lock:
+        _shared_lattices.clear()
+
+
+def _resolve(lattice_file: str) -> str:
+    # Mirrors RecursiveSymbolicMemoryLattice: relative paths are anchored at the project root
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.normpath(os.path.join(project_root, lattice_file))
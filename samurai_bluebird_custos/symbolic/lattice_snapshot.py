@@ -0,0 +1,207 @@
+# samurai_bluebird_custos/symbolic/lattice_snapshot.py
+
+"""
+Binary Resonance Lattice snapshots.
+
+Layout (little-endian):
+    header     magic b"SBLT", u16 version, u16 reserved, u32 category count
+    directory  per category: u16 name length, name (utf-8), u32 node count,
+               u64 block offset, u64 block length
+    blocks     per node: f64 familiarity, f64 novelty, u16 id length, u32 payload length,
+               id (utf-8), payload (compact JSON of the remaining node fields)
+
+Snapshots are opened with mmap and only the header and directory are parsed up front;
+a category's node block is decoded the first time that category is accessed.
+"""
+
+import argparse
+import json
+import mmap
+import struct
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+MAGIC = b"SBLT"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+DIRECTORY_NAME = struct.Struct("<H")
+DIRECTORY_ENTRY = struct.Struct("<IQQ")
+NODE_RECORD = struct.Struct("<ddHI")
+NUMERIC_FIELDS = ("familiarity", "novelty")
+
+
+class BinaryLatticeSnapshot:
+    """
+    Read-only, memory-mapped view of a binary lattice snapshot.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty lattice snapshot: {path}")
+        self.directory: Dict[str, Tuple[int, int, int]] = self._read_directory()
+
+    def _read_directory(self) -> Dict[str, Tuple[int, int, int]]:
+        magic, version, _, category_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a binary lattice snapshot: {self.path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported lattice snapshot version {version}: {self.path}")
+        directory = {}
+        position = HEADER.size
+        for _ in range(category_count):
+            (name_length,) = DIRECTORY_NAME.unpack_from(self._map, position)
+            position += DIRECTORY_NAME.size
+            name = self._map[position:position + name_length].decode("utf-8")
+            position += name_length
+            directory[name] = DIRECTORY_ENTRY.unpack_from(self._map, position)
+            position += DIRECTORY_ENTRY.size
+        return directory
+
+    def node_count(self, category: str) -> int:
+        return self.directory[category][0]
+
+    def load_category(self, category: str) -> Dict[str, Dict[str, Any]]:
+        count, offset, _ = self.directory[category]
+        nodes = {}
+        position = offset
+        for _ in range(count):
+            familiarity, novelty, id_length, payload_length = NODE_RECORD.unpack_from(self._map, position)
+            position += NODE_RECORD.size
+            neuron_id = self._map[position:position + id_length].decode("utf-8")
+            position += id_length
+            node = json.loads(self._map[position:position + payload_length])
+            position += payload_length
+            node["familiarity"] = familiarity
+            node["novelty"] = novelty
+            nodes[neuron_id] = node
+        return nodes
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+class LazyCategoryMap(MutableMapping):
+    """
+    `{category: {neuron_id: node}}` mapping backed by a binary snapshot.
+    Categories are decoded on first access; writes land in plain dicts.
+    """
+
+    def __init__(self, snapshot: BinaryLatticeSnapshot):
+        self._snapshot: Optional[BinaryLatticeSnapshot] = snapshot
+        self._categories: Dict[str, Optional[Dict[str, Any]]] = {name: None for name in snapshot.directory}
+
+    def __getitem__(self, category: str) -> Dict[str, Any]:
+        nodes = self._categories[category]
+        if nodes is None:
+            nodes = self._snapshot.load_category(category)
+            self._categories[category] = nodes
+        return nodes
+
+    def __setitem__(self, category: str, nodes: Dict[str, Any]):
+        self._categories[category] = nodes
+
+    def __delitem__(self, category: str):
+        del self._categories[category]
+
+    def __contains__(self, category: object) -> bool:
+        return category in self._categories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._categories))
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def loaded_categories(self):
+        return [name for name, nodes in self._categories.items() if nodes is not None]
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {category: self[category] for category in self}
+
+    def close(self):
+        """
+        Release the memory map (materializing anything not yet loaded).
+        """
+        if self._snapshot is not None:
+            for category in self:
+                self[category]
+            self._snapshot.close()
+            self._snapshot = None
+
+
+def is_binary_snapshot(path: str) -> bool:
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except FileNotFoundError:
+        return False
+
+
+def read_snapshot(path: str):
+    """
+    Open a lattice snapshot in either format: a LazyCategoryMap for binary files,
+    a plain dict for JSON. Raises FileNotFoundError / ValueError like json.load would.
+    """
+    if is_binary_snapshot(path):
+        return LazyCategoryMap(BinaryLatticeSnapshot(path))
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def write_binary_snapshot(path: str, lattice: Dict[str, Dict[str, Dict[str, Any]]]):
+    blocks = []
+    for category, nodes in lattice.items():
+        records = []
+        for neuron_id, node in nodes.items():
+            payload = {key: value for key, value in node.items() if key not in NUMERIC_FIELDS}
+            id_bytes = str(neuron_id).encode("utf-8")
+            payload_bytes = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            records.append(NODE_RECORD.pack(
+                float(node.get("familiarity", 0.0)), float(node.get("novelty", 0.0)),
+                len(id_bytes), len(payload_bytes)
+            ) + id_bytes + payload_bytes)
+        blocks.append((category.encode("utf-8"), len(nodes), b"".join(records)))
+
+    directory_size = sum(DIRECTORY_NAME.size + len(name) + DIRECTORY_ENTRY.size for name, _, _ in blocks)
+    offset = HEADER.size + directory_size
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(blocks)))
+        for name, count, block in blocks:
+            f.write(DIRECTORY_NAME.pack(len(name)) + name + DIRECTORY_ENTRY.pack(count, offset, len(block)))
+            offset += len(block)
+        for _, _, block in blocks:
+            f.write(block)
+
+
+def json_to_binary(json_path: str, binary_path: str):
+    with open(json_path, "r") as f:
+        write_binary_snapshot(binary_path, json.load(f))
+
+
+def binary_to_json(binary_path: str, json_path: str):
+    lattice = LazyCategoryMap(BinaryLatticeSnapshot(binary_path))
+    try:
+        data = lattice.to_dict()
+    finally:
+        lattice.close()
+    with open(json_path, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert Resonance Lattice snapshots between JSON and binary.")
+    parser.add_argument("direction", choices=["to-binary", "to-json"])
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    args = parser.parse_args()
+    if args.direction == "to-binary":
+        json_to_binary(args.source, args.destination)
+    else:
+        binary_to_json(args.source, args.destination)
+    print(f"💾 Converted {args.source} -> {args.destination}")
@@ -0,0 +1,253 @@
+# samurai_bluebird_custos/symbolic/lattice_store.py
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+class ArrayNodeStore(MutableMapping):
+    """
+    Compact lattice backend – keeps numeric node fields in NumPy arrays indexed by slot.
+    Behaves like the plain `{category: {neuron_id: node}}` dict, handing out slot-based
+    views so existing lattice code keeps working, while aggregate queries run vectorized.
+    A per-field presence mask tracks which numeric fields a node actually has; absent
+    fields read as 0.0 in aggregates (the dict backend's `.get(..., 0.0)`) and are never
+    emitted by `to_dict`.
+    """
+
+    NUMERIC_FIELDS = ("familiarity", "novelty", "updated_at")
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(capacity, 1)
+        self.arrays: Dict[str, np.ndarray] = {
+            field: np.zeros(capacity, dtype=np.float64) for field in self.NUMERIC_FIELDS
+        }
+        self.present: Dict[str, np.ndarray] = {
+            field: np.zeros(capacity, dtype=bool) for field in self.NUMERIC_FIELDS
+        }
+        self.active = np.zeros(capacity, dtype=bool)
+        self._extras: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self._categories: Dict[str, Dict[str, int]] = {}
+        self._views: Dict[str, "CategoryView"] = {}
+        self._free: List[int] = []
+        self._next_slot = 0
+
+    @classmethod
+    def from_dict(cls, lattice: Dict[str, Dict[str, Dict[str, Any]]]) -> "ArrayNodeStore":
+        store = cls(capacity=sum(len(nodes) for nodes in lattice.values()) or 1024)
+        for category, nodes in lattice.items():
+            store[category] = nodes
+        return store
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        return {
+            category: {neuron_id: self.node_dict(slot) for neuron_id, slot in slots.items()}
+            for category, slots in self._categories.items()
+        }
+
+    # --- Mapping protocol (category level) ---
+
+    def __getitem__(self, category: str) -> "CategoryView":
+        if category not in self._categories:
+            raise KeyError(category)
+        return self._views[category]
+
+    def __setitem__(self, category: str, nodes: Dict[str, Dict[str, Any]]):
+        if category in self._categories:
+            del self[category]
+        self._categories[category] = {}
+        self._views[category] = CategoryView(self, category)
+        for neuron_id, node in dict(nodes).items():
+            self._views[category][neuron_id] = node
+
+    def __delitem__(self, category: str):
+        for slot in self._categories.pop(category).values():
+            self._release(slot)
+        del self._views[category]
+
+    def __contains__(self, category: object) -> bool:
+        return category in self._categories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._categories)
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def setdefault(self, category: str, default: Optional[Dict[str, Any]] = None) -> "CategoryView":
+        if category not in self._categories:
+            self[category] = default or {}
+        return self._views[category]
+
+    # --- Slot management ---
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._next_slot >= len(self.active):
+            self._grow()
+        slot = self._next_slot
+        self._next_slot += 1
+        return slot
+
+    def _grow(self):
+        capacity = len(self.active) * 2
+        for field, array in self.arrays.items():
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            self.arrays[field] = grown
+        for field, mask in self.present.items():
+            grown = np.zeros(capacity, dtype=bool)
+            grown[:len(mask)] = mask
+            self.present[field] = grown
+        active = np.zeros(capacity, dtype=bool)
+        active[:len(self.active)] = self.active
+        self.active = active
+        self._extras.extend([None] * (capacity - len(self._extras)))
+
+    def _release(self, slot: int):
+        self.active[slot] = False
+        self._extras[slot] = None
+        self._free.append(slot)
+
+    def write_node(self, slot: int, node: Dict[str, Any]):
+        for field, array in self.arrays.items():
+            array[slot] = 0.0
+            self.present[field][slot] = False
+        extras = {}
+        for key, value in node.items():
+            if key in self.arrays:
+                self.arrays[key][slot] = float(value)
+                self.present[key][slot] = True
+            else:
+                extras[key] = value
+        self._extras[slot] = extras
+        self.active[slot] = True
+
+    def node_dict(self, slot: int) -> Dict[str, Any]:
+        node = {
+            field: float(array[slot]) for field, array in self.arrays.items()
+            if self.present[field][slot]
+        }
+        node.update(self._extras[slot])
+        return node
+
+    def slot_of(self, category: str, neuron_id: str) -> Optional[int]:
+        return self._categories.get(category, {}).get(neuron_id)
+
+    def node_count(self) -> int:
+        return int(np.count_nonzero(self.active))
+
+    def active_slots(self) -> np.ndarray:
+        return np.flatnonzero(self.active)
+
+    def extras_of(self, slot: int) -> Dict[str, Any]:
+        return self._extras[slot]
+
+    # --- Vectorized aggregates ---
+
+    def count_at_least(self, field: str, threshold: float) -> int:
+        values = self.arrays[field]
+        return int(np.count_nonzero((values >= threshold) & self.active))
+
+    def clamp(self, field: str, low: float = 0.0, high: float = 1.0):
+        np.clip(self.arrays[field], low, high, out=self.arrays[field])
+
+    def gather(self, field: str, keys: Iterable[Tuple[str, str]], default: float) -> np.ndarray:
+        """
+        Return `field` for each (category, neuron_id), using `default` for unknown nodes
+        and for nodes that lack the field.
+        """
+        slots = np.array([
+            -1 if (slot := self.slot_of(category, neuron_id)) is None else slot
+            for category, neuron_id in keys
+        ], dtype=np.int64)
+        values = np.full(len(slots), default, dtype=np.float64)
+        known = slots >= 0
+        known[known] = self.present[field][slots[known]]
+        values[known] = self.arrays[field][slots[known]]
+        return values
+
+
+class CategoryView(MutableMapping):
+    """
+    `{neuron_id: node}` view over one category of an ArrayNodeStore.
+    """
+
+    def __init__(self, store: ArrayNodeStore, category: str):
+        self._store = store
+        self._category = category
+
+    @property
+    def _slots(self) -> Dict[str, int]:
+        return self._store._categories[self._category]
+
+    def __getitem__(self, neuron_id: str) -> "NodeView":
+        return NodeView(self._store, self._slots[neuron_id])
+
+    def __setitem__(self, neuron_id: str, node: Dict[str, Any]):
+        slot = self._slots.get(neuron_id)
+        if slot is None:
+            slot = self._store._allocate()
+            self._slots[neuron_id] = slot
+        self._store.write_node(slot, dict(node))
+
+    def __delitem__(self, neuron_id: str):
+        self._store._release(self._slots.pop(neuron_id))
+
+    def __contains__(self, neuron_id: object) -> bool:
+        return neuron_id in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+
+class NodeView(MutableMapping):
+    """
+    Dict-like view of one node; numeric fields read and write straight into the arrays.
+    """
+
+    __slots__ = ("_store", "slot")
+
+    def __init__(self, store: ArrayNodeStore, slot: int):
+        self._store = store
+        self.slot = slot
+
+    def __getitem__(self, key: str) -> Any:
+        array = self._store.arrays.get(key)
+        if array is not None:
+            if not self._store.present[key][self.slot]:
+                raise KeyError(key)
+            return float(array[self.slot])
+        return self._store._extras[self.slot][key]
+
+    def __setitem__(self, key: str, value: Any):
+        array = self._store.arrays.get(key)
+        if array is not None:
+            array[self.slot] = float(value)
+            self._store.present[key][self.slot] = True
+        else:
+            self._store._extras[self.slot][key] = value
+
+    def __delitem__(self, key: str):
+        if key in self._store.arrays:
+            if not self._store.present[key][self.slot]:
+                raise KeyError(key)
+            self._store.arrays[key][self.slot] = 0.0
+            self._store.present[key][self.slot] = False
+            return
+        del self._store._extras[self.slot][key]
+
+    def __iter__(self) -> Iterator[str]:
+        for field, mask in self._store.present.items():
+            if mask[self.slot]:
+                yield field
+        yield from self._store._extras[self.slot]
+
+    def __len__(self) -> int:
+        numeric = sum(1 for mask in self._store.present.values() if mask[self.slot])
+        return numeric + len(self._store._extras[self.slot])
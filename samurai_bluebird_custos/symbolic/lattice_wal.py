@@ -0,0 +1,82 @@
+# samurai_bluebird_custos/symbolic/lattice_wal.py
+
+import json
+import os
+from typing import Any, Dict, Iterator, List
+
+
+class LatticeWriteAheadLog:
+    """
+    Append-only mutation log for the Resonance Lattice.
+    Each line is one JSON record describing a single node change, so a write costs
+    only what changed. The owning lattice compacts the log into a snapshot once it
+    grows past `compact_every` records.
+    """
+
+    def __init__(self, log_file: str, compact_every: int = 500, fsync: bool = False):
+        self.log_file = log_file
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.record_count = 0
+
+    def append(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Append mutation records to the current log segment.
+        """
+        if not records:
+            return
+        directory = os.path.dirname(self.log_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        payload = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        with open(self.log_file, "a", encoding="utf-8") as f:
+            f.write(payload)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self.record_count += len(records)
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield logged records in write order.
+        A torn final line (crash mid-append) is skipped rather than failing startup.
+        """
+        self.record_count = 0
+        try:
+            with open(self.log_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        print(f"⚠️ Skipping torn lattice log record in {self.log_file}")
+                        continue
+                    self.record_count += 1
+                    yield record
+        except FileNotFoundError:
+            return
+
+    def needs_compaction(self) -> bool:
+        return self.record_count >= self.compact_every
+
+    def truncate(self) -> None:
+        """
+        Start a fresh log segment once its records are folded into a snapshot.
+        """
+        if os.path.exists(self.log_file):
+            os.remove(self.log_file)
+        self.record_count = 0
+
+
+def apply_record(lattice: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """
+    Apply one logged mutation to an in-memory lattice dict.
+    """
+    category = record.get("category")
+    neuron_id = record.get("id")
+    if record.get("op") == "put":
+        lattice.setdefault(category, {})[neuron_id] = record.get("node", {})
+    elif record.get("op") == "del":
+        lattice.get(category, {}).pop(neuron_id, None)
@@ -1,112 +1,369 @@
 # samurai_bluebird_custos/symbolic/recursive_memory_lattice.py
 
+import atexit
+import functools
 import json
 import os
-from datetime import datetime
-from typing import Dict, Any, List
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Set, Tuple
 
+import numpy as np
 import pytz
 
+from samurai_bluebird_custos.symbolic.lattice_decay import DecayModel
+from samurai_bluebird_custos.symbolic.lattice_durability import DurabilityPolicy, LatticeFlusher
+from samurai_bluebird_custos.symbolic.lattice_index import LatticeIndex
+from samurai_bluebird_custos.symbolic.lattice_snapshot import LazyCategoryMap, read_snapshot, write_binary_snapshot
+from samurai_bluebird_custos.symbolic.lattice_wal import LatticeWriteAheadLog, apply_record
+from samurai_bluebird_custos.utils.metrics import timed
+
+FAMILIARITY_KNOWN_THRESHOLD = 0.7
+
+
+def merge_hooks(existing: List[str], incoming: List[str]) -> List[str]:
+    """
+    Merge narrative hooks in least- to most-recently-seen order: hooks seen again move
+    to the end, so trimming from the front drops the stalest ones.
+    """
+    incoming = list(dict.fromkeys(incoming))
+    seen_again = set(incoming)
+    return [hook for hook in existing if hook not in seen_again] + incoming
+
+
+def _synchronized(method):
+    """
+    Run a lattice method under the lattice lock so the background flusher never
+    serializes a half-applied update.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class RecursiveSymbolicMemoryLattice:
     """
     Resonance Lattice – evolving symbolic memory map of Samurai Bluebird.
     Stores symbolic neurons as nodes with valence, familiarity, novelty, narrative hooks, and planetary metadata.
+
+    Persistence modes:
+    - "json": every save rewrites the full lattice file (original behaviour).
+    - "wal": saves append changed nodes to `<lattice_file>.wal`; the log is compacted
+      into the JSON snapshot every `compact_every` records and replayed on startup.
+
+    Backends:
+    - "dict": nodes are plain nested dicts (original behaviour).
+    - "array": numeric fields live in NumPy arrays (see lattice_store.ArrayNodeStore) so
+      aggregate queries such as known/unknown ratios run vectorized.
+
+    Snapshot formats: "json" (indented JSON) or "binary" (memory-mapped, see lattice_snapshot),
+    inferred from a `.sbl` extension unless given. Either format is detected on load, and
+    binary snapshots decode a category only when it is first accessed.
+
+    Decay: with a DecayModel, familiarity and novelty are stored as of each node's last
+    update (`updated_at`) and decayed on read; nodes settle to their decayed values only
+    when they are next touched.
+
+    Durability: `save()` is a request that the active DurabilityPolicy turns into a disk
+    write (immediately by default). `flush()` always writes; `close()` flushes and stops
+    the background flusher.
     """
 
-    def __init__(self, lattice_file: str, timezone: str = "America/Detroit"):
+    def __init__(self, lattice_file: str, timezone: str = "America/Detroit",
+                 persistence: str = "json", compact_every: int = 500, backend: str = "dict",
+                 snapshot_format: Optional[str] = None, decay: Optional[DecayModel] = None):
         # Ensure absolute path to memory directory
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.lattice_file = os.path.join(project_root, lattice_file)
         self.timezone = pytz.timezone(timezone)
+        if persistence not in ("json", "wal"):
+            raise ValueError(f"Unknown lattice persistence mode: {persistence}")
+        self.persistence = persistence
+        if backend not in ("dict", "array"):
+            raise ValueError(f"Unknown lattice backend: {backend}")
+        self.backend = backend
+        self.snapshot_format = snapshot_format or ("binary" if self.lattice_file.endswith(".sbl") else "json")
+        if self.snapshot_format not in ("json", "binary"):
+            raise ValueError(f"Unknown lattice snapshot format: {self.snapshot_format}")
+        self.wal = LatticeWriteAheadLog(self.lattice_file + ".wal", compact_every) if persistence == "wal" else None
+        self._dirty: Set[Tuple[str, str]] = set()
+        self._index: Optional[LatticeIndex] = None
+        self._disk_signature: Tuple = ()
+        self.decay = decay
+        self._lock = threading.RLock()
+        # Guards dirty tracking and the indexes; always taken after any category lock
+        self._bookkeeping_lock = threading.RLock()
+        self.durability = DurabilityPolicy.immediate()
+        self._flusher: Optional[LatticeFlusher] = None
+        self._pending_mutations = 0
+        self._last_flush = time.monotonic()
+        self._close_registered = False
         self.lattice = self._load_lattice()
 
     def _load_lattice(self) -> Dict[str, Any]:
+        # Taken before reading so a concurrent write shows up as a change on the next check
+        self._disk_signature = self._read_disk_signature()
         try:
-            with open(self.lattice_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            lattice = read_snapshot(self.lattice_file)
+        except (FileNotFoundError, ValueError):
             print("🔄 Initializing new resonance lattice.")
-            return {}
+            lattice = {}
+        if self.wal:
+            for record in self.wal.replay():
+                apply_record(lattice, record)
+        if self.backend == "array":
+            from samurai_bluebird_custos.symbolic.lattice_store import ArrayNodeStore
+            store = ArrayNodeStore.from_dict(lattice)
+            if isinstance(lattice, LazyCategoryMap):
+                lattice.close()
+            return store
+        return lattice
 
+    def _read_disk_signature(self) -> Tuple:
+        """
+        Cheap (mtime, size) fingerprint of the snapshot and log files.
+        """
+        signature = []
+        for path in (self.lattice_file, self.wal.log_file if self.wal else None):
+            if path is None:
+                continue
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    @_synchronized
+    def refresh_if_changed(self) -> bool:
+        """
+        Reload from disk if another process has written the lattice since we last loaded or saved it.
+        Local unsaved changes win: the reload is skipped while any are pending.
+        """
+        if self._read_disk_signature() == self._disk_signature:
+            return False
+        with self._all_categories_locked():
+            if self._dirty:
+                print("⚠️ Resonance lattice changed on disk, keeping unsaved local changes.")
+                return False
+            self._release_snapshot()
+            self.lattice = self._load_lattice()
+            with self._bookkeeping_lock:
+                self._index = None
+        print("🔁 Resonance lattice reloaded from disk.")
+        return True
+
+    def _category_lock(self, category: str):
+        """
+        Lock guarding one category's nodes. The base lattice uses a single lock for
+        everything; ShardedResonanceLattice hands out one lock per category.
+        """
+        return self._lock
+
+    def category_lock(self, category: str):
+        """
+        Public handle on a category's lock, for callers that read a node and then change it
+        (compaction, for one).
+        """
+        return self._category_lock(category)
+
+    def _all_categories_locked(self):
+        """
+        Context manager holding every category lock, for whole-lattice operations.
+        """
+        return self._lock
+
+    def _mark_dirty(self, category: str, neuron_id: str):
+        # Callers hold the category lock, so the node read here is stable
+        key = (category, neuron_id)
+        with self._bookkeeping_lock:
+            self._dirty.add(key)
+            self._pending_mutations += 1
+            if self._index is not None:
+                node = self.lattice.get(category, {}).get(neuron_id)
+                if node is None:
+                    self._index.remove(key)
+                else:
+                    self._index.update(key, node)
+
+    @property
+    def index(self) -> LatticeIndex:
+        """
+        Hook and time indexes, built on first use and maintained as nodes change.
+        Queries should read it while holding the bookkeeping lock.
+        """
+        if self._index is None:
+            with self._all_categories_locked(), self._bookkeeping_lock:
+                if self._index is None:
+                    self._index = LatticeIndex.build(self.lattice, self._node_time)
+        return self._index
+
+    @timed("lattice.update", kind="batch")
     def update_lattice_from_batch(self, batch_metadata: Dict[str, Any]):
         """
         Update the resonance lattice based on processed batch metadata.
         """
         for category, entries in batch_metadata.items():
-            if category not in self.lattice:
-                self.lattice[category] = {}
-            for neuron_id, data in entries.items():
-                if neuron_id not in self.lattice[category]:
-                    # New symbolic neuron node
-                    self.lattice[category][neuron_id] = {
-                        "valence": data.get("valence", "neutral"),
-                        "familiarity": data.get("familiarity", 0.0),
-                        "novelty": data.get("novelty", 1.0),
-                        "narrative_hooks": data.get("narrative_hooks", []),
-                        "planetary_metadata": data.get("planetary_metadata", {}),
-                        "last_updated": self._current_time()
-                    }
-                else:
-                    # Update existing node
-                    node = self.lattice[category][neuron_id]
-                    node["familiarity"] = round((node["familiarity"] + data.get("familiarity", 0.5)) / 2, 3)
-                    node["novelty"] = round((node["novelty"] + data.get("novelty", 0.5)) / 2, 3)
-                    node["valence"] = data.get("valence", node["valence"])
-                    node["narrative_hooks"] = list(set(node["narrative_hooks"] + data.get("narrative_hooks", [])))
-                    node["planetary_metadata"] = data.get("planetary_metadata", node["planetary_metadata"])
-                    node["last_updated"] = self._current_time()
-
-        self._save_lattice()
+            with self._category_lock(category):
+                neurons = self._ensure_category(category)
+                for neuron_id, data in entries.items():
+                    if neuron_id not in neurons:
+                        # New symbolic neuron node
+                        neurons[neuron_id] = {
+                            "valence": data.get("valence", "neutral"),
+                            "familiarity": data.get("familiarity", 0.0),
+                            "novelty": data.get("novelty", 1.0),
+                            "narrative_hooks": data.get("narrative_hooks", []),
+                            "planetary_metadata": data.get("planetary_metadata", {}),
+                            **self._timestamp_fields()
+                        }
+                    else:
+                        # Update existing node
+                        node = neurons[neuron_id]
+                        self._settle(node)
+                        node["familiarity"] = round((node["familiarity"] + data.get("familiarity", 0.5)) / 2, 3)
+                        node["novelty"] = round((node["novelty"] + data.get("novelty", 0.5)) / 2, 3)
+                        node["valence"] = data.get("valence", node["valence"])
+                        node["narrative_hooks"] = merge_hooks(node["narrative_hooks"], data.get("narrative_hooks", []))
+                        node["planetary_metadata"] = data.get("planetary_metadata", node["planetary_metadata"])
+                        node.update(self._timestamp_fields())
+                    self._mark_dirty(category, neuron_id)
+
+        self.save()
         print("🌌 Resonance lattice updated.")
 
+    def _ensure_category(self, category: str):
+        if category not in self.lattice:
+            self.lattice[category] = {}
+        return self.lattice[category]
+
+    @timed("lattice.update", kind="inductive")
     def inductive_update(self, data: dict):
         """
         Update the lattice based on inductive reasoning (resonance).
         """
         print("🔮 ResonanceLattice: Performing inductive update...")
+        with self._category_lock("ResonanceProcessed"):
+            self._inductive_step()
+            self._mark_dirty("ResonanceProcessed", "BlueBoxProcessed")
+
+    @timed("lattice.update", kind="deductive")
+    def deductive_update(self, framework_output: dict):
+        """
+        Update the lattice based on deductive reasoning (orthogonal updates).
+        """
+        print("🧭 ResonanceLattice: Performing deductive update...")
+        with self._category_lock("ResonanceProcessed"):
+            self._deductive_step()
+            self._mark_dirty("ResonanceProcessed", "BlueBoxProcessed")
+
+    @timed("lattice.update", kind="fold")
+    def fold_updates(self, meaning_maps: List[dict]):
+        """
+        Inductive then deductive update for each batch, folded in memory under one lock
+        with a single dirty mark (the micro-batch form of calling both per batch).
+        """
+        print(f"🔮 ResonanceLattice: Folding {len(meaning_maps)} inductive/deductive update(s)...")
+        with self._category_lock("ResonanceProcessed"):
+            for _ in meaning_maps:
+                self._inductive_step()
+                self._deductive_step()
+            if meaning_maps:
+                self._mark_dirty("ResonanceProcessed", "BlueBoxProcessed")
+
+    def _inductive_step(self):
         try:
             node = self.lattice["ResonanceProcessed"]["BlueBoxProcessed"]
+            self._settle(node)
             node["familiarity"] += 0.05
             node["novelty"] -= 0.05
-            node["last_updated"] = self._current_time()
+            node.update(self._timestamp_fields())
             self._clamp_values()
         except KeyError:
             print("⚠️ No ResonanceProcessed -> BlueBoxProcessed found. Initializing.")
-            self.lattice["ResonanceProcessed"] = {
-                "BlueBoxProcessed": {
-                    "valence": "neutral",
-                    "familiarity": 0.05,
-                    "novelty": 0.95,
-                    "narrative_hooks": [],
-                    "planetary_metadata": {},
-                    "last_updated": self._current_time()
-                }
+            self._ensure_category("ResonanceProcessed")["BlueBoxProcessed"] = {
+                "valence": "neutral",
+                "familiarity": 0.05,
+                "novelty": 0.95,
+                "narrative_hooks": [],
+                "planetary_metadata": {},
+                **self._timestamp_fields()
             }
 
-    def deductive_update(self, framework_output: dict):
-        """
-        Update the lattice based on deductive reasoning (orthogonal updates).
-        """
-        print("🧭 ResonanceLattice: Performing deductive update...")
+    def _deductive_step(self):
         try:
             node = self.lattice["ResonanceProcessed"]["BlueBoxProcessed"]
+            self._settle(node)
             node["novelty"] += 0.1
-            node["last_updated"] = self._current_time()
+            node.update(self._timestamp_fields())
             self._clamp_values()
         except KeyError:
             print("⚠️ No ResonanceProcessed -> BlueBoxProcessed found. Initializing.")
-            self.lattice["ResonanceProcessed"] = {
-                "BlueBoxProcessed": {
-                    "valence": "neutral",
-                    "familiarity": 0.0,
-                    "novelty": 0.1,
-                    "narrative_hooks": [],
-                    "planetary_metadata": {},
-                    "last_updated": self._current_time()
-                }
+            self._ensure_category("ResonanceProcessed")["BlueBoxProcessed"] = {
+                "valence": "neutral",
+                "familiarity": 0.0,
+                "novelty": 0.1,
+                "narrative_hooks": [],
+                "planetary_metadata": {},
+                **self._timestamp_fields()
             }
 
+    def remove_node(self, category: str, neuron_id: str) -> bool:
+        """
+        Drop a node from the lattice (persisted as a deletion on the next save).
+        """
+        with self._category_lock(category):
+            neurons = self.lattice.get(category)
+            if neurons is None or neuron_id not in neurons:
+                return False
+            del neurons[neuron_id]
+            self._mark_dirty(category, neuron_id)
+            return True
+
+    def replace_hooks(self, category: str, neuron_id: str, hooks: List[str]) -> bool:
+        """
+        Overwrite a node's narrative hooks without touching its update time.
+        """
+        with self._category_lock(category):
+            node = self.lattice.get(category, {}).get(neuron_id)
+            if node is None:
+                return False
+            node["narrative_hooks"] = list(hooks)
+            self._mark_dirty(category, neuron_id)
+            return True
+
+    def apply_delta(self, delta: Dict[str, Dict[str, Dict[str, Any]]]):
+        """
+        Fold a replay delta into the lattice. Per node: `familiarity` / `novelty` are added,
+        `narrative_hooks` are merged as newly seen, `fields` overwrite, and `node` carries a
+        node created during the replay. If an earlier delta already created that node,
+        the later one's values win and hooks are merged.
+        """
+        for category, changes in delta.items():
+            with self._category_lock(category):
+                neurons = self._ensure_category(category)
+                for neuron_id, change in changes.items():
+                    node = neurons.get(neuron_id)
+                    if node is None:
+                        neurons[neuron_id] = dict(change["node"])
+                    elif "node" in change:
+                        hooks = merge_hooks(node.get("narrative_hooks", []), change["node"].get("narrative_hooks", []))
+                        node.update(change["node"])
+                        node["narrative_hooks"] = hooks
+                    else:
+                        self._settle(node)
+                        node["familiarity"] = node.get("familiarity", 0.0) + change.get("familiarity", 0.0)
+                        node["novelty"] = node.get("novelty", 0.0) + change.get("novelty", 0.0)
+                        node["narrative_hooks"] = merge_hooks(node.get("narrative_hooks", []),
+                                                              change.get("narrative_hooks", []))
+                        node.update(change.get("fields", {}))
+                        node["familiarity"] = max(0.0, min(node["familiarity"], 1.0))
+                        node["novelty"] = max(0.0, min(node["novelty"], 1.0))
+                    self._mark_dirty(category, neuron_id)
+
     def _clamp_values(self):
         """
         Keep familiarity and novelty within 0.0–1.0 bounds.
@@ -115,6 +372,96 @@ class RecursiveSymbolicMemoryLattice:
         node["familiarity"] = max(0.0, min(node["familiarity"], 1.0))
         node["novelty"] = max(0.0, min(node["novelty"], 1.0))
 
+    def clamp_all(self):
+        """
+        Keep familiarity and novelty within 0.0–1.0 bounds across every node.
+        """
+        with self._all_categories_locked():
+            if self.backend == "array":
+                self.lattice.clamp("familiarity")
+                self.lattice.clamp("novelty")
+                return
+            for neurons in self.lattice.values():
+                for node in neurons.values():
+                    node["familiarity"] = max(0.0, min(node["familiarity"], 1.0))
+                    node["novelty"] = max(0.0, min(node["novelty"], 1.0))
+
+    def node_count(self) -> int:
+        if self.backend == "array":
+            return self.lattice.node_count()
+        return sum(len(neurons) for neurons in self.lattice.values())
+
+    def count_familiar(self, threshold: float = FAMILIARITY_KNOWN_THRESHOLD) -> int:
+        """
+        Count nodes whose familiarity is at or above `threshold` ("known zones").
+        """
+        if self.decay is not None:
+            return int(np.count_nonzero(self.materialize_all()["familiarity"] >= threshold))
+        if self.backend == "array":
+            return self.lattice.count_at_least("familiarity", threshold)
+        return sum(
+            1 for neurons in self.lattice.values() for node in neurons.values()
+            if node.get("familiarity", 0) >= threshold
+        )
+
+    def familiarity_for(self, category: str, neuron_ids: List[str], default: float = 0.5) -> List[float]:
+        """
+        Look up familiarity for several nodes of one category in a single call.
+        """
+        if self.decay is None and self.backend == "array":
+            return self.lattice.gather("familiarity", [(category, n) for n in neuron_ids], default).tolist()
+        neurons = self.lattice.get(category, {})
+        return [
+            self.effective_values(neurons[n])[0] if "familiarity" in neurons.get(n, {}) else default
+            for n in neuron_ids
+        ]
+
+    def effective_values(self, node, now: Optional[float] = None) -> Tuple[float, float]:
+        """
+        (familiarity, novelty) of a node as of `now` (epoch seconds), after decay.
+        """
+        familiarity, novelty = node.get("familiarity", 0.0), node.get("novelty", 0.0)
+        if self.decay is None:
+            return familiarity, novelty
+        now = time.time() if now is None else now
+        updated = self._node_time(node)
+        # A node with no usable timestamp has no known age, so it is not decayed
+        return self.decay.effective(familiarity, novelty, now - updated if updated > 0 else 0.0)
+
+    def materialize_all(self, now: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Effective familiarity and novelty for every node as arrays, computed in one
+        vectorized pass (for reports such as the daily reflection). Stored values are
+        left untouched.
+        """
+        now = time.time() if now is None else now
+        with self._all_categories_locked():
+            if self.backend == "array":
+                slots = self.lattice.active_slots()
+                familiarity = self.lattice.arrays["familiarity"][slots]
+                novelty = self.lattice.arrays["novelty"][slots]
+                updated = self.lattice.arrays["updated_at"][slots].copy()
+                for position in np.flatnonzero(updated <= 0):
+                    # Nodes written before `updated_at` existed fall back to their text stamp
+                    extras = self.lattice.extras_of(slots[position])
+                    updated[position] = self._parse_time(extras.get("last_updated", ""))
+            else:
+                nodes = [node for neurons in self.lattice.values() for node in neurons.values()]
+                familiarity = np.fromiter((node.get("familiarity", 0.0) for node in nodes), np.float64, len(nodes))
+                novelty = np.fromiter((node.get("novelty", 0.0) for node in nodes), np.float64, len(nodes))
+                updated = np.fromiter((self._node_time(node) for node in nodes), np.float64, len(nodes))
+        if self.decay is not None:
+            familiarity, novelty = self.decay.effective_arrays(familiarity, novelty,
+                                                               np.where(updated > 0, now - updated, 0.0))
+        return {"familiarity": familiarity, "novelty": novelty}
+
+    def _settle(self, node):
+        """
+        Fold elapsed decay into a node's stored values before it is updated.
+        """
+        if self.decay is not None:
+            node["familiarity"], node["novelty"] = self.effective_values(node)
+
     def get_snapshot_json(self) -> Dict[str, Any]:
         """
         Return the current state of the resonance lattice as JSON.
@@ -124,40 +471,61 @@ class RecursiveSymbolicMemoryLattice:
     def fetch_recent_symbols(self, limit: int = 5) -> Dict[str, Any]:
         """
         Lightweight fetch of recent narrative hooks for companion-style summaries.
-        Returns up to `limit` unique hooks to keep prompts concise and human.
+        Returns up to `limit` unique hooks, most recently updated nodes first,
+        to keep prompts concise and human.
         """
-        hooks: List[str] = []
-        for neurons in self.lattice.values():
-            for node in neurons.values():
-                hooks.extend(node.get("narrative_hooks", []))
-
-        # Preserve order while de-duplicating
         unique_hooks: List[str] = []
         seen = set()
-        for hook in hooks:
-            if hook not in seen:
-                unique_hooks.append(hook)
-                seen.add(hook)
-            if len(unique_hooks) >= limit:
-                break
+        index = self.index
+        with self._bookkeeping_lock:
+            for key in index.keys_newest_first():
+                for hook in index.hooks_of(key):
+                    if hook not in seen:
+                        unique_hooks.append(hook)
+                        seen.add(hook)
+                    if len(unique_hooks) >= limit:
+                        return {"narrative_hooks": unique_hooks}
 
         return {"narrative_hooks": unique_hooks}
 
+    def dominant_themes(self) -> List[str]:
+        """
+        Every distinct narrative hook currently attached to a node.
+        """
+        index = self.index
+        with self._bookkeeping_lock:
+            return index.all_hooks()
+
+    def top_hooks(self, k: int = 5) -> List[Tuple[str, int]]:
+        """
+        The `k` hooks attached to the most nodes, with their node counts.
+        """
+        index = self.index
+        with self._bookkeeping_lock:
+            return index.top_hooks(k)
+
+    def recent_theme_counts(self, hours: float = 6, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Count narrative hooks on nodes updated within the last `hours`.
+        """
+        now = now or datetime.now(self.timezone)
+        cutoff = (now - timedelta(hours=hours)).timestamp()
+        theme_count: Dict[str, int] = {}
+        index = self.index
+        with self._bookkeeping_lock:
+            for key in index.keys_since(cutoff):
+                for hook in index.hooks_of(key):
+                    theme_count[hook] = theme_count.get(hook, 0) + 1
+        return theme_count
+
     def get_daily_reflection(self) -> str:
         """
         Generate a humanized journal entry reflecting on the lattice's state.
         """
         summary = "\n=== Daily Reflection: {} ===\n".format(self._current_time())
-        known = unknown = 0
-        emotional_themes: List[str] = []
-
-        for category, neurons in self.lattice.items():
-            for neuron_id, node in neurons.items():
-                if node['familiarity'] >= 0.7:
-                    known += 1
-                else:
-                    unknown += 1
-                emotional_themes.extend(node['narrative_hooks'])
+        known = self.count_familiar(FAMILIARITY_KNOWN_THRESHOLD)
+        unknown = self.node_count() - known
+        emotional_themes = self.dominant_themes()
 
         total = known + unknown if (known + unknown) > 0 else 1
         known_pct = round((known / total) * 100, 1)
@@ -165,25 +533,189 @@ class RecursiveSymbolicMemoryLattice:
 
         summary += f"Known Zones: {known_pct}%\n"
         summary += f"Unknown Zones: {unknown_pct}%\n"
-        summary += f"Emerging Emotional Themes: {list(set(emotional_themes))}\n"
+        summary += f"Emerging Emotional Themes: {emotional_themes}\n"
         summary += "Reflection: The lattice shows strong familiarity in core zones, with novel patterns emerging at the periphery.\n"
         return summary
 
+    @timed("lattice.persist")
     def _save_lattice(self):
-        os.makedirs(os.path.dirname(self.lattice_file), exist_ok=True)
-        with open(self.lattice_file, 'w') as f:
-            json.dump(self.lattice, f, indent=4)
+        dirty = self._take_dirty()
+        if self.wal:
+            self._append_nodes(dirty)
+            if self.wal.needs_compaction():
+                self.compact()
+            self._disk_signature = self._read_disk_signature()
+            return
+        self._write_snapshot()
+        self._disk_signature = self._read_disk_signature()
         print("💾 Resonance lattice saved.")
 
+    def _take_dirty(self) -> Set[Tuple[str, str]]:
+        """
+        Claim the pending change set; changes made after this count toward the next write.
+        """
+        with self._bookkeeping_lock:
+            dirty, self._dirty = self._dirty, set()
+            self._pending_mutations = 0
+            self._last_flush = time.monotonic()
+        return dirty
+
+    def _append_nodes(self, keys: Set[Tuple[str, str]]):
+        records = []
+        for category, neuron_id in sorted(keys):
+            with self._category_lock(category):
+                node = self.lattice.get(category, {}).get(neuron_id)
+                if node is None:
+                    records.append({"op": "del", "category": category, "id": neuron_id})
+                else:
+                    records.append({"op": "put", "category": category, "id": neuron_id, "node": dict(node)})
+        self.wal.append(records)
+        if records:
+            print(f"📝 Resonance lattice logged {len(records)} node change(s).")
+
+    def _write_snapshot(self):
+        # Write to a sibling temp file and swap it in so readers never see a partial lattice
+        os.makedirs(os.path.dirname(self.lattice_file), exist_ok=True)
+        tmp_file = self.lattice_file + ".tmp"
+        with self._all_categories_locked():
+            data = self.to_dict()
+            # The file we are about to replace may still be mapped; detach from it first
+            self._release_snapshot()
+            if self.snapshot_format == "binary":
+                write_binary_snapshot(tmp_file, data)
+            else:
+                with open(tmp_file, 'w') as f:
+                    json.dump(data, f, indent=4)
+        os.replace(tmp_file, self.lattice_file)
+
+    def _release_snapshot(self):
+        if isinstance(self.lattice, LazyCategoryMap):
+            self.lattice.close()
+            self.lattice = self.lattice.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Plain-dict copy of the lattice regardless of backend, for serialization.
+        """
+        if isinstance(self.lattice, dict):
+            return self.lattice
+        return self.lattice.to_dict()
+
+    @_synchronized
+    def compact(self):
+        """
+        Fold the write-ahead log into a fresh snapshot and start a new log segment.
+        """
+        if not self.wal:
+            self._save_lattice()
+            return
+        # Puts are idempotent, so a crash between these steps only replays already-snapshotted nodes
+        self._take_dirty()
+        self._write_snapshot()
+        self.wal.truncate()
+        self._disk_signature = self._read_disk_signature()
+        print("🗜️ Resonance lattice log compacted into snapshot.")
+
     def _current_time(self) -> str:
         return datetime.now(self.timezone).strftime('%Y-%m-%d %H:%M:%S %Z')
 
+    def _timestamp_fields(self) -> Dict[str, Any]:
+        now = datetime.now(self.timezone)
+        return {"last_updated": now.strftime('%Y-%m-%d %H:%M:%S %Z'), "updated_at": round(now.timestamp(), 3)}
+
+    def node_time(self, node) -> float:
+        """
+        Epoch seconds of a node's last update (0.0 when it has no usable timestamp).
+        """
+        return self._node_time(node)
+
+    def _node_time(self, node) -> float:
+        """
+        Epoch seconds of a node's last update; older nodes only carry the text stamp.
+        """
+        updated_at = node.get("updated_at")
+        if updated_at:
+            return float(updated_at)
+        return self._parse_time(node.get("last_updated", ""))
+
+    def _parse_time(self, value: str) -> float:
+        """
+        Parse a `last_updated` stamp into epoch seconds (0.0 if missing or malformed).
+        Stamps are written as local wall time plus a zone abbreviation, which strptime
+        cannot resolve, so the wall time is localized to the lattice timezone instead.
+        """
+        try:
+            parsed = datetime.strptime(value[:19], '%Y-%m-%d %H:%M:%S')
+        except (TypeError, ValueError):
+            try:
+                parsed = datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                return 0.0
+        if parsed.tzinfo is None:
+            parsed = self.timezone.localize(parsed)
+        return parsed.timestamp()
+
+    @_synchronized
     def save(self):
         """
-        Public method to save the current lattice state to disk.
+        Request that the current lattice state be saved to disk.
+        Writes now under the default immediate policy; otherwise the write is deferred
+        until the policy says it is due, or until `flush()`.
+        """
+        if self.durability.is_immediate:
+            self._save_lattice()
+            return
+        self.flush_if_due(time.monotonic())
+
+    @_synchronized
+    def flush(self):
+        """
+        Write every pending change to disk now.
         """
-        self._save_lattice()
+        with self._bookkeeping_lock:
+            pending = bool(self._pending_mutations or self._dirty)
+        if pending:
+            self._save_lattice()
+
+    @_synchronized
+    def flush_if_due(self, now: float):
+        with self._bookkeeping_lock:
+            due = self.durability.is_due(self._pending_mutations, now - self._last_flush)
+        if due:
+            self._save_lattice()
+
+    def set_durability(self, policy: DurabilityPolicy):
+        """
+        Switch durability policy, flushing anything pending under the old one first.
+        A policy with `every_seconds` starts a background flusher; an exit hook makes
+        sure deferred changes are written when the interpreter shuts down.
+        """
+        self._stop_flusher()
+        self.flush()
+        self.durability = policy
+        if policy.every_seconds:
+            self._flusher = LatticeFlusher(self, policy.every_seconds)
+            self._flusher.start()
+        if not policy.is_immediate and not self._close_registered:
+            atexit.register(self.close)
+            self._close_registered = True
+
+    def close(self):
+        """
+        Stop the background flusher, write any pending changes and drop the exit hook,
+        so a closed lattice (e.g. an evicted tenant's) can be freed.
+        """
+        self._stop_flusher()
+        self.flush()
+        if self._close_registered:
+            atexit.unregister(self.close)
+            self._close_registered = False
+
+    def _stop_flusher(self):
+        if self._flusher is not None:
+            self._flusher.stop()
+            self._flusher = None
 
 
 # Backwards compatibility alias for older imports
-ResonanceLattice = RecursiveSymbolicMemoryLattice
\ No newline at end of file
+ResonanceLattice = RecursiveSymbolicMemoryLattice
@@ -0,0 +1,159 @@
+# samurai_bluebird_custos/symbolic/sharded_lattice.py
+
+import copy
+import json
+import os
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, List, Optional
+
+from samurai_bluebird_custos.symbolic.lattice_snapshot import write_binary_snapshot
+from samurai_bluebird_custos.symbolic.recursive_memory_lattice import (
+    FAMILIARITY_KNOWN_THRESHOLD,
+    RecursiveSymbolicMemoryLattice,
+)
+
+
+class LatticeShard:
+    """
+    One top-level lattice category with its own lock, dirty flag and cached serialized form.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lock = threading.RLock()
+        self.dirty = True
+        self.serialized: Optional[str] = None
+
+
+class ShardedResonanceLattice(RecursiveSymbolicMemoryLattice):
+    """
+    Resonance Lattice safe for concurrent writers.
+    Each category (e.g. `ResonanceProcessed`) is a shard with its own lock, so capture
+    processing, Krishna reflection and gatekeeper filtering can work on different
+    categories in parallel. Readers get per-shard consistent copies, and full JSON
+    snapshots only re-serialize shards that changed since the last write.
+
+    Lock order: persistence lock -> shard locks (sorted by name) -> bookkeeping lock.
+    """
+
+    def __init__(self, lattice_file: str, **options: Any):
+        if options.get("backend", "dict") != "dict":
+            raise ValueError("ShardedResonanceLattice requires the dict backend")
+        self._shards: Dict[str, LatticeShard] = {}
+        self._shards_lock = threading.Lock()
+        super().__init__(lattice_file, **options)
+
+    def _shard(self, category: str) -> LatticeShard:
+        shard = self._shards.get(category)
+        if shard is None:
+            with self._shards_lock:
+                shard = self._shards.setdefault(category, LatticeShard(category))
+        return shard
+
+    def _category_lock(self, category: str):
+        return self._shard(category).lock
+
+    @contextmanager
+    def _all_categories_locked(self):
+        with ExitStack() as stack:
+            for category in sorted(self._category_names()):
+                stack.enter_context(self._shard(category).lock)
+            yield
+
+    def _category_names(self) -> List[str]:
+        with self._shards_lock:
+            return list(set(self.lattice) | set(self._shards))
+
+    def _ensure_category(self, category: str):
+        with self._shards_lock:
+            if category not in self.lattice:
+                self.lattice[category] = {}
+            return self.lattice[category]
+
+    def _load_lattice(self):
+        lattice = super()._load_lattice()
+        # A fresh load invalidates every cached shard serialization
+        for shard in list(self._shards.values()):
+            shard.dirty = True
+        return lattice
+
+    def _mark_dirty(self, category: str, neuron_id: str):
+        super()._mark_dirty(category, neuron_id)
+        self._shard(category).dirty = True
+
+    # --- Readers ---
+
+    def shard_snapshot(self, category: str) -> Dict[str, Any]:
+        """
+        Deep copy of one category, taken atomically under its shard lock.
+        """
+        with self._category_lock(category):
+            return copy.deepcopy(self.lattice.get(category, {}))
+
+    def get_snapshot_json(self) -> Dict[str, Any]:
+        """
+        Per-shard consistent copy of the lattice (each category is internally consistent).
+        """
+        return {category: self.shard_snapshot(category) for category in sorted(self._category_names())
+                if category in self.lattice}
+
+    def node_count(self) -> int:
+        total = 0
+        for category in self._category_names():
+            with self._category_lock(category):
+                total += len(self.lattice.get(category, {}))
+        return total
+
+    def count_familiar(self, threshold: float = FAMILIARITY_KNOWN_THRESHOLD) -> int:
+        if self.decay is not None:
+            # materialize_all already holds every shard lock for its pass
+            return super().count_familiar(threshold)
+        total = 0
+        for category in self._category_names():
+            with self._category_lock(category):
+                total += sum(
+                    1 for node in self.lattice.get(category, {}).values()
+                    if node.get("familiarity", 0) >= threshold
+                )
+        return total
+
+    def familiarity_for(self, category: str, neuron_ids: List[str], default: float = 0.5) -> List[float]:
+        with self._category_lock(category):
+            return super().familiarity_for(category, neuron_ids, default)
+
+    # --- Persistence ---
+
+    def _write_snapshot(self):
+        if self.snapshot_format == "binary":
+            data = self.get_snapshot_json()
+            self._release_snapshot()
+            tmp_file = self.lattice_file + ".tmp"
+            write_binary_snapshot(tmp_file, data)
+            os.replace(tmp_file, self.lattice_file)
+            return
+
+        fragments = []
+        rewritten = 0
+        for category in sorted(self._category_names()):
+            shard = self._shard(category)
+            with shard.lock:
+                if category not in self.lattice:
+                    continue
+                if shard.dirty or shard.serialized is None:
+                    shard.serialized = self._serialize_shard(category, self.lattice[category])
+                    shard.dirty = False
+                    rewritten += 1
+                fragments.append(shard.serialized)
+
+        os.makedirs(os.path.dirname(self.lattice_file), exist_ok=True)
+        tmp_file = self.lattice_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            f.write("{\n" + ",\n".join(fragments) + "\n}" if fragments else "{}")
+        os.replace(tmp_file, self.lattice_file)
+        print(f"🧩 Re-serialized {rewritten}/{len(fragments)} lattice shard(s).")
+
+    @staticmethod
+    def _serialize_shard(category: str, nodes: Dict[str, Any]) -> str:
+        # Same text json.dump(indent=4) produces for this key inside the full lattice
+        return json.dumps({category: nodes}, indent=4)[2:-2]
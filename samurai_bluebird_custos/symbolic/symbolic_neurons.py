@@ -1,28 +1,89 @@
 # samurai_bluebird_custos/symbolic/symbolic_neurons.py
 
 import json
-from typing import Dict, Any
+import os
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 import pytz
 
+from samurai_bluebird_custos.symbolic.lattice_wal import LatticeWriteAheadLog, apply_record
+
+# Category used for neurons from the seeded `symbolic_neurons` list layout
+SEEDED_CATEGORY = "Seeded"
+
+
 class SymbolicNeurons:
     """
     Symbolic Neurons – Resonance Genesis v0.2.1
     Manages evolving memory nodes with resonance and orthogonal update awareness.
+
+    Accepts both file layouts: the `{category: {neuron_id: neuron}}` map and the seeded
+    `{"symbolic_neurons": [{"id": ...}, ...]}` list, and writes back the layout it loaded.
+    Neurons are indexed by id, `resonance_trace` keeps only the last `trace_limit` events
+    (totals live in `trace_counts`), and updates are appended to `<neurons_file>.wal`
+    and compacted into the main file every `compact_every` records.
     """
 
-    def __init__(self, neurons_file: str, timezone: str = "America/Detroit"):
+    def __init__(self, neurons_file: str, timezone: str = "America/Detroit",
+                 trace_limit: int = 20, persistence: str = "wal", compact_every: int = 200):
         self.neurons_file = neurons_file
         self.timezone = pytz.timezone(timezone)
+        self.trace_limit = trace_limit
+        self.wal = LatticeWriteAheadLog(neurons_file + ".wal", compact_every) if persistence == "wal" else None
+        self.layout = "categories"
+        self.metadata: Dict[str, Any] = {}
+        self._by_id: Dict[str, Tuple[str, Dict[str, Any]]] = {}
         self.neurons = self._load_neurons()
 
     def _load_neurons(self) -> Dict[str, Any]:
         try:
             with open(self.neurons_file, 'r') as f:
-                return json.load(f)
+                raw = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             print("🔄 Initializing new symbolic neurons.")
-            return {}
+            raw = {}
+
+        if isinstance(raw.get("symbolic_neurons"), list):
+            self.layout = "list"
+            self.metadata = {key: value for key, value in raw.items() if key != "symbolic_neurons"}
+            neurons: Dict[str, Any] = {}
+            for entry in raw["symbolic_neurons"]:
+                entry = dict(entry)
+                neuron_id = entry.pop("id")
+                neurons.setdefault(entry.pop("category", SEEDED_CATEGORY), {})[neuron_id] = entry
+        else:
+            neurons = raw
+
+        if self.wal:
+            for record in self.wal.replay():
+                apply_record(neurons, record)
+
+        for category, entries in neurons.items():
+            for neuron_id, neuron in entries.items():
+                self._bound_trace(neuron)
+                self._by_id[neuron_id] = (category, neuron)
+        return neurons
+
+    def _bound_trace(self, neuron: Dict[str, Any]):
+        trace = neuron.get("resonance_trace", [])
+        if "trace_counts" not in neuron:
+            counts: Dict[str, int] = {}
+            for event in trace:
+                counts[event] = counts.get(event, 0) + 1
+            neuron["trace_counts"] = counts
+        neuron["resonance_trace"] = deque(trace, maxlen=self.trace_limit)
+
+    def _record_trace(self, neuron: Dict[str, Any], event: str):
+        neuron["resonance_trace"].append(event)
+        neuron["trace_counts"][event] = neuron["trace_counts"].get(event, 0) + 1
+
+    def get_neuron(self, neuron_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a neuron by id regardless of category.
+        """
+        entry = self._by_id.get(neuron_id)
+        return entry[1] if entry else None
 
     def update_neurons(self, updated_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -30,6 +91,7 @@ class SymbolicNeurons:
         """
         current_time = self._current_time()
         updates_applied = {}
+        changed = []
 
         for category, entries in updated_data.items():
             if category not in self.neurons:
@@ -38,13 +100,17 @@ class SymbolicNeurons:
             for neuron_id, data in entries.items():
                 if neuron_id not in self.neurons[category]:
                     # Create a new symbolic neuron
-                    self.neurons[category][neuron_id] = {
+                    neuron = {
                         "valence": data.get("valence", "neutral"),
                         "familiarity": data.get("familiarity", 0.0),
                         "novelty": data.get("novelty", 1.0),
                         "last_updated": current_time,
-                        "resonance_trace": ["Created"]
+                        "resonance_trace": deque(maxlen=self.trace_limit),
+                        "trace_counts": {}
                     }
+                    self._record_trace(neuron, "Created")
+                    self.neurons[category][neuron_id] = neuron
+                    self._by_id[neuron_id] = (category, neuron)
                     updates_applied[category][neuron_id] = "Created"
                 else:
                     # Update existing neuron
@@ -54,12 +120,13 @@ class SymbolicNeurons:
 
                     neuron["familiarity"] = round((prev_fam + data.get("familiarity", 0.5)) / 2, 3)
                     neuron["novelty"] = round((prev_nov + data.get("novelty", 0.5)) / 2, 3)
-                    neuron["valence"] = data.get("valence", neuron["valence"])
+                    neuron["valence"] = data.get("valence", neuron.get("valence", "neutral"))
                     neuron["last_updated"] = current_time
-                    neuron.setdefault("resonance_trace", []).append("Updated")
+                    self._record_trace(neuron, "Updated")
                     updates_applied[category][neuron_id] = "Updated"
+                changed.append((category, neuron_id))
 
-        self._save_neurons()
+        self._save_neurons(changed)
         print("🧠 Symbolic neurons updated.")
         return updates_applied
 
@@ -67,13 +134,53 @@ class SymbolicNeurons:
         """
         Return a snapshot of current symbolic neurons.
         """
-        return self.neurons
+        return {
+            category: {neuron_id: self._serializable(neuron) for neuron_id, neuron in entries.items()}
+            for category, entries in self.neurons.items()
+        }
+
+    @staticmethod
+    def _serializable(neuron: Dict[str, Any]) -> Dict[str, Any]:
+        return {**neuron, "resonance_trace": list(neuron.get("resonance_trace", []))}
 
-    def _save_neurons(self):
-        with open(self.neurons_file, 'w') as f:
-            json.dump(self.neurons, f, indent=4)
+    def _save_neurons(self, changed=None):
+        if self.wal and changed is not None:
+            self.wal.append([
+                {"op": "put", "category": category, "id": neuron_id,
+                 "node": self._serializable(self.neurons[category][neuron_id])}
+                for category, neuron_id in changed
+            ])
+            if self.wal.needs_compaction():
+                self.compact()
+            return
+        self._write_file()
         print("💾 Symbolic neurons saved.")
 
+    def compact(self):
+        """
+        Rewrite the neurons file in its original layout and start a fresh log segment.
+        """
+        self._write_file()
+        if self.wal:
+            self.wal.truncate()
+        print("🗜️ Symbolic neurons log compacted.")
+
+    def _write_file(self):
+        snapshot = self.get_neuron_snapshot()
+        if self.layout == "list":
+            payload = dict(self.metadata)
+            payload["symbolic_neurons"] = [
+                {"id": neuron_id, **({} if category == SEEDED_CATEGORY else {"category": category}), **neuron}
+                for category, entries in snapshot.items()
+                for neuron_id, neuron in entries.items()
+            ]
+        else:
+            payload = snapshot
+        tmp_file = self.neurons_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(payload, f, indent=4)
+        os.replace(tmp_file, self.neurons_file)
+
     def _current_time(self) -> str:
         return datetime.now(self.timezone).strftime('%Y-%m-%d %H:%M:%S %Z')
 
@@ -12,3 +12,24 @@ def test_tri_agent_reason_over_batch():
     assert "narrative" in result, "Narrative missing in Tri-Agent output"
     assert "ams_output" in result, "AMS output missing in Tri-Agent result"
     print("✅ Tri-Agent reasoning test passed.")
+
+
+def test_ams_core_process_many_matches_process_batch(tmp_path):
+    from samurai_bluebird_custos.agents.ams_core import AMSCore
+    from samurai_bluebird_custos.symbolic.recursive_memory_lattice import ResonanceLattice
+
+    batches = [{"meaning_map": {"tags": ["focus"]}, "narrative": f"batch {n}"} for n in range(4)]
+    one_by_one = AMSCore(lattice=ResonanceLattice(str(tmp_path / "serial.json")), log_dir=str(tmp_path))
+    outputs = [one_by_one.process_batch(batch) for batch in batches]
+    windowed = AMSCore(lattice=ResonanceLattice(str(tmp_path / "window.json")), log_dir=str(tmp_path))
+    assert windowed.process_many(batches) == outputs
+
+    expected = one_by_one.lattice.lattice["ResonanceProcessed"]["BlueBoxProcessed"]
+    folded = ResonanceLattice(str(tmp_path / "window.json")).lattice["ResonanceProcessed"]["BlueBoxProcessed"]
+    assert (folded["familiarity"], folded["novelty"]) == (expected["familiarity"], expected["novelty"])
+
+    # Both modes log one compact JSON record per line
+    import json
+    records = [json.loads(line) for line in (tmp_path / "input_resonance_log.txt").read_text().splitlines()]
+    assert [record["filtered_output"] for record in records] == outputs + outputs
+    print("✅ AMSCore micro-batch test passed.")
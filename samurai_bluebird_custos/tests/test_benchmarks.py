@@ -0,0 +1,39 @@
+# samurai_bluebird_custos/tests/test_benchmarks.py
+
+import copy
+
+from samurai_bluebird_custos.benchmarks.bench_suite import compare, run_suite, synthetic_lattice
+
+
+def test_bench_suite_smoke_and_baseline_compare(tmp_path, monkeypatch):
+    lattice = synthetic_lattice(100, hooks_per_node=3, categories=4)
+    assert sum(len(nodes) for nodes in lattice.values()) == 100
+    assert all(len(node["narrative_hooks"]) == 3 for nodes in lattice.values() for node in nodes.values())
+
+    # Everything the suite writes belongs in its own scratch dir, not under the caller's cwd
+    monkeypatch.chdir(tmp_path)
+    report = run_suite([200], [2], stream_size=10)
+    assert list(tmp_path.iterdir()) == []
+    assert "lattice.load[n=200,hooks=2]" in report["results"]
+    assert report["results"]["pipeline.staged"]["snapshots_per_second"] > 0
+
+    faster_baseline = copy.deepcopy(report)
+    faster_baseline["results"]["lattice.load[n=200,hooks=2]"]["p50_ms"] /= 10
+    assert compare(report, faster_baseline) == ["lattice.load[n=200,hooks=2]"]
+    print("✅ Benchmark suite smoke test passed.")
+
+
+def test_synthetic_workload_is_seeded_and_drives_pipeline():
+    from samurai_bluebird_custos.mock_mode.workload_generator import SyntheticWorkload, load_tag_vocabulary, run_load
+
+    first, second = SyntheticWorkload(seed=3).snapshots(200), SyntheticWorkload(seed=3).snapshots(200)
+    assert first == second
+    assert first != SyntheticWorkload(seed=4).snapshots(200)
+    vocabulary = set(load_tag_vocabulary())
+    assert {"Courage", "Grounding", "Innovation"} <= vocabulary
+    assert all(set(snapshot["tags"]) <= vocabulary and 0 < snapshot["cpu_usage"] <= 100 for snapshot in first)
+    assert first[1]["timestamp"] == "2025-07-15 09:00:05"
+
+    result = run_load(count=300, seed=3, mode="micro_batch", window=50)
+    assert result["processed"] == 300 and result["lattice_nodes"] > 0
+    print("✅ Synthetic workload test passed.")
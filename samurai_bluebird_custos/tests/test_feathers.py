@@ -12,3 +12,331 @@ def test_activity_tracker_snapshot():
         print("✅ Activity tracker snapshot test passed.")
     except Exception as e:
         print(f"❌ Activity tracker snapshot test failed: {e}")
+
+
+def test_io_imports_are_lazy_and_headless_capture_degrades():
+    """Importing capture and ethics modules loads no capture dependency and no lattice."""
+    import os
+    import subprocess
+    import sys
+
+    from samurai_bluebird_custos.utils.import_report import HEAVY_MODULES
+
+    script = (
+        "import sys\n"
+        "import samurai_bluebird_custos.io.feathers as feathers, samurai_bluebird_custos.io.ocr as ocr\n"
+        "import samurai_bluebird_custos.ethics.krishna\n"
+        "from samurai_bluebird_custos.symbolic import lattice_registry\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+        "print(len(lattice_registry._shared_lattices))\n"
+        "print(feathers.capture_keystroke_bursts(duration=0), feathers.capture_screenshot_text(), "
+        "ocr.extract_text_from_screenshot())\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                            env=dict(os.environ, SAMURAI_HEADLESS="1"))
+    assert result.returncode == 0, result.stderr
+    heavy, lattices, fallbacks = result.stdout.strip().splitlines()
+    assert heavy == "[]"
+    assert lattices == "0"
+    assert fallbacks == "0 [Screenshot OCR unavailable] [OCR unavailable]"
+    print("✅ Lazy capture import test passed.")
+
+
+def test_import_report_parses_importtime_output():
+    from samurai_bluebird_custos.utils.import_report import parse_importtime
+
+    rows = parse_importtime(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   psutil._common\n"
+        "import time:      3400 |       3520 | psutil\n"
+    )
+    assert rows == [{"module": "psutil._common", "self_us": 120, "cumulative_us": 120},
+                    {"module": "psutil", "self_us": 3400, "cumulative_us": 3520}]
+
+
+def test_background_samplers_aggregate_ring_buffered_windows():
+    import itertools
+    import time
+
+    from samurai_bluebird_custos.io.passive_input_manager import PassiveInputManager
+    from samurai_bluebird_custos.io.samplers import RingBuffer, Sampler
+
+    ring = RingBuffer(3)
+    for n in range(5):
+        ring.append(n, timestamp=100.0 + n)
+    assert [value for _, value in ring.window(1.5, now=104.0)] == [3, 4]
+    assert len(ring) == 3 and ring.latest() == (104.0, 4)
+
+    counter = itertools.count(1)
+    sampler = Sampler("test", lambda: next(counter), interval_seconds=0.01, aggregate="sum").start()
+    time.sleep(0.1)
+    sampler.stop()
+    assert sampler.aggregate(60) == sum(value for _, value in sampler.buffer.window(60)) > 1
+
+    manager = PassiveInputManager()
+    started = time.perf_counter()
+    snapshot = manager.capture(window_seconds=5)
+    assert time.perf_counter() - started < 0.2
+    assert snapshot["cpu_usage"] is not None and snapshot["memory_usage"] > 0
+    print("✅ Background sampler test passed.")
+
+
+def test_feather_collector_runs_sources_concurrently_with_timeouts():
+    import time
+
+    from samurai_bluebird_custos.io.feather_collector import FeatherCollector
+
+    def slow(value, seconds):
+        def probe():
+            time.sleep(seconds)
+            return value
+        return probe
+
+    collector = FeatherCollector()
+    collector.register("active_window", slow("Terminal", 0.1), timeout=1.0)
+    collector.register("keystroke_burst", slow(7, 0.1), timeout=1.0)
+    collector.register("system", slow({"cpu_usage": 5.0, "memory_usage": 40.0}, 0.1), timeout=1.0, merge=True)
+    collector.register("screenshot_text", slow("late text", 0.6), timeout=0.2, fallback="[unavailable]")
+
+    started = time.perf_counter()
+    snapshot = collector.collect()
+    elapsed = time.perf_counter() - started
+    # Sequential would be 0.3s of fast probes plus the 0.2s OCR timeout
+    assert elapsed < 0.35
+    assert snapshot["active_window"] == "Terminal" and snapshot["keystroke_burst"] == 7
+    assert snapshot["cpu_usage"] == 5.0 and snapshot["screenshot_text"] == "[unavailable]"
+    assert snapshot["partial"] is True
+    assert snapshot["feather_timings"]["screenshot_text"]["status"] == "timeout"
+    assert snapshot["feather_timings"]["active_window"]["status"] == "ok"
+
+    # The overrunning OCR probe is still running, so it is not started a second time
+    assert collector.collect()["feather_timings"]["screenshot_text"]["status"] == "busy"
+    collector.close()
+    print("✅ Feather collector test passed.")
+
+
+def test_feather_probes_get_their_own_capture_window():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from samurai_bluebird_custos.io.feathers import FEATHER_FALLBACKS, build_feather_collector
+
+    class FakeSamplers:
+        def __init__(self):
+            self.calls = []
+
+        def aggregate(self, window_seconds):
+            self.calls.append(window_seconds)
+            # Without a window title reading, read_window() runs; it fails to exercise the fallback
+            return {"keystroke_burst": window_seconds, "cpu_usage": 1.0, "memory_usage": 2.0}
+
+    def broken_window():
+        raise RuntimeError("no window")
+
+    samplers = FakeSamplers()
+    collector = build_feather_collector(samplers, read_window=broken_window, read_screen=lambda: "text")
+    assert [collector.collect(window)["keystroke_burst"] for window in (1, 2, 3)] == [1, 2, 3]
+    # One aggregate per collect, shared by every probe
+    assert samplers.calls == [1, 2, 3]
+    windows = [1, 2, 3, 4] * 8
+    with ThreadPoolExecutor(8) as pool:
+        snapshots = list(pool.map(collector.collect, windows))
+    collector.close()
+
+    # Overlapping captures get their own window, or the fallback while a probe is busy, never another's
+    for window, snapshot in zip(windows, snapshots):
+        status = snapshot["feather_timings"]["keystroke_burst"]["status"]
+        assert snapshot["keystroke_burst"] == (window if status == "ok" else FEATHER_FALLBACKS["keystroke_burst"])
+    assert {snapshot["active_window"] for snapshot in snapshots} == {FEATHER_FALLBACKS["active_window"]}
+    assert snapshots[0]["screenshot_text"] in ("text", FEATHER_FALLBACKS["screenshot_text"])
+    print("✅ Feather capture window test passed.")
+
+
+def test_ocr_cache_skips_unchanged_frames_and_reuses_cached_text():
+    import numpy as np
+
+    from samurai_bluebird_custos.io.image_analysis import OCRCache
+
+    calls = []
+
+    def fake_ocr(image):
+        calls.append(image)
+        return f"text-{len(calls)}"
+
+    rng = np.random.default_rng(0)
+    editor = rng.integers(0, 255, (120, 160, 3), dtype=np.uint8)
+    browser = rng.integers(0, 255, (120, 160, 3), dtype=np.uint8)
+    noisy_editor = np.clip(editor.astype(int) + rng.integers(-2, 3, editor.shape), 0, 255).astype(np.uint8)
+
+    cache = OCRCache(capacity=4)
+    first = cache.read(editor, fake_ocr)
+    assert cache.read(noisy_editor, fake_ocr) == first  # same screen, sensor noise only
+    assert cache.read(browser, fake_ocr) != first
+    assert cache.read(editor, fake_ocr) == first  # switched back: served from the LRU cache
+    assert len(calls) == 2
+
+    stats = cache.stats()
+    assert (stats["unchanged"], stats["hits"], stats["misses"]) == (1, 1, 2)
+    assert stats["hit_rate"] == 0.5 and stats["saved_seconds"] >= 0
+    print("✅ OCR cache test passed.")
+
+
+def test_tiled_ocr_rereads_only_changed_tiles():
+    import numpy as np
+
+    from samurai_bluebird_custos.io.image_analysis import TiledOCR
+
+    calls = []
+
+    def fake_ocr(tile):
+        calls.append(tile.shape)
+        return f"tile{len(calls)}"
+
+    rng = np.random.default_rng(1)
+    frame = np.full((256, 1024, 3), 255, dtype=np.uint8)
+    frame[:128, :512] = rng.integers(0, 255, (128, 512, 3), dtype=np.uint8)  # editor
+    frame[128:, 512:] = rng.integers(0, 255, (128, 512, 3), dtype=np.uint8)  # chat pane; other tiles blank
+
+    reader = TiledOCR(tile_height=128, tile_width=512, ocr_scale=0.5)
+    assert reader.read(frame, fake_ocr) == "tile1\ntile2"
+    assert calls == [(64, 256), (64, 256)]  # grayscale and downscaled
+
+    edited = frame.copy()
+    edited[128:, 512:] = rng.integers(0, 255, (128, 512, 3), dtype=np.uint8)  # new chat message
+    assert reader.read(edited, fake_ocr) == "tile1\ntile3"
+    assert reader.read(frame, fake_ocr) == "tile1\ntile2"  # chat pane back: cached tile text
+    assert len(calls) == 3
+
+    stats = reader.stats()
+    assert (stats["miss"], stats["hit"], stats["clean"], stats["blank"]) == (3, 1, 6, 2)
+    print("✅ Tiled OCR test passed.")
+
+
+def _fast_ocr(image, timeout):
+    return f"text for {image}"
+
+
+def _slow_ocr(image, timeout):
+    import time
+    time.sleep(1.0)
+    return "too late"
+
+
+def _stuck_ocr(image, timeout):
+    import time
+    if image == "stuck":
+        time.sleep(30)  # a hung Tesseract that ignores its timeout
+    return f"text for {image}"
+
+
+def _budget_ocr(image, timeout):
+    import time
+    if image == "stuck":
+        time.sleep(30)
+    return f"{timeout:.3f}"
+
+
+def test_ocr_service_never_blocks_capture_and_marks_timeouts():
+    import time
+
+    from samurai_bluebird_custos.io.ocr_service import OCRService
+
+    service = OCRService(workers=1, max_queue=4, deadline_seconds=5.0, ocr=_fast_ocr, log_results=False)
+    snapshot = {"timestamp": "2025-07-15 09:00:00"}
+    service.submit("frame-1", snapshot)
+    assert snapshot["ocr_status"] == "pending" and snapshot["screenshot_text"] == "[OCR pending]"
+    deadline = time.monotonic() + 5
+    while snapshot["ocr_status"] == "pending" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert snapshot["screenshot_text"] == "text for frame-1" and snapshot["ocr_status"] == "done"
+    service.close()
+
+    slow = OCRService(workers=1, max_queue=1, deadline_seconds=0.3, ocr=_slow_ocr, log_results=False)
+    late, crowded = {}, {}
+    started = time.perf_counter()
+    slow.submit("frame-2", late)
+    slow.submit("frame-3", crowded)  # the only slot is taken by a running job
+    assert time.perf_counter() - started < 0.25
+    assert crowded["ocr_status"] == "skipped"
+    time.sleep(0.5)
+    assert late["ocr_status"] == "timed_out" and late["screenshot_text"] == "[OCR timed out]"
+    assert slow.outstanding == 0
+    slow.close()
+    print("✅ OCR service test passed.")
+
+
+def test_ocr_service_recycles_stuck_workers_and_logs_outside_the_lock(tmp_path):
+    import time
+
+    from samurai_bluebird_custos.io.ocr_service import OCR_RESULTS_LOG, OCRService
+
+    service = OCRService(workers=1, max_queue=4, deadline_seconds=1.0, ocr=_stuck_ocr, log_dir=str(tmp_path))
+    stuck, queued, fresh = {"timestamp": "t1"}, {"timestamp": "t2"}, {"timestamp": "t3"}
+    service.submit("stuck", stuck)
+    time.sleep(0.5)
+    service.submit("queued", queued)  # waits behind the stuck job on the only worker
+    deadline = time.monotonic() + 3
+    while queued["ocr_status"] == "pending" and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert stuck["ocr_status"] == "timed_out"
+    # The stuck worker was terminated, so the queued frame ran on the rebuilt pool within its deadline
+    assert queued["screenshot_text"] == "text for queued"
+
+    service.submit("fresh", fresh)
+    while fresh["ocr_status"] == "pending" and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert fresh["ocr_status"] == "done"
+    service.close()
+    logged = (tmp_path / OCR_RESULTS_LOG).read_text().splitlines()
+    assert len(logged) == 3 and '"ocr_status": "timed_out"' in logged[0]
+    print("✅ OCR worker recycling test passed.")
+
+
+def test_ocr_jobs_resubmitted_after_a_rebuild_keep_their_original_deadline():
+    import time
+
+    from samurai_bluebird_custos.io.ocr_service import OCRService
+
+    service = OCRService(workers=1, max_queue=4, deadline_seconds=1.0, ocr=_budget_ocr, log_results=False)
+    stuck, alongside, queued = {}, {}, {}
+    service.submit("stuck", stuck)
+    service.submit("alongside", alongside)  # submitted with the stuck job, so out of time with it
+    time.sleep(0.5)
+    service.submit("queued", queued)
+    deadline = time.monotonic() + 3
+    while queued["ocr_status"] == "pending" and time.monotonic() < deadline:
+        time.sleep(0.02)
+    service.close()
+
+    assert stuck["ocr_status"] == alongside["ocr_status"] == "timed_out"
+    # The rebuilt pool got what was left of the queued job's deadline, not a fresh one
+    assert queued["ocr_status"] == "done" and 0 < float(queued["screenshot_text"]) < 0.75
+    print("✅ OCR resubmit budget test passed.")
+
+
+def test_ocr_frame_spends_one_budget_across_tiles(monkeypatch):
+    import time
+
+    import numpy as np
+    import pytest
+
+    from samurai_bluebird_custos.io import capabilities, ocr_service
+    from samurai_bluebird_custos.io.image_analysis import TILED_OCR
+
+    timeouts = []
+
+    class FakeTesseract:
+        @staticmethod
+        def image_to_string(tile, timeout):
+            timeouts.append(timeout)
+            time.sleep(0.15)
+            return "tile"
+
+    monkeypatch.setattr(capabilities, "load_pytesseract", lambda: FakeTesseract)
+    TILED_OCR.clear()
+    frame = np.random.default_rng(3).integers(0, 255, (512, 1024, 3), dtype=np.uint8)  # 8 tiles
+    with pytest.raises(TimeoutError):
+        ocr_service.ocr_frame(frame, 0.4)  # the budget runs out before all 8 tiles are read
+    TILED_OCR.clear()
+    assert len(timeouts) == 3
+    assert timeouts[0] <= 0.4 and timeouts == sorted(timeouts, reverse=True)
+    print("✅ OCR frame budget test passed.")
@@ -11,3 +11,118 @@ def test_kernel_batch_capture():
         print("✅ Kernel batch capture test passed.")
     except Exception as e:
         print(f"❌ Kernel batch capture test failed: {e}")
+
+
+def test_tick_scheduler_overlaps_capture_and_counts_missed():
+    import asyncio
+    import time
+
+    from samurai_bluebird_custos.core.async_kernel import TickScheduler
+
+    captured, processed = [], []
+
+    def capture():
+        time.sleep(0.01)
+        captured.append(len(captured))
+        return captured[-1]
+
+    def process(snapshot):
+        time.sleep(0.08)
+        processed.append(snapshot)
+
+    scheduler = TickScheduler(capture, process, interval_seconds=0.05, max_in_flight=2)
+    stats = asyncio.run(scheduler.run(duration_seconds=0.5))
+
+    assert processed == sorted(processed) == list(range(stats.ticks))
+    assert stats.missed_deadlines >= 1 and stats.overlapped >= 1
+    assert 8 <= stats.ticks + stats.missed_deadlines <= 11
+    assert stats.errors == 0
+    print(f"✅ Tick scheduler test passed: {stats}.")
+
+
+class _StubLattice:
+    def __init__(self):
+        self.closed = False
+
+    def set_durability(self, policy):
+        self.policy = policy
+
+    def close(self):
+        self.closed = True
+
+
+class _StubMainLoop:
+    def __init__(self):
+        self.ams_core = type("StubAMSCore", (), {})()
+        self.ams_core.lattice = _StubLattice()
+
+    def process(self, snapshot):
+        return {"tri_output": {"narrative": f"focus on {snapshot['tags'][0]}"},
+                "updated_state": {"seen": snapshot["tags"]}}
+
+
+def test_daemon_serves_jsonl_over_stdin_and_socket(tmp_path):
+    import io
+    import json
+    import socket
+    import threading
+
+    from samurai_bluebird_custos.core.daemon import SnapshotDaemon
+
+    daemon = SnapshotDaemon(_StubMainLoop())
+    sink = io.StringIO()
+    daemon.serve_stream(io.StringIO('{"tags": ["Focus"]}\n\nnot json\n'), sink)
+    first, second = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert first["ok"] and first["narrative"] == "focus on Focus" and "latency_ms" in first
+    assert not second["ok"]
+    assert daemon.main_loop.ams_core.lattice.closed
+
+    server = daemon.make_unix_server(str(tmp_path / "bluebird.sock"))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(tmp_path / "bluebird.sock"))
+            stream = client.makefile("rw")
+            stream.write('{"tags": ["Trust"]}\n')
+            stream.flush()
+            assert json.loads(stream.readline())["state"] == {"seen": ["Trust"]}
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert daemon.processed == 2
+    print("✅ Daemon JSONL test passed.")
+
+
+def test_daemon_flushes_deferred_writes_on_sigterm(tmp_path):
+    import json
+    import os
+    import signal
+    import subprocess
+    import sys
+
+    from samurai_bluebird_custos.benchmarks.bench_suite import synthetic_snapshots
+    from samurai_bluebird_custos.core.tenancy import TenantPaths
+    from samurai_bluebird_custos.symbolic.recursive_memory_lattice import ResonanceLattice
+
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    daemon = subprocess.Popen(
+        [sys.executable, "-m", "samurai_bluebird_custos.core.kernel", "--tenant", "sigterm", "daemon"],
+        cwd=tmp_path, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        env=dict(os.environ, PYTHONPATH=repo_root, SAMURAI_HEADLESS="1"),
+    )
+    try:
+        daemon.stdin.write(json.dumps(synthetic_snapshots(1)[0]) + "\n")
+        daemon.stdin.flush()
+        assert json.loads(daemon.stdout.readline())["ok"]
+        # KERNEL_DURABILITY defers this write; only the shutdown flush can persist it
+        daemon.send_signal(signal.SIGTERM)
+        _, stderr = daemon.communicate(timeout=30)
+    finally:
+        if daemon.poll() is None:
+            daemon.kill()
+    assert "lattice flushed" in stderr, stderr
+
+    paths = TenantPaths("sigterm", str(tmp_path / "tenants"))
+    lattice = ResonanceLattice(paths.resonance_lattice_file, persistence="wal")
+    assert lattice.node_count() > 0
+    print("✅ Daemon SIGTERM flush test passed.")
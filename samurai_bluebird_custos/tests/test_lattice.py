@@ -0,0 +1,290 @@
+# samurai_bluebird_custos/tests/test_lattice.py
+
+import json
+
+from samurai_bluebird_custos.symbolic.recursive_memory_lattice import ResonanceLattice
+
+
+def _without_timestamps(lattice_dict):
+    return {
+        category: {
+            neuron_id: {k: v for k, v in node.items() if k not in ("last_updated", "updated_at")}
+            for neuron_id, node in nodes.items()
+        }
+        for category, nodes in lattice_dict.items()
+    }
+
+
+def test_wal_lattice_replays_log_tail(tmp_path):
+    lattice_file = tmp_path / "resonance_lattice.json"
+    lattice = ResonanceLattice(str(lattice_file), persistence="wal", compact_every=100)
+    lattice.update_lattice_from_batch({"Focus": {"n1": {"familiarity": 0.4, "narrative_hooks": ["deep work"]}}})
+    lattice.inductive_update({})
+    lattice.save()
+
+    assert not lattice_file.exists(), "WAL mode should not rewrite the snapshot on every save"
+    reloaded = ResonanceLattice(str(lattice_file), persistence="wal")
+    assert reloaded.get_snapshot_json() == lattice.get_snapshot_json()
+
+    lattice.compact()
+    assert json.loads(lattice_file.read_text()) == lattice.get_snapshot_json()
+    assert not (tmp_path / "resonance_lattice.json.wal").exists()
+    print("✅ WAL lattice replay test passed.")
+
+
+def test_array_backend_matches_dict_backend(tmp_path):
+    batch = {
+        "Focus": {
+            "n1": {"familiarity": 0.9, "novelty": 0.1, "narrative_hooks": ["deep work"]},
+            "n2": {"familiarity": 0.2, "novelty": 0.8, "narrative_hooks": ["new tool"]},
+        }
+    }
+    dict_lattice = ResonanceLattice(str(tmp_path / "dict.json"))
+    array_lattice = ResonanceLattice(str(tmp_path / "array.json"), backend="array")
+    for lattice in (dict_lattice, array_lattice):
+        lattice.update_lattice_from_batch(batch)
+        lattice.inductive_update({})
+        lattice.deductive_update({})
+        lattice.save()
+
+    assert _without_timestamps(array_lattice.to_dict()) == _without_timestamps(dict_lattice.to_dict())
+    assert array_lattice.count_familiar() == dict_lattice.count_familiar() == 1
+    assert array_lattice.familiarity_for("Focus", ["n1", "missing"]) == [0.9, 0.5]
+    dict_lattice.lattice["Focus"]["bare"] = {"narrative_hooks": []}
+    assert dict_lattice.familiarity_for("Focus", ["n1", "bare"]) == [0.9, 0.5]
+    reloaded = ResonanceLattice(str(tmp_path / "array.json"), backend="array")
+    assert reloaded.to_dict() == array_lattice.to_dict()
+
+    # Nodes written without some numeric fields must not gain them on the array backend
+    sparse = {"Focus": {
+        "bare": {"narrative_hooks": ["legacy"]},
+        "half": {"familiarity": 0.8, "narrative_hooks": []},
+    }}
+    (tmp_path / "sparse.json").write_text(json.dumps(sparse))
+    sparse_dict = ResonanceLattice(str(tmp_path / "sparse.json"))
+    sparse_array = ResonanceLattice(str(tmp_path / "sparse.json"), backend="array")
+    assert sparse_array.to_dict() == sparse_dict.to_dict() == sparse
+    assert "novelty" not in sparse_array.lattice["Focus"]["half"]
+    assert len(sparse_array.lattice["Focus"]["bare"]) == 1
+    assert sparse_array.familiarity_for("Focus", ["bare", "half"]) == [0.5, 0.8]
+    assert sparse_array.count_familiar() == sparse_dict.count_familiar() == 1
+    sparse_array.lattice["Focus"]["bare"]["novelty"] = 0.3
+    assert sparse_array.to_dict()["Focus"]["bare"] == {"novelty": 0.3, "narrative_hooks": ["legacy"]}
+    print("✅ Array backend parity test passed.")
+
+
+def test_hook_and_time_indexes_track_updates(tmp_path):
+    lattice = ResonanceLattice(str(tmp_path / "resonance_lattice.json"))
+    lattice.update_lattice_from_batch({"Focus": {"old": {"narrative_hooks": ["routine"]}}})
+    # Simulate a node written before numeric `updated_at` stamps existed
+    del lattice.lattice["Focus"]["old"]["updated_at"]
+    lattice.lattice["Focus"]["old"]["last_updated"] = "2020-01-01 09:00:00 EST"
+    lattice.update_lattice_from_batch({"Focus": {"new": {"narrative_hooks": ["launch", "routine"]}}})
+
+    assert lattice.top_hooks(1) == [("routine", 2)]
+    assert lattice.recent_theme_counts(hours=6) == {"launch": 1, "routine": 1}
+    assert lattice.fetch_recent_symbols(limit=2) == {"narrative_hooks": ["launch", "routine"]}
+
+    lattice.update_lattice_from_batch({"Focus": {"old": {"narrative_hooks": ["recovery"]}}})
+    assert lattice.recent_theme_counts(hours=6) == {"launch": 1, "routine": 2, "recovery": 1}
+    print("✅ Lattice index test passed.")
+
+
+def test_shared_lattice_reloads_after_external_write(tmp_path):
+    from samurai_bluebird_custos.symbolic.lattice_registry import get_shared_lattice, clear_shared_lattices
+
+    lattice_file = str(tmp_path / "shared.json")
+    shared = get_shared_lattice(lattice_file)
+    assert get_shared_lattice(lattice_file) is shared
+
+    # Another process (simulated by an independent instance) writes the same file
+    writer = ResonanceLattice(lattice_file)
+    writer.update_lattice_from_batch({"Focus": {"n1": {"narrative_hooks": ["deep work"]}}})
+
+    assert get_shared_lattice(lattice_file).fetch_recent_symbols() == {"narrative_hooks": ["deep work"]}
+    assert shared.refresh_if_changed() is False
+    clear_shared_lattices()
+    print("✅ Shared lattice reload test passed.")
+
+
+def test_deferred_durability_coalesces_writes(tmp_path):
+    from samurai_bluebird_custos.symbolic.lattice_durability import DurabilityPolicy
+
+    lattice_file = tmp_path / "resonance_lattice.json"
+    lattice = ResonanceLattice(str(lattice_file))
+    lattice.set_durability(DurabilityPolicy(every_mutations=3))
+    lattice.inductive_update({})
+    lattice.save()
+    lattice.deductive_update({})
+    lattice.save()
+    assert not lattice_file.exists(), "Writes should wait until three mutations are pending"
+
+    lattice.inductive_update({})
+    lattice.save()
+    assert lattice_file.exists()
+
+    lattice.set_durability(DurabilityPolicy.manual())
+    lattice.deductive_update({})
+    lattice.save()
+    assert ResonanceLattice(str(lattice_file)).to_dict() != lattice.to_dict()
+    lattice.close()
+    assert ResonanceLattice(str(lattice_file)).to_dict() == lattice.to_dict()
+
+    # close() drops the exit hook, so a closed lattice is not kept alive until shutdown
+    import gc
+    import weakref
+    closed = weakref.ref(lattice)
+    del lattice
+    gc.collect()
+    assert closed() is None
+    print("✅ Deferred durability test passed.")
+
+
+def test_binary_snapshot_loads_categories_lazily(tmp_path):
+    from samurai_bluebird_custos.symbolic.lattice_snapshot import LazyCategoryMap, binary_to_json
+
+    lattice_file = tmp_path / "resonance_lattice.sbl"
+    lattice = ResonanceLattice(str(lattice_file))
+    lattice.update_lattice_from_batch({
+        "Focus": {"n1": {"familiarity": 0.8, "narrative_hooks": ["deep work"]}},
+        "Rest": {"n2": {"familiarity": 0.1, "narrative_hooks": ["walk"]}},
+    })
+
+    reloaded = ResonanceLattice(str(lattice_file))
+    assert isinstance(reloaded.lattice, LazyCategoryMap)
+    assert reloaded.lattice["Rest"]["n2"]["familiarity"] == 0.1
+    assert reloaded.lattice.loaded_categories() == ["Rest"]
+    assert reloaded.to_dict() == lattice.to_dict()
+
+    binary_to_json(str(lattice_file), str(tmp_path / "converted.json"))
+    assert ResonanceLattice(str(tmp_path / "converted.json")).to_dict() == lattice.to_dict()
+    reloaded.inductive_update({})
+    reloaded.save()
+    assert ResonanceLattice(str(lattice_file)).to_dict() == reloaded.to_dict()
+    print("✅ Binary snapshot test passed.")
+
+
+def test_sharded_lattice_parallel_writers(tmp_path, capsys):
+    import threading
+    from samurai_bluebird_custos.symbolic.sharded_lattice import ShardedResonanceLattice
+
+    lattice_file = tmp_path / "resonance_lattice.json"
+    lattice = ShardedResonanceLattice(str(lattice_file))
+
+    def writer(category):
+        for i in range(50):
+            lattice.update_lattice_from_batch({category: {f"n{i % 10}": {"narrative_hooks": [category]}}})
+
+    threads = [threading.Thread(target=writer, args=(f"Category{c}",)) for c in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert lattice.node_count() == 40
+    assert json.loads(lattice_file.read_text()) == lattice.get_snapshot_json()
+
+    capsys.readouterr()
+    lattice.update_lattice_from_batch({"Category0": {"n0": {"narrative_hooks": ["again"]}}})
+    assert "Re-serialized 1/4 lattice shard(s)" in capsys.readouterr().out
+    assert json.loads(lattice_file.read_text()) == lattice.get_snapshot_json()
+    print("✅ Sharded lattice test passed.")
+
+
+def test_decay_is_lazy_and_vectorized(tmp_path):
+    import time
+    from samurai_bluebird_custos.symbolic.lattice_decay import DecayModel
+
+    decay = DecayModel(familiarity_half_life_hours=1, novelty_half_life_hours=1)
+    for backend in ("dict", "array"):
+        lattice = ResonanceLattice(str(tmp_path / f"{backend}.json"), backend=backend, decay=decay)
+        lattice.update_lattice_from_batch({"Focus": {"n1": {"familiarity": 0.8, "novelty": 0.2}}})
+        node = lattice.lattice["Focus"]["n1"]
+        node["updated_at"] = time.time() - 3600  # last touched an hour ago
+
+        assert node["familiarity"] == 0.8, "Reads must not rewrite stored values"
+        assert lattice.effective_values(node) == (0.4, 0.6)
+        materialized = lattice.materialize_all()
+        assert [round(v, 3) for v in materialized["familiarity"]] == [0.4]
+        assert lattice.count_familiar(0.7) == 0
+
+        lattice.update_lattice_from_batch({"Focus": {"n1": {"familiarity": 0.8, "novelty": 0.2}}})
+        assert lattice.lattice["Focus"]["n1"]["familiarity"] == 0.6
+
+        # Rounded alike on both paths, and a node with no timestamp is not decayed
+        lattice.update_lattice_from_batch({"Focus": {"n2": {"familiarity": 0.7, "novelty": 0.3}}})
+        lattice.lattice["Focus"]["n2"]["updated_at"] = 0
+        lattice.lattice["Focus"]["n2"]["last_updated"] = ""
+        node["updated_at"] = time.time() - 1234
+        materialized = lattice.materialize_all()
+        assert list(materialized["familiarity"]) == [lattice.effective_values(node)[0], 0.7]
+        assert lattice.effective_values(lattice.lattice["Focus"]["n2"]) == (0.7, 0.3)
+    print("✅ Lazy decay test passed.")
+
+
+def test_compaction_reclaims_in_slices(tmp_path):
+    import time
+
+    from samurai_bluebird_custos.symbolic.lattice_compaction import CompactionPolicy, LatticeCompactor
+
+    lattice_file = str(tmp_path / "resonance_lattice.json")
+    lattice = ResonanceLattice(lattice_file, persistence="wal")
+    lattice.update_lattice_from_batch({"Focus": {"a": {"narrative_hooks": ["h2", "Launch Plan", "launch plan!", "h3"]}}})
+    for neuron_id in ("b", "c"):
+        time.sleep(0.01)
+        lattice.update_lattice_from_batch({"Focus": {neuron_id: {"narrative_hooks": ["h1"]}}})
+    time.sleep(0.01)
+    lattice.update_lattice_from_batch({"Focus": {"a": {"narrative_hooks": ["h1"]}}})
+    assert lattice.lattice["Focus"]["a"]["narrative_hooks"] == ["h2", "Launch Plan", "launch plan!", "h3", "h1"]
+
+    policy = CompactionPolicy(max_hooks_per_node=4, hook_similarity=0.9, max_nodes=2, slice_size=1)
+    compactor = LatticeCompactor(lattice, policy)
+    assert compactor.run_slice() is None and compactor.in_progress
+    report = compactor.run_pass()
+    assert report.slices == 4
+    assert (report.hooks_merged, report.hooks_trimmed, report.nodes_over_budget) == (1, 1, 1)
+    assert report.bytes_reclaimed > 0
+
+    reloaded = ResonanceLattice(lattice_file, persistence="wal")
+    assert sorted(reloaded.lattice["Focus"]) == ["a", "c"]
+    assert reloaded.lattice["Focus"]["a"]["narrative_hooks"] == ["launch plan!", "h3", "h1"]
+    assert reloaded.top_hooks(1) == [("h1", 2)]
+
+    expired = LatticeCompactor(reloaded, CompactionPolicy(node_ttl_seconds=60)).run_pass(now=time.time() + 3600)
+    assert expired.nodes_expired == 2 and reloaded.node_count() == 0
+    print("✅ Lattice compaction test passed.")
+
+
+def test_compaction_slice_stays_within_budget(tmp_path):
+    import random
+    import time
+
+    from samurai_bluebird_custos.core.kernel import KERNEL_COMPACTION
+    from samurai_bluebird_custos.symbolic.lattice_compaction import LatticeCompactor
+
+    # Anagrams of one string pass both cheap prefilters, so every pair needs the full ratio
+    rng = random.Random(7)
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789"
+    hooks = ["".join(rng.sample(alphabet, len(alphabet))) for _ in range(500)]
+    lattice_file = tmp_path / "resonance_lattice.json"
+    lattice_file.write_text(json.dumps({
+        "Focus": {
+            **{"wide": {"narrative_hooks": hooks}},
+            **{f"n{i}": {"narrative_hooks": hooks[:60]} for i in range(20)},
+        }
+    }))
+    lattice = ResonanceLattice(str(lattice_file))
+    compactor = LatticeCompactor(lattice, KERNEL_COMPACTION)
+
+    report = None
+    longest = 0.0
+    while report is None:
+        started = time.perf_counter()
+        report = compactor.run_slice()
+        longest = max(longest, time.perf_counter() - started)
+
+    assert report.slices > 2, "the time budget should split the sweep across slices"
+    assert longest < KERNEL_COMPACTION.slice_seconds + 0.25, f"slice took {longest:.3f}s"
+    assert report.hooks_trimmed == 450 + 20 * 10 and report.hooks_merged == 0
+    assert lattice.lattice["Focus"]["wide"]["narrative_hooks"] == hooks[-KERNEL_COMPACTION.max_hooks_per_node:]
+    print("✅ Lattice compaction budget test passed.")
@@ -0,0 +1,43 @@
+# samurai_bluebird_custos/tests/test_metrics.py
+
+import urllib.request
+
+import pytest
+
+from samurai_bluebird_custos.utils.metrics import LatencyHistogram, MetricsRegistry
+
+
+def test_histogram_percentiles_and_prometheus_export(tmp_path):
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+    assert histogram.percentile(0.5) == pytest.approx(0.5, rel=0.02)
+    assert histogram.percentile(0.99) == pytest.approx(0.99, rel=0.02)
+    below_50ms, below_2s = histogram.cumulative([0.05, 2.0])
+    assert 49 <= below_50ms <= 50 and below_2s == 1000
+
+    metrics = MetricsRegistry(prefix="test")
+    with metrics.span("tri_agent.lens", lens="logic"):
+        pass
+    with pytest.raises(ValueError):
+        with metrics.span("bluebox.framework", framework="chakra"):
+            raise ValueError("boom")
+    metrics.inc("kernel_snapshots_total", 3)
+
+    text = metrics.render_prometheus()
+    assert "test_kernel_snapshots_total 3" in text
+    assert 'test_span_errors_total{framework="chakra",span="bluebox.framework"} 1' in text
+    assert 'test_span_seconds_count{lens="logic",span="tri_agent.lens"} 1' in text
+    assert 'test_span_seconds_bucket{lens="logic",span="tri_agent.lens",le="+Inf"} 1' in text
+
+    metrics.write_file(str(tmp_path / "metrics.prom"))
+    assert (tmp_path / "metrics.prom").read_text() == text
+
+    server = metrics.serve(port=0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+            assert response.read().decode("utf-8") == metrics.render_prometheus()
+    finally:
+        server.shutdown()
+        server.server_close()
+    print("✅ Metrics export test passed.")
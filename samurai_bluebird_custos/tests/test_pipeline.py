@@ -0,0 +1,134 @@
+# samurai_bluebird_custos/tests/test_pipeline.py
+
+import time
+
+from samurai_bluebird_custos.core.main_loop import merge_snapshots
+from samurai_bluebird_custos.core.pipeline import Pipeline, Stage, StageQueue, StageStats
+
+
+def test_pipeline_overlaps_stages_in_order():
+    def slow(tag):
+        def step(item):
+            time.sleep(0.05)
+            return item + [tag]
+        return step
+
+    results = []
+    pipeline = Pipeline([Stage("a", slow("a")), Stage("b", slow("b")), Stage("c", slow("c"))],
+                        on_result=results.append)
+    started = time.perf_counter()
+    stats = pipeline.run([[n] for n in range(6)])
+    elapsed = time.perf_counter() - started
+
+    assert results == [[n, "a", "b", "c"] for n in range(6)]
+    assert stats["c"]["processed"] == 6
+    # Sequential would take 6 * 3 * 0.05 = 0.9s; pipelined is about (6 + 2) * 0.05
+    assert elapsed < 0.75
+    print("✅ Pipeline overlap test passed.")
+
+
+def test_multi_worker_stages_keep_submission_order():
+    import random
+
+    rng = random.Random(7)
+    delays = [rng.uniform(0.0, 0.02) for _ in range(40)]
+
+    def jittery(item):
+        time.sleep(delays[item])
+        return item
+
+    seen, results = [], []
+
+    def stateful(item):
+        seen.append(item)
+        return None if item % 5 == 0 else item  # dropped items must not stall later ones
+
+    pipeline = Pipeline([Stage("reason", jittery, workers=4), Stage("frameworks", jittery, workers=3),
+                         Stage("ams", stateful), Stage("log", jittery, workers=2)],
+                        on_result=results.append)
+    stats = pipeline.run(range(40))
+
+    assert seen == list(range(40))
+    assert results == [n for n in range(40) if n % 5]
+    assert stats["log"]["processed"] == 32
+    print("✅ Multi-worker ordering test passed.")
+
+
+def test_stage_queue_backpressure_policies():
+    stats = StageStats()
+    dropping = StageQueue(2, "drop_oldest", stats)
+    for n in range(4):
+        dropping.put(n)
+    assert [dropping.get(), dropping.get()] == [2, 3] and stats.dropped == 2
+
+    merging = StageQueue(1, "merge", stats, merge=merge_snapshots)
+    merging.put({"keystroke_burst": 3, "cpu_usage": 10})
+    merging.put({"keystroke_burst": 4, "cpu_usage": 20})
+    assert merging.get() == {"keystroke_burst": 7, "cpu_usage": 20, "merged_snapshots": 2}
+    assert stats.merged == 1
+    print("✅ Stage queue backpressure test passed.")
+
+
+def test_replay_merges_day_deltas_deterministically(tmp_path):
+    import json
+    import os
+
+    from samurai_bluebird_custos.core.replay import batch_to_snapshot, replay
+    from samurai_bluebird_custos.symbolic.recursive_memory_lattice import ResonanceLattice
+
+    batch_dir = tmp_path / "batches"
+    for day, sessions in (("2025-07-14", 3), ("2025-07-15", 2), ("2025-07-20", 1)):
+        os.makedirs(batch_dir / day)
+        for n in range(sessions):
+            with open(batch_dir / day / f"session_1{n}-00.json", "w") as f:
+                json.dump({"timestamp": f"{day}T1{n}:00:00", "feathers_capture": {"active_window": "Terminal"},
+                           "symbolic_tags": {"sovereignties": ["Connection"]}}, f)
+
+    results = []
+    for workers in (1, 2):
+        lattice = ResonanceLattice(str(tmp_path / f"lattice_{workers}.json"))
+        summary = replay("2025-07-14", "2025-07-15", str(batch_dir), workers=workers, lattice=lattice,
+                         log_dir=str(tmp_path / "logs"))
+        assert (summary["days"], summary["batches"]) == (2, 5)
+        results.append(lattice.lattice["ResonanceProcessed"]["BlueBoxProcessed"])
+
+    serial, parallel = results
+    assert (serial["familiarity"], serial["novelty"]) == (parallel["familiarity"], parallel["novelty"])
+    assert (tmp_path / "logs" / "input_resonance_log.txt").exists()
+
+    # staging_area.save_batch writes the capture itself, with no feathers_capture wrapper
+    flat = {"timestamp": "2025-07-14 18:58:00", "active_window": "Terminal", "keystroke_burst": 42,
+            "screenshot_text": "build passed", "cpu_usage": 31.5, "memory_usage": 62.0, "tags": ["Focus"]}
+    snapshot = batch_to_snapshot(flat)
+    assert {key: snapshot[key] for key in flat} == flat
+    print("✅ Replay determinism test passed.")
+
+
+def test_tenant_pool_namespaces_paths_with_worker_affinity(tmp_path):
+    import os
+
+    import pytest
+
+    from samurai_bluebird_custos.core.tenancy import TenantPaths, TenantPool, tenant_worker
+    from samurai_bluebird_custos.symbolic.recursive_memory_lattice import ResonanceLattice
+
+    with pytest.raises(ValueError):
+        TenantPaths("../escape", str(tmp_path))
+
+    snapshot = {"active_window": "Terminal", "keystroke_burst": 12, "cpu_usage": 20.0, "memory_usage": 40.0,
+                "tags": ["Focus"], "timestamp": "2025-07-14 10:00:00"}
+    streams = {tenant: [dict(snapshot, keystroke_burst=n) for n in range(5)] for tenant in ("alice", "bob", "carol")}
+    with TenantPool(workers=2, root=str(tmp_path), max_resident=1) as pool:
+        totals = pool.process_streams(streams, chunk_size=2)
+
+    for tenant in streams:
+        paths = TenantPaths(tenant, str(tmp_path))
+        assert totals[tenant]["processed"] == 5 and not totals[tenant]["errors"]
+        # Every chunk of a tenant ran in the same worker process
+        assert len(totals[tenant]["workers"]) == 1
+        lattice = ResonanceLattice(paths.resonance_lattice_file, persistence="wal")
+        assert lattice.node_count(), f"{tenant} lattice was not flushed"
+        with open(os.path.join(paths.logs_dir, "dashboard_log.txt")) as f:
+            assert len(f.readlines()) == 5
+    assert tenant_worker("alice", 2) == tenant_worker("alice", 2)
+    print("✅ Tenant pool test passed.")
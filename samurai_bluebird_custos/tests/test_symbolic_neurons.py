@@ -0,0 +1,32 @@
+# samurai_bluebird_custos/tests/test_symbolic_neurons.py
+
+import json
+import shutil
+from pathlib import Path
+
+from samurai_bluebird_custos.symbolic.symbolic_neurons import SymbolicNeurons
+
+SEED_FILE = Path(__file__).resolve().parents[2] / "memory" / "symbolic_neurons_v001.json"
+
+
+def test_symbolic_neurons_bounded_trace_and_list_layout(tmp_path):
+    neurons_file = tmp_path / "symbolic_neurons.json"
+    shutil.copy(SEED_FILE, neurons_file)
+
+    sn = SymbolicNeurons(str(neurons_file), trace_limit=3, compact_every=1000)
+    assert sn.get_neuron("neuron_001")["chakra"] == "Heart"
+
+    for _ in range(10):
+        sn.update_neurons({"Seeded": {"neuron_001": {"familiarity": 0.9}}})
+    neuron = sn.get_neuron("neuron_001")
+    assert list(neuron["resonance_trace"]) == ["Updated"] * 3
+    assert neuron["trace_counts"] == {"Updated": 10}
+
+    reloaded = SymbolicNeurons(str(neurons_file), trace_limit=3)
+    assert reloaded.get_neuron_snapshot() == sn.get_neuron_snapshot()
+
+    sn.compact()
+    saved = json.loads(neurons_file.read_text())
+    assert saved["version"] == "v001"
+    assert [entry["id"] for entry in saved["symbolic_neurons"]][:1] == ["neuron_001"]
+    print("✅ Symbolic neurons store test passed.")
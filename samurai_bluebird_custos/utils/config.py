@@ -7,3 +7,5 @@ BATCHES_DIR = "batches/"
 MEMORY_DIR = "memory/"
 TESSERACT_PATH = r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
 HEARTBEAT_INTERVAL = 300  # seconds
+METRICS_FILE = "logs/metrics.prom"  # Prometheus text export written by the kernel
+TENANTS_DIR = "tenants/"  # per-tenant memory/, batches/ and logs/ folders
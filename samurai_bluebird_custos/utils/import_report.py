@@ -0,0 +1,100 @@
+# samurai_bluebird_custos/utils/import_report.py
+
+"""
+Import-time report: what a fresh interpreter spends importing each entry module.
+
+    samurai-bluebird imports
+    python -m samurai_bluebird_custos.utils.import_report samurai_bluebird_custos.io.feathers
+
+Each module is imported in its own `python -X importtime` subprocess, so results are
+cold-start numbers and are not skewed by modules this process already loaded.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# What a processing-only node imports to start, plus the capture-side modules
+DEFAULT_MODULES = [
+    "samurai_bluebird_custos.core.kernel",
+    "samurai_bluebird_custos.core.daemon",
+    "samurai_bluebird_custos.ethics.krishna",
+    "samurai_bluebird_custos.io.feathers",
+    "samurai_bluebird_custos.io.ocr",
+]
+
+# Importing these means a capture dependency leaked into startup
+HEAVY_MODULES = ("cv2", "pytesseract", "pynput", "PIL", "win32gui")
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    Rows of `-X importtime` output as {"module", "self_us", "cumulative_us"}.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append({"module": name.strip(), "self_us": int(self_us), "cumulative_us": int(cumulative_us)})
+        except ValueError:
+            continue
+    return rows
+
+
+def measure_import(module: str, top: int = 10) -> Dict[str, Any]:
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True)
+    wall_seconds = time.perf_counter() - started
+    rows = parse_importtime(result.stderr)
+    loaded = {row["module"] for row in rows}
+    own = next((row for row in rows if row["module"] == module), None)
+    return {
+        "module": module,
+        "ok": result.returncode == 0,
+        "error": result.stderr.strip().splitlines()[-1] if result.returncode and result.stderr.strip() else None,
+        "import_ms": round(own["cumulative_us"] / 1000, 2) if own else None,
+        "wall_ms": round(wall_seconds * 1000, 2),
+        "heavy_loaded": sorted(name for name in HEAVY_MODULES if name in loaded),
+        "slowest": [{"module": row["module"], "cumulative_ms": round(row["cumulative_us"] / 1000, 2)}
+                    for row in sorted(rows, key=lambda row: row["cumulative_us"], reverse=True)[:top]],
+    }
+
+
+def import_report(modules: Optional[List[str]] = None, top: int = 10) -> List[Dict[str, Any]]:
+    return [measure_import(module, top) for module in modules or DEFAULT_MODULES]
+
+
+def print_report(report: List[Dict[str, Any]]):
+    for entry in report:
+        if not entry["ok"]:
+            print(f"❌ {entry['module']}: {entry['error']}")
+            continue
+        heavy = ", ".join(entry["heavy_loaded"]) or "none"
+        print(f"⏱️ {entry['module']}: {entry['import_ms']} ms import, {entry['wall_ms']} ms interpreter "
+              f"start-to-exit, heavy deps loaded: {heavy}")
+        for row in entry["slowest"]:
+            print(f"    {row['cumulative_ms']:>9.2f} ms  {row['module']}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Samurai Bluebird import-time report")
+    parser.add_argument("modules", nargs="*", help="modules to time (default: kernel, daemon, krishna, io)")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list per module")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    report = import_report(args.modules, args.top)
+    if args.json:
+        print(json.dumps(report, indent=4))
+    else:
+        print_report(report)
+    return 0 if all(entry["ok"] for entry in report) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
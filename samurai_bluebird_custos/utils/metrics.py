@@ -0,0 +1,248 @@
+# samurai_bluebird_custos/utils/metrics.py
+
+"""
+Lightweight in-process metrics: timing spans, counters and HDR-style latency histograms,
+exported as Prometheus text to a local file or a small HTTP endpoint.
+
+    with span("tri_agent.lens", lens="logic"):
+        ...
+    METRICS.write_file("logs/metrics.prom")
+"""
+
+import functools
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Upper bounds (seconds) exported as Prometheus `le` buckets: 1-2-5 steps from 10µs to 100s
+EXPORT_BOUNDS = [scale * 10.0 ** exponent for exponent in range(-5, 2) for scale in (1, 2, 5)] + [100.0]
+EXPORT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of durations in seconds.
+    Values are bucketed by power of two and then linearly within each power, so every
+    recorded value is kept to about `1 / sub_buckets` relative precision from
+    `lowest` up to any magnitude, at a fixed small memory cost.
+    """
+
+    def __init__(self, lowest: float = 1e-6, sub_buckets: int = 64):
+        self.lowest = lowest
+        self.sub_buckets = sub_buckets
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def _index(self, value: float) -> int:
+        scaled = max(value / self.lowest, 1.0)
+        exponent = int(math.floor(math.log2(scaled)))
+        fraction = scaled / (2.0 ** exponent) - 1.0
+        return exponent * self.sub_buckets + min(int(fraction * self.sub_buckets), self.sub_buckets - 1)
+
+    def _upper_bound(self, index: int) -> float:
+        exponent, sub = divmod(index, self.sub_buckets)
+        return self.lowest * (2.0 ** exponent) * (1.0 + (sub + 1) / self.sub_buckets)
+
+    def record(self, value: float):
+        index = self._index(value)
+        with self._lock:
+            self.counts[index] = self.counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+
+    def percentile(self, quantile: float) -> float:
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = max(math.ceil(quantile * self.count), 1)
+            seen = 0
+            for index in sorted(self.counts):
+                seen += self.counts[index]
+                if seen >= target:
+                    return min(self._upper_bound(index), self.max)
+            return self.max
+
+    def cumulative(self, bounds: List[float]) -> List[int]:
+        """
+        Count of values at or below each bound, at bucket resolution: a value within one
+        sub-bucket below a bound may be counted under the next bound.
+        """
+        with self._lock:
+            items = sorted((self._upper_bound(index), count) for index, count in self.counts.items())
+        result, seen, position = [], 0, 0
+        for bound in bounds:
+            while position < len(items) and items[position][0] <= bound:
+                seen += items[position][1]
+                position += 1
+            result.append(seen)
+        return result
+
+
+class MetricsRegistry:
+    """
+    Named counters and latency histograms, each keyed by a label set.
+    """
+
+    def __init__(self, prefix: str = "samurai"):
+        self.prefix = prefix
+        self.enabled = True
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(labels: Dict[str, str]) -> LabelKey:
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    def inc(self, name: str, amount: float = 1, **labels: str):
+        if not self.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, **labels: str):
+        if not self.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            histogram = self._histograms.setdefault(name, {}).get(key)
+            if histogram is None:
+                histogram = self._histograms[name][key] = LatencyHistogram()
+        histogram.record(seconds)
+
+    @contextmanager
+    def span(self, name: str, **labels: str) -> Iterator[None]:
+        """
+        Time a block into the `span_seconds` histogram and count its errors.
+        """
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc("span_errors_total", span=name, **labels)
+            raise
+        finally:
+            self.observe("span_seconds", time.perf_counter() - started, span=name, **labels)
+
+    def histogram(self, name: str, **labels: str) -> Optional[LatencyHistogram]:
+        return self._histograms.get(name, {}).get(self._key(labels))
+
+    def counter(self, name: str, **labels: str) -> float:
+        return self._counters.get(name, {}).get(self._key(labels), 0)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    # --- Export ---
+
+    def render_prometheus(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: dict(series) for name, series in self._histograms.items()}
+
+        for name in sorted(counters):
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# TYPE {metric} counter")
+            for key, value in sorted(counters[name].items()):
+                lines.append(f"{metric}{_labels(key)} {_number(value)}")
+
+        for name in sorted(histograms):
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# TYPE {metric} histogram")
+            for key, histogram in sorted(histograms[name].items()):
+                for bound, seen in zip(EXPORT_BOUNDS, histogram.cumulative(EXPORT_BOUNDS)):
+                    lines.append(f"{metric}_bucket{_labels(key, le=_number(bound))} {seen}")
+                lines.append(f"{metric}_bucket{_labels(key, le='+Inf')} {histogram.count}")
+                lines.append(f"{metric}_sum{_labels(key)} {_number(histogram.total)}")
+                lines.append(f"{metric}_count{_labels(key)} {histogram.count}")
+            lines.append(f"# TYPE {metric}_quantile gauge")
+            for key, histogram in sorted(histograms[name].items()):
+                for quantile in EXPORT_QUANTILES:
+                    lines.append(f"{metric}_quantile{_labels(key, quantile=str(quantile))} "
+                                 f"{_number(histogram.percentile(quantile))}")
+        return "\n".join(lines) + "\n"
+
+    def write_file(self, path: str):
+        """
+        Atomically write the Prometheus text export (node_exporter textfile style).
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve the text export at http://host:port/metrics from a daemon thread.
+        """
+        registry = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), _Handler)
+        threading.Thread(target=server.serve_forever, name="MetricsEndpoint", daemon=True).start()
+        print(f"📈 Metrics endpoint at http://{host}:{server.server_address[1]}/metrics")
+        return server
+
+
+def _labels(key: LabelKey, **extra: str) -> str:
+    pairs = list(key) + sorted(extra.items())
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# Process-wide registry used by the kernel, agents, frameworks and lattice
+METRICS = MetricsRegistry()
+span = METRICS.span
+
+
+def timed(name: str, **labels: str):
+    """
+    Decorator form of `span`.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with METRICS.span(name, **labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator